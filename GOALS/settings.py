@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 
 import os
+import tempfile
 from datetime import timedelta
 from pathlib import Path
 
@@ -59,6 +60,8 @@ REST_FRAMEWORK = {
 
 
 MIDDLEWARE = [
+    "posts.middleware.server_timing_middleware",
+    "posts.middleware.metrics_middleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -67,6 +70,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "posts.middleware.replica_pinning_middleware",
 ]
 
 
@@ -124,11 +128,71 @@ WSGI_APPLICATION = "GOALS.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# Connections are kept open for DB_CONN_MAX_AGE seconds and checked before
+# reuse, so requests do not reconnect every time. Set DB_ENGINE=postgresql
+# (with DB_NAME/DB_USER/DB_PASSWORD/DB_HOST/DB_PORT) for the PostgreSQL
+# profile; DB_PGBOUNCER=1 disables server-side cursors for transaction
+# pooling behind PgBouncer.
+DB_ENGINE = os.environ.get("DB_ENGINE", "sqlite")
+DB_CONN_MAX_AGE = int(os.environ.get("DB_CONN_MAX_AGE", 60))
+
+if DB_ENGINE == "postgresql":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ.get("DB_NAME", "goals"),
+            "USER": os.environ.get("DB_USER", "goals"),
+            "PASSWORD": os.environ.get("DB_PASSWORD", ""),
+            "HOST": os.environ.get("DB_HOST", "127.0.0.1"),
+            "PORT": os.environ.get("DB_PORT", "5432"),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "DISABLE_SERVER_SIDE_CURSORS": os.environ.get("DB_PGBOUNCER") == "1",
+            "OPTIONS": {"connect_timeout": 5},
+        }
     }
+elif DB_ENGINE == "sqlite":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.environ.get("SQLITE_PATH", BASE_DIR / "db.sqlite3"),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {"timeout": 20},
+        }
+    }
+else:
+    raise ImproperlyConfigured("DB_ENGINE must be 'sqlite' or 'postgresql'")
+
+# Read replicas: DB_REPLICAS is a comma-separated list of replica hosts
+# (postgresql profile) or SQLite files (sqlite profile) kept in sync with the
+# primary. Post list/detail reads go to one replica per request; writes and all
+# other reads use "default". A client that wrote is pinned to the primary for
+# DATABASE_REPLICA_PIN_SECONDS so it reads its own writes.
+DATABASE_REPLICAS = []
+for index, replica in enumerate(
+    filter(None, os.environ.get("DB_REPLICAS", "").split(",")), start=1
+):
+    DATABASES[f"replica{index}"] = {
+        **DATABASES["default"],
+        "HOST" if DB_ENGINE == "postgresql" else "NAME": replica.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica{index}")
+
+DATABASE_ROUTERS = ["posts.routers.PrimaryReplicaRouter"]
+
+DATABASE_REPLICA_PIN_SECONDS = int(os.environ.get("DB_REPLICA_PIN_SECONDS", 5))
+
+# PRAGMAs applied to every new SQLite connection (posts.apps connects the
+# connection_created hook). Entries here override the defaults in
+# posts.services.database_services; set a value to None to skip it.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 20000,
+    "mmap_size": 268435456,
+    "temp_store": "MEMORY",
 }
 
 
@@ -202,3 +266,106 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_LIFETIME": timedelta(minutes=5),
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=1),
 }
+
+# Post search backend (dotted path). None picks one for the database vendor:
+# SQLite FTS5 trigram locally, pg_trgm GIN indexes on PostgreSQL.
+POSTS_SEARCH_BACKEND = None
+
+# Post list result cache. Entries hold the post ids of one page and are
+# invalidated by per-sort / per-tag generation counters bumped by the post
+# services. Use "posts.services.cache_services.DjangoCacheBackend" with
+# {"alias": "default", "timeout": 60} to share the cache between workers.
+POSTS_LIST_CACHE = {
+    "BACKEND": "posts.services.cache_services.LRUCacheBackend",
+    "OPTIONS": {"max_size": 1024, "timeout": 60},
+    # Cached total counts older than this (seconds) are recounted in a
+    # background thread while the stale value is served. ?exact=1 forces it.
+    "COUNT_REFRESH_INTERVAL": 30,
+}
+
+# Detail view counts are buffered per worker and flushed as batched
+# F("views") + n updates every FLUSH_INTERVAL seconds or once BATCH_SIZE
+# posts are pending, and on worker shutdown.
+POSTS_VIEW_COUNT = {"FLUSH_INTERVAL": 5, "BATCH_SIZE": 500}
+
+# "Hot" ordering (order_by=hot) sorts on the stored Post.hot_score:
+# ln(POST_WEIGHT + LIKE_WEIGHT * likes + VIEW_WEIGHT * views) plus a term
+# that grows with created_date, so engagement counts half as much for every
+# HALF_LIFE_HOURS a post is older and scores never need decaying over time.
+# Likes and view flushes adjust the score in the same UPDATE; after changing
+# these values run manage.py recompute_hot_scores (also run it periodically
+# from cron to correct counters edited outside the services).
+POSTS_HOT_SCORE = {
+    "HALF_LIFE_HOURS": 24,
+    "POST_WEIGHT": 1.0,
+    "LIKE_WEIGHT": 1.0,
+    "VIEW_WEIGHT": 0.1,
+}
+
+# Tag name -> id lookups are cached per worker so tag filters and post writes
+# skip the TagName query for known tags. Ids are cached only after commit.
+POSTS_TAG_CACHE = {"max_size": 10000, "timeout": 3600}
+
+# Bulk NDJSON ingest (POST /posts/bulk). Rows are validated and written
+# CHUNK_SIZE at a time, each chunk in its own transaction; at most
+# MAX_ERRORS row errors are returned and longer lines than MAX_LINE_SIZE
+# bytes are rejected without being buffered.
+POSTS_BULK_INGEST = {"CHUNK_SIZE": 500, "MAX_ERRORS": 1000, "MAX_LINE_SIZE": 65536}
+
+# Post export (GET /posts/export, manage.py export_posts) reads posts with
+# QuerySet.iterator(chunk_size=CHUNK_SIZE), prefetching tags per chunk.
+POSTS_EXPORT = {"CHUNK_SIZE": 2000}
+
+# Encoded JSON fragments of posts for the list and detail responses, keyed
+# by post id and validated against updated_date. Views and like counts are
+# spliced in at render time, so counter updates never invalidate them.
+POSTS_FRAGMENT_CACHE = {
+    "BACKEND": "posts.services.cache_services.LRUCacheBackend",
+    "OPTIONS": {"max_size": 10000, "timeout": 3600},
+}
+
+# Per-request instrumentation (SERVER_TIMING=1). Responses get a Server-Timing
+# header with the SQL query count/time, the timed() stages of the post views
+# (read, search, filter, paginate, count, versions, fragments, serialize,
+# service, render) and the total; with LOG the same numbers are written as
+# one JSON line to the "posts.middleware" logger. When disabled the
+# middleware drops out of the stack and no query wrapper is installed.
+POSTS_SERVER_TIMING = {"ENABLED": os.environ.get("SERVER_TIMING") == "1", "LOG": True}
+
+# Prometheus metrics (GET /metrics): request latency histograms and status
+# codes per view/method, SQL query counts and cache hit/miss counts. Each
+# worker process writes its own mmap file in DIRECTORY (no cross-process
+# locking) and /metrics sums every file, so all gunicorn workers are
+# reported; gauges from files of workers that have exited are left out.
+# gunicorn.conf.py clears DIRECTORY when the master starts.
+# Off unless METRICS=1, matching DEFAULT_METRICS in metrics_services.
+POSTS_METRICS = {
+    "ENABLED": os.environ.get("METRICS") == "1",
+    "DIRECTORY": os.environ.get(
+        "METRICS_DIR", os.path.join(tempfile.gettempdir(), "goals-metrics")
+    ),
+}
+
+# Performance gate for the API tests (posts.tests.mixins.PerfBaselineMixin).
+# Each test's SQL query count and duration is compared with the checked-in
+# PATH; more than QUERY_TOLERANCE extra queries, or a duration above
+# ms * TIME_RATIO + TIME_SLACK_MS, fails the test. Refresh the file on
+# purpose with manage.py refresh_perf_baseline. PERF_BASELINE_TIME=0 keeps
+# the query check but skips the timing check (e.g. on a loaded CI runner).
+POSTS_PERF_BASELINE = {
+    "PATH": BASE_DIR / "perf_baseline.json",
+    "CHECK_TIME": os.environ.get("PERF_BASELINE_TIME", "1") == "1",
+}
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "posts.middleware": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
+}
@@ -19,10 +19,13 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
+from posts.views import MetricsView
+
 urlpatterns = [
     path("admin", admin.site.urls),
     path("users", include("users.urls")),
     path("posts", include("posts.urls")),
+    path("metrics", MetricsView.as_view()),
 ]
 
 urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
@@ -0,0 +1,20 @@
+import os
+
+
+def on_starting(server):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "GOALS.settings")
+    from posts.services.metrics_services import clear_metrics
+
+    clear_metrics()
+
+
+def post_worker_init(worker):
+    from posts.services.view_services import view_count_buffer
+
+    view_count_buffer.start()
+
+
+def worker_exit(server, worker):
+    from posts.services.view_services import flush_view_counts
+
+    flush_view_counts()
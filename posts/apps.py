@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class PostsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "posts"
+
+    def ready(self):
+        from posts.services.database_services import \
+            configure_sqlite_connection
+        from posts.services.timing_services import install_query_timer
+
+        connection_created.connect(
+            configure_sqlite_connection, dispatch_uid="posts_configure_sqlite"
+        )
+        connection_created.connect(
+            install_query_timer, dispatch_uid="posts_install_query_timer"
+        )
@@ -0,0 +1,517 @@
+import inspect
+import itertools
+import json
+import platform
+import random
+import time
+
+import django
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Max
+from django.utils import timezone
+
+from posts.models import Post, TagName
+from posts.serializers import PostListSerializer
+from posts.services import post_services
+from posts.services.cache_services import get_list_cache
+from posts.services.fragment_services import get_fragment_cache
+from posts.services.seed_services import (DATASET_PRESETS, SEED_WORDS,
+                                          seed_dataset)
+from posts.services.tag_services import tag_id_cache
+from posts.services.timing_services import percentile
+from posts.services.view_services import view_count_buffer
+from users.models import User
+from users.services import user_services
+
+BENCH_MODULES = [post_services, user_services]
+
+PAGE_SIZE = 10
+
+SORTS = [
+    ("created_date", 1),
+    ("created_date", 0),
+    ("views", 1),
+    ("likes", 1),
+    ("hot", 1),
+]
+
+
+def public_functions(module):
+    """
+    Args:
+        module (module) : service 모듈
+
+    Returns:
+        List[Tuple[str, Callable]] : 모듈에 정의된 public 함수들 (이름순, import 한 함수와 _ 로 시작하는 함수는 제외)
+    """
+    return [
+        (name, func)
+        for name, func in inspect.getmembers(module, inspect.isfunction)
+        if func.__module__ == module.__name__ and not name.startswith("_")
+    ]
+
+
+class BenchData:
+    """
+    측정 case 가 인자를 고를 때 쓰는 표본(게시글 id 와 작성자, 사용자, 해시태그)과 random 값.
+    표본은 측정 전에 1번만 읽고, 함수마다 이름으로 만든 seed 를 써서 다른 함수를 빼거나 더해도 인자가 같다.
+    """
+
+    def __init__(self, seed: int, sample_size: int = 1000):
+        self.seed = seed
+        rng = random.Random(seed)
+        post_ids = list(
+            Post.objects.filter(is_active=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        if not post_ids:
+            raise CommandError("측정할 게시글이 없습니다")
+        post_ids = rng.sample(post_ids, min(sample_size, len(post_ids)))
+        writer_ids = dict(
+            Post.objects.filter(id__in=post_ids).values_list("id", "writer_id")
+        )
+        self.post_ids = post_ids
+        self.users = {
+            user.id: user
+            for user in User.objects.filter(id__in=set(writer_ids.values()))
+        }
+        self.writers = {
+            post_id: self.users[writer_ids[post_id]] for post_id in post_ids
+        }
+        self.user_list = sorted(self.users.values(), key=lambda user: user.id)
+        tag_names = list(TagName.objects.order_by("id").values_list("name", flat=True))
+        self.tag_names = rng.sample(tag_names, min(100, len(tag_names)))
+        self.total_posts = Post.objects.count()
+        self.next_user = (User.objects.aggregate(max_id=Max("id"))["max_id"] or 0) + 1
+        self.rng = rng
+
+    def use(self, name: str) -> None:
+        self.rng = random.Random(f"{self.seed}:{name}")
+
+    def post_id(self) -> int:
+        return self.rng.choice(self.post_ids)
+
+    def post_ids_page(self) -> list:
+        return self.rng.sample(self.post_ids, min(PAGE_SIZE, len(self.post_ids)))
+
+    def user(self) -> User:
+        return self.rng.choice(self.user_list)
+
+    def sort(self):
+        return self.rng.choice(SORTS)
+
+    def page(self) -> int:
+        return self.rng.randint(1, max(min(self.total_posts // PAGE_SIZE, 50), 1))
+
+    def word(self) -> str:
+        return self.rng.choice(SEED_WORDS)
+
+    def tags(self) -> str:
+        if not self.tag_names:
+            return ""
+        return ",".join(
+            self.rng.sample(
+                self.tag_names, min(self.rng.randint(1, 2), len(self.tag_names))
+            )
+        )
+
+    def post_data(self) -> dict:
+        tags = self.rng.sample(self.tag_names, min(2, len(self.tag_names)))
+        return {
+            "title": " ".join(self.rng.choice(SEED_WORDS) for _ in range(3)),
+            "content": " ".join(self.rng.choice(SEED_WORDS) for _ in range(20)),
+            "tags": ",".join(f"#{tag}" for tag in tags + [self.word()]),
+        }
+
+    def scratch_post(self, is_active: bool = True):
+        # 삭제/복구 측정용 게시글은 표본을 건드리지 않도록 따로 만든다 (측정 시간에 넣지 않음)
+        writer = self.user()
+        post = Post.objects.create(
+            writer=writer, title="bench", content="bench", is_active=is_active
+        )
+        return writer, post.id
+
+    def new_user_data(self) -> dict:
+        user_id = self.next_user
+        self.next_user += 1
+        return {
+            "username": f"bench{user_id}",
+            "email": f"bench{user_id}@bench.local",
+            "password": "bench-password",
+        }
+
+
+def _first_page(posts):
+    # QuerySet 을 돌려주는 함수는 만들어지는 쿼리까지 재기 위해 첫 페이지 id 를 읽는다
+    return list(posts.values_list("id", flat=True)[:PAGE_SIZE])
+
+
+async def _afirst_page_of(coroutine):
+    posts = await coroutine
+    return [post_id async for post_id in posts.values_list("id", flat=True)[:PAGE_SIZE]]
+
+
+def _first_rows(data: BenchData):
+    posts = post_services.read_posts(*data.sort())
+    return list(posts.values(*PostListSerializer.values_fields)[:PAGE_SIZE])
+
+
+# case 함수는 (표본, 측정할 함수) 를 받아 인자를 고른 뒤(측정 시간에 넣지 않음) 호출 1번을 돌려준다
+def _read_posts(data, func):
+    order_by, reverse = data.sort()
+    return lambda: _first_page(func(order_by, reverse))
+
+
+def _search_posts(data, func):
+    posts, word = post_services.read_posts(*data.sort()), data.word()
+    if inspect.iscoroutinefunction(func):
+        return lambda: _afirst_page_of(func(posts, word))
+    return lambda: _first_page(func(posts, word))
+
+
+def _filtering_posts(data, func):
+    posts, tags = post_services.read_posts(*data.sort()), data.tags()
+    mode = data.rng.choice(["and", "or"])
+    if inspect.iscoroutinefunction(func):
+        return lambda: _afirst_page_of(func(posts, tags, mode))
+    return lambda: _first_page(func(posts, tags, mode))
+
+
+def _pagination_posts(data, func):
+    posts, page = post_services.read_posts(*data.sort()), data.page()
+    return lambda: func(posts, PAGE_SIZE, page)
+
+
+def _project_posts(data, func):
+    rows = _first_rows(data)
+    return lambda: func([dict(row) for row in rows])
+
+
+def _cursor_pagination_posts(data, func):
+    order_by, reverse = data.sort()
+    posts = post_services.read_posts(order_by, reverse)
+    return lambda: func(posts, order_by, reverse, PAGE_SIZE, "")
+
+
+def _by_ids(data, func):
+    post_ids = data.post_ids_page()
+    return lambda: func(post_ids)
+
+
+def _by_id(data, func):
+    post_id = data.post_id()
+    return lambda: func(post_id)
+
+
+def _by_user_and_post(data, func):
+    user, post_id = data.user(), data.post_id()
+    return lambda: func(user, post_id)
+
+
+def _toggle_likes(data, func):
+    user, post_ids = data.user(), data.post_ids_page()[:5]
+    return lambda: func(user, post_ids)
+
+
+def _create_post(data, func):
+    post_data, user = data.post_data(), data.user()
+    return lambda: func(post_data, user)
+
+
+def _edit_post(data, func):
+    post_id, post_data = data.post_id(), data.post_data()
+    return lambda: func(post_data, data.writers[post_id], post_id)
+
+
+def _scratch_post(data, func):
+    writer, post_id = data.scratch_post(is_active=True)
+    return lambda: func(writer, post_id)
+
+
+def _inactive_scratch_post(data, func):
+    writer, post_id = data.scratch_post(is_active=False)
+    return lambda: func(writer, post_id)
+
+
+def _no_arguments(data, func):
+    return func
+
+
+def _sign_up(data, func):
+    user_data = data.new_user_data()
+    return lambda: func(user_data)
+
+
+# {함수 이름 : (종류, 인자 설명, case 함수)}
+# 쓰기 case 는 데이터를 바꾸므로 읽기 case 를 모두 잰 뒤에 잰다
+BENCH_CASES = {
+    "read_posts": ("read", "정렬만 한 QuerySet 의 첫 페이지 id", _read_posts),
+    "search_posts": ("read", "검색어 1개, 첫 페이지 id", _search_posts),
+    "asearch_posts": ("read", "검색어 1개, 첫 페이지 id", _search_posts),
+    "filtering_posts": ("read", "해시태그 1~2개, 첫 페이지 id", _filtering_posts),
+    "afiltering_posts": ("read", "해시태그 1~2개, 첫 페이지 id", _filtering_posts),
+    "pagination_posts": ("read", "OFFSET 페이징", _pagination_posts),
+    "pagination_post_ids": ("read", "OFFSET 페이징 id", _pagination_posts),
+    "apagination_post_ids": ("read", "OFFSET 페이징 id", _pagination_posts),
+    "project_posts": ("read", "목록 row 에 해시태그 붙이기", _project_posts),
+    "aproject_posts": ("read", "목록 row 에 해시태그 붙이기", _project_posts),
+    "read_posts_by_ids": ("read", "게시글 10개", _by_ids),
+    "aread_posts_by_ids": ("read", "게시글 10개", _by_ids),
+    "read_post_versions": ("read", "게시글 10개", _by_ids),
+    "aread_post_versions": ("read", "게시글 10개", _by_ids),
+    "render_posts_by_ids": ("read", "게시글 10개, 조각 캐시", _by_ids),
+    "arender_posts_by_ids": ("read", "게시글 10개, 조각 캐시", _by_ids),
+    "cursor_pagination_posts": ("read", "첫 페이지", _cursor_pagination_posts),
+    "acursor_pagination_posts": ("read", "첫 페이지", _cursor_pagination_posts),
+    "read_detail_post": ("read", "게시글 1개", _by_id),
+    "read_detail_version": ("read", "게시글 1개", _by_id),
+    "aread_detail_version": ("read", "게시글 1개", _by_id),
+    "render_detail_post": ("read", "게시글 1개, 조각 캐시", _by_id),
+    "aread_detail_post": ("read", "게시글 1개, 조각 캐시", _by_id),
+    "count_likes": ("read", "게시글 1개", _by_id),
+    "count_post_view": ("write", "게시글 1개, 조회수 buffer", _by_id),
+    "acount_post_view": ("write", "게시글 1개, 조회수 buffer", _by_id),
+    "create_post": ("write", "해시태그 3개", _create_post),
+    "edit_post": ("write", "제목/내용/해시태그 수정", _edit_post),
+    "soft_delete_post": ("write", "측정용 게시글", _scratch_post),
+    "recover_post": ("write", "비활성화된 측정용 게시글", _inactive_scratch_post),
+    "hard_delete_post": ("write", "측정용 게시글", _scratch_post),
+    "toggle_like": ("write", "게시글 1개", _by_user_and_post),
+    "atoggle_like": ("write", "게시글 1개", _by_user_and_post),
+    "like_post": ("write", "게시글 1개", _by_user_and_post),
+    "toggle_likes": ("write", "게시글 5개", _toggle_likes),
+    "reconcile_like_count": ("write", "전체 게시글", _no_arguments),
+    "recompute_hot_scores": ("write", "전체 게시글", _no_arguments),
+    "sign_up": ("write", "비밀번호 hash 포함", _sign_up),
+}
+
+# 호출 1번이 오래 걸리는 함수는 --iterations 보다 적게 잰다
+MAX_ITERATIONS = {"reconcile_like_count": 5, "recompute_hot_scores": 5, "sign_up": 10}
+
+
+class Command(BaseCommand):
+    """
+    측정용 데이터를 고정된 seed 로 만든 뒤 post_services, user_services 의 모든 public 함수를 반복 실행하여
+    p50/p95/p99 응답시간, 초당 처리량, 호출 1번의 SQL 쿼리 수를 JSON 으로 남긴다 (두 실행의 JSON 을 diff 해 비교).
+    쓰기 함수도 실제로 실행하므로 측정 전용 DB 에서 실행한다.
+    사용 예시)
+        SQLITE_PATH=/tmp/bench.sqlite3 python manage.py migrate
+        SQLITE_PATH=/tmp/bench.sqlite3 python manage.py bench --preset 100k --output bench-100k.json
+        SQLITE_PATH=/tmp/bench.sqlite3 python manage.py bench --preset 100k --reuse --function read_posts
+    """
+
+    help = "고정 seed 데이터로 게시글/사용자 service 함수의 p50/p95/p99, 처리량, 쿼리 수를 측정해 JSON 으로 저장합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--preset", choices=list(DATASET_PRESETS), default="1k")
+        parser.add_argument("--posts", type=int, help="preset 의 게시글 수 대신 사용")
+        parser.add_argument("--users", type=int, help="preset 의 사용자 수 대신 사용")
+        parser.add_argument("--tags", type=int, help="preset 의 해시태그 수 대신 사용")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--iterations", type=int, default=100)
+        parser.add_argument("--warmup", type=int, default=5)
+        parser.add_argument(
+            "--function",
+            action="append",
+            default=[],
+            help="측정할 함수 이름 (여러번 사용 가능, 없으면 전체)",
+        )
+        parser.add_argument(
+            "--cold", action="store_true", help="호출마다 목록/조각/해시태그 캐시를 비움"
+        )
+        parser.add_argument(
+            "--reuse",
+            action="store_true",
+            help="데이터를 만들지 않고 DB 에 있는 게시글로 측정",
+        )
+        parser.add_argument("--output", help="결과 JSON 경로 (기본값 bench-<preset>.json)")
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1 or options["warmup"] < 0:
+            raise CommandError("--iterations 는 1 이상, --warmup 은 0 이상이어야 합니다")
+        functions = [
+            (module.__name__.rsplit(".", 1)[-1], name, func)
+            for module in BENCH_MODULES
+            for name, func in public_functions(module)
+        ]
+        unknown = set(options["function"]) - {name for _, name, _ in functions}
+        if unknown:
+            raise CommandError(f"측정할 수 없는 함수입니다 : {', '.join(sorted(unknown))}")
+
+        sizes = {
+            key: options[key] or DATASET_PRESETS[options["preset"]][key]
+            for key in ("posts", "users", "tags")
+        }
+        if options["reuse"]:
+            if not Post.objects.exists():
+                raise CommandError("--reuse 로 측정할 게시글이 없습니다")
+        elif Post.objects.exists():
+            raise CommandError(
+                "게시글이 있는 DB 입니다. 빈 측정용 DB 를 쓰거나 --reuse 로 있는 데이터를 측정해주세요"
+            )
+        else:
+            started = time.perf_counter()
+            counts = seed_dataset(
+                **sizes,
+                seed=options["seed"],
+                progress=lambda done: self.stderr.write(
+                    f"\rseed {done}/{sizes['posts']}", ending=""
+                ),
+            )
+            self.stderr.write(
+                f"\rseeded {counts} in {time.perf_counter() - started:.1f}s"
+            )
+
+        data = BenchData(options["seed"])
+        meta = {
+            "preset": options["preset"],
+            "seed": options["seed"],
+            "posts": data.total_posts,
+            "users": User.objects.count(),
+            "tags": TagName.objects.count(),
+            "iterations": options["iterations"],
+            "warmup": options["warmup"],
+            "cold": options["cold"],
+            "database": connection.vendor,
+            "database_version": ".".join(map(str, connection.get_database_version())),
+            "django": django.get_version(),
+            "python": platform.python_version(),
+            "generated_at": timezone.now().isoformat(),
+        }
+        results = {}
+        missing = []
+        for kind in ("read", "write"):
+            for module_name, name, func in functions:
+                if options["function"] and name not in options["function"]:
+                    continue
+                if name not in BENCH_CASES:
+                    if kind == "read":
+                        missing.append(f"{module_name}.{name}")
+                    continue
+                case_kind, description, prepare = BENCH_CASES[name]
+                if case_kind != kind:
+                    continue
+                iterations = min(
+                    options["iterations"],
+                    MAX_ITERATIONS.get(name, options["iterations"]),
+                )
+                try:
+                    result = self.measure(
+                        data,
+                        name,
+                        func,
+                        prepare,
+                        iterations,
+                        min(options["warmup"], iterations),
+                        options["cold"],
+                    )
+                except Exception as e:
+                    self.stderr.write(f"{module_name}.{name} failed : {e!r}")
+                    result = {"error": repr(e)}
+                results[f"{module_name}.{name}"] = {
+                    "kind": kind,
+                    "case": description,
+                    **result,
+                }
+                self.write_result(f"{module_name}.{name}", result)
+        view_count_buffer.flush()
+
+        for name in missing:
+            self.stderr.write(f"{name} : 측정 case 가 없습니다 (BENCH_CASES 에 추가해주세요)")
+        output = options["output"] or f"bench-{options['preset']}.json"
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"meta": meta, "results": results, "missing": missing},
+                f,
+                ensure_ascii=False,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write("\n")
+        self.stdout.write(f"results written to {output}")
+
+    def measure(self, data, name, func, prepare, iterations, warmup, cold):
+        """
+        Args:
+            data (BenchData) : case 가 인자를 고를 표본
+            name (str) : 함수 이름 (case 의 random seed 로 사용)
+            func (Callable) : 측정할 service 함수
+            prepare (Callable[[BenchData, Callable], Callable]) : BENCH_CASES 의 case 함수
+            iterations (int) : 측정 횟수
+            warmup (int) : 측정 전에 버리는 호출 수
+            cold (bool) : 호출마다 캐시를 비울지 여부
+
+        Returns:
+            Dict : {"iterations", "p50_ms", "p95_ms", "p99_ms", "mean_ms", "ops_per_sec",
+                    "queries_per_call", "max_queries"}
+        """
+        data.use(name)
+        calls = [prepare(data, func) for _ in range(warmup + iterations)]
+        latencies, query_counts = [], []
+        query_count = itertools.count()
+
+        def count_query(execute, sql, params, many, context):
+            next(query_count)
+            return execute(sql, params, many, context)
+
+        def record(index, started, first_query):
+            elapsed = time.perf_counter() - started
+            queries = next(query_count) - first_query - 1
+            if index >= warmup:
+                latencies.append(elapsed)
+                query_counts.append(queries)
+
+        def run_sync():
+            for index, call in enumerate(calls):
+                if cold:
+                    self.clear_caches()
+                first_query = next(query_count)
+                started = time.perf_counter()
+                call()
+                record(index, started, first_query)
+
+        async def run_async():
+            # async_to_sync 안에서 실행하여 thread_sensitive 한 async ORM 이 현재 thread 의 연결을 쓴다
+            for index, call in enumerate(calls):
+                if cold:
+                    self.clear_caches()
+                first_query = next(query_count)
+                started = time.perf_counter()
+                await call()
+                record(index, started, first_query)
+
+        with connection.execute_wrapper(count_query):
+            if inspect.iscoroutinefunction(func):
+                async_to_sync(run_async)()
+            else:
+                run_sync()
+
+        total = sum(latencies)
+        return {
+            "iterations": len(latencies),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            "mean_ms": round(total / len(latencies) * 1000, 3),
+            "ops_per_sec": round(len(latencies) / total, 1) if total else 0.0,
+            "queries_per_call": round(sum(query_counts) / len(query_counts), 2),
+            "max_queries": max(query_counts),
+        }
+
+    def clear_caches(self):
+        get_list_cache().clear()
+        get_fragment_cache().clear()
+        tag_id_cache.clear()
+
+    def write_result(self, name, result):
+        if "error" in result:
+            self.stdout.write(f"{name:<45} error")
+            return
+        self.stdout.write(
+            f"{name:<45} p50={result['p50_ms']:.3f}ms p95={result['p95_ms']:.3f}ms "
+            f"p99={result['p99_ms']:.3f}ms ops/s={result['ops_per_sec']:.1f} "
+            f"queries={result['queries_per_call']:g}"
+        )
@@ -0,0 +1,123 @@
+import http.client
+import itertools
+import threading
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+from posts.services.timing_services import percentile
+
+
+class Command(BaseCommand):
+    """
+    실행 중인 서버에 동시 요청을 보내 초당 처리량(rps)과 p50/p99 응답시간을 측정한다.
+    연결은 thread 마다 keep-alive 로 재사용하며, 304 는 정상 응답으로 센다.
+    사용 예시)
+        gunicorn GOALS.wsgi -w 4 -b 127.0.0.1:8000
+        uvicorn GOALS.asgi:application --workers 4 --port 8001
+        python manage.py bench_http --url http://127.0.0.1:8000/posts --url http://127.0.0.1:8001/posts/async
+    """
+
+    help = "서버에 동시 요청을 보내 rps 와 p50/p99 응답시간을 측정합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", action="append", required=True)
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument("--warmup", type=int, default=50)
+        parser.add_argument(
+            "--header",
+            action="append",
+            default=[],
+            help='요청 헤더 /예시) --header "Authorization: Bearer <token>"',
+        )
+        parser.add_argument("--timeout", type=float, default=10)
+
+    def handle(self, *args, **options):
+        headers = {}
+        for header in options["header"]:
+            name, sep, value = header.partition(":")
+            if not sep:
+                raise CommandError(f"헤더 형식을 확인해주세요 : {header}")
+            headers[name.strip()] = value.strip()
+
+        for url in options["url"]:
+            target = urlsplit(url)
+            if target.scheme not in ("http", "https") or not target.hostname:
+                raise CommandError(f"URL 을 확인해주세요 : {url}")
+            self.load(target, headers, options["warmup"], 1, options["timeout"])
+            result = self.load(
+                target,
+                headers,
+                options["requests"],
+                options["concurrency"],
+                options["timeout"],
+            )
+            self.stdout.write(
+                f"{url} requests={result['requests']} errors={result['errors']} "
+                f"rps={result['rps']:.1f} "
+                f"p50={result['p50'] * 1000:.2f}ms p99={result['p99'] * 1000:.2f}ms"
+            )
+
+    def load(self, target, headers, total, concurrency, timeout):
+        """
+        Args:
+            target (SplitResult) : 요청할 URL
+            headers (Dict[str, str]) : 요청 헤더
+            total (int) : 전체 요청 수
+            concurrency (int) : 동시에 요청하는 thread 수
+            timeout (float) : 요청 1개의 timeout (초)
+
+        Returns:
+            Dict : {"requests", "errors", "rps", "p50", "p99"} (응답시간은 초)
+        """
+        path = target.path or "/"
+        if target.query:
+            path += "?" + target.query
+        connection_class = (
+            http.client.HTTPSConnection
+            if target.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        counter = itertools.count()
+        latencies = []
+        errors = []
+        lock = threading.Lock()
+
+        def worker():
+            connection = connection_class(target.hostname, target.port, timeout=timeout)
+            timings = []
+            failed = 0
+            while next(counter) < total:
+                started = time.perf_counter()
+                try:
+                    connection.request("GET", path, headers=headers)
+                    response = connection.getresponse()
+                    response.read()
+                    if response.status >= 400:
+                        failed += 1
+                except (OSError, http.client.HTTPException):
+                    failed += 1
+                    connection.close()
+                timings.append(time.perf_counter() - started)
+            connection.close()
+            with lock:
+                latencies.extend(timings)
+                errors.append(failed)
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        return {
+            "requests": len(latencies),
+            "errors": sum(errors),
+            "rps": len(latencies) / elapsed if elapsed else 0.0,
+            "p50": percentile(latencies, 50),
+            "p99": percentile(latencies, 99),
+        }
@@ -0,0 +1,87 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from posts.models import Post, PostTag, TagName
+from posts.serializers import PostSerializer
+from posts.services.post_services import read_posts, read_posts_by_ids
+from users.models import User
+
+
+class Command(BaseCommand):
+    """
+    게시글 목록 응답을 PostSerializer 로 만들 때와 .values() projection(read_posts_by_ids)으로 만들 때의
+    게시글 1개당 비용을 page_size 별로 비교한다. 측정용 게시글은 트랜잭션 안에서 만들고 끝나면 롤백한다.
+    사용 예시) python manage.py bench_post_list --sizes 10 100 1000 --repeat 20
+    """
+
+    help = "게시글 목록 serializer 와 projection 의 게시글당 비용을 비교합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--tags", type=int, default=3, help="게시글당 해시태그 수")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            post_ids = self.create_posts(max(options["sizes"]), options["tags"])
+            for size in options["sizes"]:
+                self.bench(post_ids[:size], options["repeat"])
+            transaction.set_rollback(True)
+
+    def create_posts(self, post_count, tag_count):
+        user = User.objects.create(
+            username="bench_user", email="bench_user@bench.local", password="bench"
+        )
+        tags = TagName.objects.bulk_create(
+            [TagName(name=f"bench_tag{i}") for i in range(tag_count)]
+        )
+        posts = Post.objects.bulk_create(
+            [
+                Post(writer=user, title=f"bench_title{i}", content="bench_content")
+                for i in range(post_count)
+            ]
+        )
+        PostTag.objects.bulk_create(
+            [PostTag(posts=post, tags=tag) for post in posts for tag in tags]
+        )
+        return [post.id for post in posts]
+
+    def bench(self, post_ids, repeat):
+        renderer = JSONRenderer()
+
+        def serializer_page():
+            posts = {
+                post.id: post
+                for post in read_posts("created_date", 1).filter(id__in=post_ids)
+            }
+            data = PostSerializer([posts[i] for i in post_ids], many=True).data
+            return renderer.render(data)
+
+        def projection_page():
+            return renderer.render(read_posts_by_ids(post_ids))
+
+        if serializer_page() != projection_page():
+            raise CommandError("projection 결과가 PostSerializer 와 다릅니다")
+
+        results = {}
+        for name, build_page in [
+            ("serializer", serializer_page),
+            ("projection", projection_page),
+        ]:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                build_page()
+                timings.append(time.perf_counter() - started)
+            results[name] = statistics.median(timings) / len(post_ids) * 1e6
+
+        self.stdout.write(
+            f"page_size={len(post_ids):>5} "
+            f"serializer={results['serializer']:8.1f}us/row "
+            f"projection={results['projection']:8.1f}us/row "
+            f"x{results['serializer'] / results['projection']:.1f}"
+        )
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from posts.services.export_services import (EXPORT_FORMATS, export_posts,
+                                            parse_is_active, parse_since)
+
+
+class Command(BaseCommand):
+    """
+    게시글 전체를 해시태그, 좋아요 수와 함께 NDJSON/CSV 로 내보낸다.
+    사용 예시) python manage.py export_posts --format csv --since 2022-10-16 --is-active true -o posts.csv
+    """
+
+    help = "게시글을 NDJSON/CSV 로 내보냅니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format", choices=sorted(EXPORT_FORMATS), default="ndjson"
+        )
+        parser.add_argument("--since", help="이 날짜/시각 이후에 작성된 게시글만")
+        parser.add_argument("--is-active", help="활성화 여부 (true/false)")
+        parser.add_argument("--chunk-size", type=int, help="한번에 읽을 게시글 수")
+        parser.add_argument("-o", "--output", help="저장할 파일 (없으면 stdout)")
+
+    def handle(self, *args, **options):
+        try:
+            lines = export_posts(
+                options["format"],
+                since=parse_since(options["since"]) if options["since"] else None,
+                is_active=(
+                    parse_is_active(options["is_active"])
+                    if options["is_active"]
+                    else None
+                ),
+                chunk_size=options["chunk_size"],
+            )
+        except ValueError as error:
+            raise CommandError(error)
+
+        if not options["output"]:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        line_count = 0
+        with open(options["output"], "w", encoding="utf-8", newline="") as output:
+            for line in lines:
+                output.write(line)
+                line_count += 1
+        if options["format"] == "csv":
+            line_count -= 1
+        self.stderr.write(
+            self.style.SUCCESS(f"{line_count}개의 게시글을 {options['output']} 에 내보냈습니다")
+        )
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from posts.services.search_services import get_search_backend
+
+
+class Command(BaseCommand):
+    """
+    게시글 제목/내용 검색 색인을 다시 만든다.
+    사용 예시) python manage.py rebuild_search_index
+    """
+
+    help = "게시글 검색 색인을 다시 만듭니다"
+
+    def handle(self, *args, **options):
+        search_backend = get_search_backend()
+        indexed_count = search_backend.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{type(search_backend).__name__} : {indexed_count}개의 게시글을 색인했습니다"
+            )
+        )
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from posts.services.post_services import recompute_hot_scores
+
+
+class Command(BaseCommand):
+    """
+    Post.hot_score 를 작성시간/좋아요 수/조회수로 다시 계산한다.
+    hot 설정(settings.POSTS_HOT_SCORE)을 바꾼 뒤 실행하고, 보정용으로 cron 등에서 주기적으로 실행한다.
+    사용 예시)
+        python manage.py recompute_hot_scores
+        python manage.py recompute_hot_scores --chunk-size 20000
+    """
+
+    help = "Post.hot_score 를 전체 게시글에 대해 다시 계산합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, help="한번에 읽고 저장하는 게시글 수")
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] is not None and options["chunk_size"] < 1:
+            raise CommandError("--chunk-size 는 1 이상이어야 합니다")
+        changed = recompute_hot_scores(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"{changed}개의 게시글 hot 점수를 보정했습니다"))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from posts.services.post_services import reconcile_like_count
+
+
+class Command(BaseCommand):
+    """
+    Post.like_count 를 Like 테이블 기준으로 다시 맞춘다.
+    사용 예시) python manage.py reconcile_like_count
+    """
+
+    help = "Post.like_count 를 Like 테이블의 실제 좋아요 수로 보정합니다"
+
+    def handle(self, *args, **options):
+        reconciled_count = reconcile_like_count()
+        self.stdout.write(self.style.SUCCESS(f"{reconciled_count}개의 게시글 좋아요 수를 보정했습니다"))
@@ -0,0 +1,74 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import get_runner
+
+from posts.services.perf_baseline_services import (get_perf_baseline_options,
+                                                   load_baseline,
+                                                   perf_recorder,
+                                                   save_baseline)
+from posts.services.view_services import view_count_buffer
+
+
+class Command(BaseCommand):
+    """
+    API 테스트를 실행해 테스트별 SQL 쿼리 수와 시간을 새 기준으로 perf_baseline.json 에 저장한다.
+    쿼리 수가 늘어나는 변경을 의도한 경우에만 실행하고, 바뀐 기준 파일을 코드와 함께 commit 한다.
+    실패한 테스트는 이전 기준을 그대로 두고, 테스트 label 을 주면 그 테스트들의 기준만 바꾼다.
+    사용 예시)
+        python manage.py refresh_perf_baseline
+        python manage.py refresh_perf_baseline posts.tests.test_post_api.TestAPI.test_post_view_def_get_ok
+    """
+
+    help = "API 테스트의 SQL 쿼리 수/시간 기준(perf_baseline.json)을 다시 측정해 저장합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "test_labels",
+            nargs="*",
+            help="측정할 테스트 (기본값 settings.POSTS_PERF_BASELINE['TESTS'])",
+        )
+        parser.add_argument("--path", help="기준 파일 경로")
+
+    def handle(self, *args, **options):
+        labels = options["test_labels"] or get_perf_baseline_options()["TESTS"]
+        runner = get_runner(settings)(
+            verbosity=options["verbosity"], interactive=False, parallel=0
+        )
+        runner.setup_test_environment()
+        try:
+            suite = runner.build_suite(labels)
+            old_config = runner.setup_databases(aliases=runner.get_databases(suite))
+            perf_recorder.start()
+            try:
+                result = runner.run_suite(suite)
+            finally:
+                measurements = perf_recorder.stop()
+                # 테스트 DB 를 지우기 전에 상세 조회 테스트가 남긴 조회수를 반영한다
+                view_count_buffer.flush()
+                runner.teardown_databases(old_config)
+        finally:
+            runner.teardown_test_environment()
+        if not measurements:
+            raise CommandError("측정한 테스트가 없습니다 (PerfBaselineMixin 을 사용하는 테스트인지 확인해주세요)")
+
+        previous = load_baseline(options["path"])
+        baseline = {
+            test_id: value
+            for test_id, value in previous.items()
+            if not any(
+                test_id == label or test_id.startswith(label + ".") for label in labels
+            )
+        }
+        baseline.update(measurements)
+        for test, _ in result.failures + result.errors:
+            test_id = test.id()
+            baseline.pop(test_id, None)
+            if test_id in previous:
+                baseline[test_id] = previous[test_id]
+            self.stderr.write(f"{test_id} : 실패한 테스트는 이전 기준을 유지합니다")
+        save_baseline(baseline, options["path"])
+        self.stdout.write(
+            f"{len(measurements)} tests measured, "
+            f"{len(baseline)} baselines written to "
+            f"{options['path'] or get_perf_baseline_options()['PATH']}"
+        )
@@ -0,0 +1,83 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from posts.services.seed_services import (DATASET_PRESETS, SEED_ANCHOR,
+                                          seed_dataset)
+
+
+class Command(BaseCommand):
+    """
+    부하 테스트용 사용자, 게시글, 해시태그(Zipf 분포), 좋아요를 고정된 seed 로 만든다.
+    게시글은 chunk 단위 트랜잭션으로 bulk_create 하고 chunk 를 여러 process 가 나누어 넣으므로
+    메모리는 (process 수 x chunk) 만큼만 쓴다. 이미 있는 데이터 뒤에 이어서 넣는다.
+    작성일은 --anchor(기본 SEED_ANCHOR) 이전 1년 사이로 만들어 실행한 날짜와 상관없이 같은 데이터가 된다.
+    사용 예시)
+        python manage.py seed_goals --preset 1m
+        python manage.py seed_goals --posts 250000 --users 5000 --tags 2000 --seed 42 --workers 4
+        python manage.py seed_goals --preset 100k --anchor 2026-10-01
+    """
+
+    help = "부하 테스트용 사용자/게시글/해시태그/좋아요를 고정 seed 로 대량 생성합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--preset", choices=list(DATASET_PRESETS), default="1k")
+        parser.add_argument("--posts", type=int, help="preset 의 게시글 수 대신 사용")
+        parser.add_argument("--users", type=int, help="preset 의 사용자 수 대신 사용")
+        parser.add_argument("--tags", type=int, help="preset 의 해시태그 수 대신 사용")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--anchor",
+            help=f"작성일 기준 날짜 YYYY-MM-DD (기본값 {SEED_ANCHOR.date()}, 이전 1년 사이에 작성)",
+        )
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument(
+            "--workers", type=int, help="게시글을 나누어 넣을 process 수 (기본값 CPU 수)"
+        )
+
+    def handle(self, *args, **options):
+        sizes = {
+            key: options[key] or DATASET_PRESETS[options["preset"]][key]
+            for key in ("posts", "users", "tags")
+        }
+        if options["workers"] is not None and options["workers"] < 1:
+            raise CommandError("--workers 는 1 이상이어야 합니다")
+        anchor = None
+        if options["anchor"]:
+            try:
+                anchor_date = parse_date(options["anchor"])
+            except ValueError:
+                anchor_date = None
+            if anchor_date is None:
+                raise CommandError("--anchor 는 YYYY-MM-DD 형식이어야 합니다")
+            anchor = datetime.datetime.combine(
+                anchor_date, datetime.time.min, tzinfo=datetime.timezone.utc
+            )
+
+        started = time.perf_counter()
+
+        def progress(done):
+            elapsed = time.perf_counter() - started
+            self.stderr.write(
+                f"\r{done}/{sizes['posts']} posts ({done / elapsed:.0f}/s)", ending=""
+            )
+
+        try:
+            counts = seed_dataset(
+                **sizes,
+                seed=options["seed"],
+                chunk_size=options["chunk_size"],
+                workers=options["workers"],
+                progress=progress,
+                anchor=anchor,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+        self.stderr.write("")
+        self.stdout.write(
+            " ".join(f"{table}={count}" for table, count in counts.items())
+            + f" elapsed={elapsed:.1f}s"
+        )
@@ -0,0 +1,110 @@
+import random
+import threading
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, connections
+from django.db.models import F
+
+from posts.models import Post
+from posts.services.post_services import read_detail_version, toggle_like
+from users.models import User
+
+
+class Command(BaseCommand):
+    """
+    writer 수만큼 thread 를 동시에 시작해 좋아요/조회수 쓰기와 상세 조회를 섞어 실행하고
+    "database is locked" 같은 DB 오류가 나는지 확인한다. 측정용 사용자/게시글은 끝나면 지운다.
+    사용 예시) python manage.py stress_writes --writers 50 --ops 20
+    """
+
+    help = "동시에 여러 writer 로 좋아요/조회수를 써서 DB 잠금 오류가 없는지 확인합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--writers", type=int, default=50)
+        parser.add_argument("--ops", type=int, default=20, help="writer 1개당 작업 수")
+        parser.add_argument("--posts", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        if options["writers"] < 1 or options["ops"] < 1 or options["posts"] < 1:
+            raise CommandError("--writers, --ops, --posts 는 1 이상이어야 합니다")
+        users = User.objects.bulk_create(
+            [
+                User(username=f"stress_user{i}", email=f"stress_user{i}@stress.local")
+                for i in range(options["writers"])
+            ]
+        )
+        if connection.vendor == "sqlite":
+            # SQLite bulk_create 는 pk 를 채우지 않으므로 다시 읽는다
+            users = list(User.objects.filter(email__endswith="@stress.local"))
+        posts = Post.objects.bulk_create(
+            [
+                Post(writer=users[0], title=f"stress_title{i}", content="stress")
+                for i in range(options["posts"])
+            ]
+        )
+        post_ids = [post.id for post in posts]
+        try:
+            errors, elapsed = self.run_writers(
+                users, post_ids, options["ops"], options["seed"]
+            )
+        finally:
+            User.objects.filter(email__endswith="@stress.local").delete()
+
+        total = options["writers"] * options["ops"]
+        self.stdout.write(
+            f"writers={options['writers']} ops={total} "
+            f"errors={sum(errors.values())} elapsed={elapsed:.2f}s"
+        )
+        for message, count in errors.most_common():
+            self.stdout.write(f"  {count} x {message}")
+        if errors:
+            raise CommandError("동시 쓰기 중 DB 오류가 발생했습니다")
+
+    def run_writers(self, users, post_ids, ops, seed):
+        """
+        Args:
+            users (List[User]) : writer 마다 1명씩 사용할 사용자
+            post_ids (List[int]) : 좋아요/조회수를 쓸 게시글의 PK
+            ops (int) : writer 1개당 작업 수
+            seed (int) : 게시글/작업 선택에 사용할 random seed
+
+        Returns:
+            Tuple[Counter, float] : (오류 메시지별 횟수, 걸린 시간(초))
+        """
+        barrier = threading.Barrier(len(users))
+        errors = Counter()
+        lock = threading.Lock()
+
+        def writer(index, user):
+            rng = random.Random(seed * 1_000_003 + index)
+            barrier.wait()
+            try:
+                for _ in range(ops):
+                    post_id = rng.choice(post_ids)
+                    try:
+                        action = rng.random()
+                        if action < 0.5:
+                            toggle_like(user, post_id)
+                        elif action < 0.8:
+                            Post.objects.filter(id=post_id).update(views=F("views") + 1)
+                        else:
+                            read_detail_version(post_id)
+                    except DatabaseError as e:
+                        with lock:
+                            errors[str(e)] += 1
+            finally:
+                connections.close_all()
+
+        threads = [
+            threading.Thread(target=writer, args=(index, user))
+            for index, user in enumerate(users)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors, time.perf_counter() - started
@@ -0,0 +1,190 @@
+import asyncio
+import json
+import logging
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.decorators import sync_and_async_middleware
+
+from posts.routers import PIN_COOKIE, begin_request, end_request
+from posts.services.metrics_services import (get_metrics_options,
+                                             metrics_recorder,
+                                             record_view_count_stats)
+from posts.services.timing_services import (begin_timings, end_timings,
+                                            get_current_timings,
+                                            get_server_timing_options,
+                                            install_query_timers)
+from posts.services.view_services import view_count_buffer
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def _is_write_request(request) -> bool:
+    return request.method not in SAFE_METHODS
+
+
+def _pin_response(response, state) -> None:
+    # 쓰기를 한 client 는 replica 가 따라잡을 동안 primary 에서 읽도록 cookie 로 고정한다
+    if state["wrote"]:
+        response.set_cookie(
+            PIN_COOKIE,
+            "1",
+            max_age=getattr(settings, "DATABASE_REPLICA_PIN_SECONDS", 5),
+            httponly=True,
+            samesite="Lax",
+        )
+
+
+@sync_and_async_middleware
+def replica_pinning_middleware(get_response):
+    """
+    요청마다 DB 라우팅 상태를 만든다. 쓰기 요청이거나 최근에 쓰기를 한 client(pin cookie)면
+    읽기도 primary 로 보내고, 요청 중에 쓰기가 있었으면 응답에 pin cookie 를 넣는다.
+    """
+
+    def pinned(request) -> bool:
+        return _is_write_request(request) or PIN_COOKIE in request.COOKIES
+
+    if asyncio.iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            token = begin_request(pinned(request))
+            try:
+                response = await get_response(request)
+            finally:
+                state = end_request(token)
+            _pin_response(response, state)
+            return response
+
+    else:
+
+        def middleware(request):
+            token = begin_request(pinned(request))
+            try:
+                response = get_response(request)
+            finally:
+                state = end_request(token)
+            _pin_response(response, state)
+            return response
+
+    return middleware
+
+
+@sync_and_async_middleware
+def server_timing_middleware(get_response):
+    """
+    settings.POSTS_SERVER_TIMING["ENABLED"] 이면 요청마다 SQL 쿼리 수/시간과 단계별 시간(timed)을 모아
+    Server-Timing 헤더와 JSON 로그 1줄로 남긴다. 꺼져 있으면 middleware 목록에서 빠진다.
+    """
+    options = get_server_timing_options()
+    if not options["ENABLED"]:
+        raise MiddlewareNotUsed
+
+    def start():
+        install_query_timers()
+        timings, token = begin_timings()
+        return timings, token, time.perf_counter()
+
+    def finish(request, response, timings, started):
+        total = (time.perf_counter() - started) * 1000
+        response.headers["Server-Timing"] = timings.as_header(total)
+        if options["LOG"]:
+            logger.info(
+                json.dumps(
+                    {
+                        "method": request.method,
+                        "path": request.path,
+                        "status": response.status_code,
+                        "total_ms": round(total, 2),
+                        **timings.as_dict(),
+                    }
+                )
+            )
+        return response
+
+    if asyncio.iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            timings, token, started = start()
+            try:
+                response = await get_response(request)
+            finally:
+                end_timings(token)
+            return finish(request, response, timings, started)
+
+    else:
+
+        def middleware(request):
+            timings, token, started = start()
+            try:
+                response = get_response(request)
+            finally:
+                end_timings(token)
+            return finish(request, response, timings, started)
+
+    return middleware
+
+
+def _view_label(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    view_class = getattr(match.func, "view_class", None)
+    return view_class.__name__ if view_class else match.func.__name__
+
+
+@sync_and_async_middleware
+def metrics_middleware(get_response):
+    """
+    settings.POSTS_METRICS["ENABLED"] 이면 요청마다 view/method 별 응답시간, status code, SQL 쿼리 수,
+    캐시 hit/miss 와 조회수 버퍼 상태를 worker 의 metric 파일에 쓴다. (/metrics 에서 모든 worker 의 값을 더해 보여준다)
+    """
+    if not get_metrics_options()["ENABLED"]:
+        raise MiddlewareNotUsed
+
+    def start():
+        # server_timing_middleware 가 먼저 시작한 측정이 있으면 같이 쓴다
+        timings, token = get_current_timings(), None
+        if timings is None:
+            install_query_timers()
+            timings, token = begin_timings()
+        return timings, token, time.perf_counter()
+
+    def finish(request, response, timings, started):
+        metrics_recorder.record_request(
+            _view_label(request),
+            request.method,
+            response.status_code,
+            time.perf_counter() - started,
+            timings.sql_count,
+            timings.cache_counts,
+        )
+        record_view_count_stats(view_count_buffer.stats())
+        return response
+
+    if asyncio.iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            timings, token, started = start()
+            try:
+                response = await get_response(request)
+            finally:
+                if token is not None:
+                    end_timings(token)
+            return finish(request, response, timings, started)
+
+    else:
+
+        def middleware(request):
+            timings, token, started = start()
+            try:
+                response = get_response(request)
+            finally:
+                if token is not None:
+                    end_timings(token)
+            return finish(request, response, timings, started)
+
+    return middleware
@@ -0,0 +1,33 @@
+# Generated by Django 4.1.4 on 2026-10-18 11:35
+
+from django.db import migrations, models
+
+
+def fill_like_count(apps, schema_editor):
+    Like = apps.get_model("posts", "Like")
+    Post = apps.get_model("posts", "Post")
+    like_counts = (
+        Like.objects.values("post").annotate(count=models.Count("id")).order_by()
+    )
+    for like_count in like_counts:
+        Post.objects.filter(id=like_count["post"]).update(
+            like_count=like_count["count"]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="like_count",
+            field=models.PositiveIntegerField(
+                db_index=True, default=0, verbose_name="좋아요수"
+            ),
+        ),
+        migrations.RunPython(fill_like_count, migrations.RunPython.noop),
+    ]
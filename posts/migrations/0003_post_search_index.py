@@ -0,0 +1,84 @@
+from django.db import migrations
+from django.db.utils import OperationalError
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE posts_search USING fts5(
+        title, content, content='posts_post', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER posts_search_insert AFTER INSERT ON posts_post BEGIN
+        INSERT INTO posts_search(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER posts_search_delete AFTER DELETE ON posts_post BEGIN
+        INSERT INTO posts_search(posts_search, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER posts_search_update AFTER UPDATE OF title, content ON posts_post
+    BEGIN
+        INSERT INTO posts_search(posts_search, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO posts_search(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+    "INSERT INTO posts_search(posts_search) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS posts_search_update",
+    "DROP TRIGGER IF EXISTS posts_search_delete",
+    "DROP TRIGGER IF EXISTS posts_search_insert",
+    "DROP TABLE IF EXISTS posts_search",
+]
+
+POSTGRESQL_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX posts_post_title_trgm ON posts_post USING gin (title gin_trgm_ops)",
+    "CREATE INDEX posts_post_content_trgm ON posts_post USING gin (content gin_trgm_ops)",
+]
+
+POSTGRESQL_BACKWARD = [
+    "DROP INDEX IF EXISTS posts_post_content_trgm",
+    "DROP INDEX IF EXISTS posts_post_title_trgm",
+]
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        try:
+            for sql in SQLITE_FORWARD:
+                schema_editor.execute(sql)
+        except OperationalError:
+            # FTS5 trigram(SQLite 3.34+)이 없으면 LIKE 검색 백엔드를 그대로 사용한다
+            for sql in SQLITE_BACKWARD:
+                schema_editor.execute(sql)
+    elif schema_editor.connection.vendor == "postgresql":
+        for sql in POSTGRESQL_FORWARD:
+            schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        for sql in SQLITE_BACKWARD:
+            schema_editor.execute(sql)
+    elif schema_editor.connection.vendor == "postgresql":
+        for sql in POSTGRESQL_BACKWARD:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0002_post_like_count"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
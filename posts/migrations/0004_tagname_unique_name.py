@@ -0,0 +1,49 @@
+# Generated by Django 4.1.4 on 2026-10-18 11:38
+
+from django.db import migrations, models
+
+
+def merge_duplicate_tag_names(apps, schema_editor):
+    TagName = apps.get_model("posts", "TagName")
+    PostTag = apps.get_model("posts", "PostTag")
+    duplicated_names = (
+        TagName.objects.values("name")
+        .annotate(count=models.Count("id"), keep_id=models.Min("id"))
+        .filter(count__gt=1)
+        .order_by()
+    )
+    for duplicated in duplicated_names:
+        duplicated_ids = list(
+            TagName.objects.filter(name=duplicated["name"])
+            .exclude(id=duplicated["keep_id"])
+            .values_list("id", flat=True)
+        )
+        tagged_post_ids = set(
+            PostTag.objects.filter(tags_id=duplicated["keep_id"]).values_list(
+                "posts_id", flat=True
+            )
+        )
+        for post_tag in PostTag.objects.filter(tags_id__in=duplicated_ids):
+            if post_tag.posts_id in tagged_post_ids:
+                post_tag.delete()
+                continue
+            post_tag.tags_id = duplicated["keep_id"]
+            post_tag.save()
+            tagged_post_ids.add(post_tag.posts_id)
+        TagName.objects.filter(id__in=duplicated_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0003_post_search_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_tag_names, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="tagname",
+            name="name",
+            field=models.CharField(max_length=20, unique=True, verbose_name="해쉬태그"),
+        ),
+    ]
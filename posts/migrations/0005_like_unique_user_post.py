@@ -0,0 +1,38 @@
+# Generated by Django 4.1.4 on 2026-10-18 11:42
+
+from django.db import migrations, models
+
+
+def delete_duplicate_likes(apps, schema_editor):
+    Like = apps.get_model("posts", "Like")
+    Post = apps.get_model("posts", "Post")
+    duplicated_likes = (
+        Like.objects.values("user", "post")
+        .annotate(count=models.Count("id"), keep_id=models.Min("id"))
+        .filter(count__gt=1)
+        .order_by()
+    )
+    for duplicated in duplicated_likes:
+        Like.objects.filter(user=duplicated["user"], post=duplicated["post"]).exclude(
+            id=duplicated["keep_id"]
+        ).delete()
+        Post.objects.filter(id=duplicated["post"]).update(
+            like_count=Like.objects.filter(post=duplicated["post"]).count()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0004_tagname_unique_name"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_likes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="like",
+            constraint=models.UniqueConstraint(
+                fields=("user", "post"), name="unique_like_user_post"
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.1.4 on 2026-10-18 11:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0005_like_unique_user_post"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="like",
+            index=models.Index(
+                fields=["post", "user"], name="posts_like_post_user_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["created_date", "id"], name="posts_post_created_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(fields=["views", "id"], name="posts_post_views_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["like_count", "id"], name="posts_post_likes_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="posttag",
+            index=models.Index(
+                fields=["tags", "posts"], name="posts_tags_tag_post_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,134 @@
+# Generated by Django 4.1.4 on 2026-10-18 12:36
+
+import datetime
+import math
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+import posts.services.hot_services
+
+# 이 migration 을 만들 때의 hot 점수 계산 (이후 hot_services 가 바뀌어도 이 migration 의 결과는 바뀌지 않는다)
+HOT_SCORE = {
+    "HALF_LIFE_HOURS": 24,
+    "POST_WEIGHT": 1.0,
+    "LIKE_WEIGHT": 1.0,
+    "VIEW_WEIGHT": 0.1,
+    "EPOCH": datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc),
+}
+FILL_CHUNK_SIZE = 5000
+
+# SQLite 는 컬럼을 추가/삭제할 때 posts_post 를 새로 만들어 바꾸므로 0003 의 검색 색인 trigger 가 같이 지워진다
+SQLITE_SEARCH_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_search_insert AFTER INSERT ON posts_post BEGIN
+        INSERT INTO posts_search(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_search_delete AFTER DELETE ON posts_post BEGIN
+        INSERT INTO posts_search(posts_search, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_search_update AFTER UPDATE OF title, content
+    ON posts_post BEGIN
+        INSERT INTO posts_search(posts_search, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO posts_search(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+]
+
+
+def restore_search_triggers(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        if "posts_search" not in connection.introspection.table_names(cursor):
+            return
+    for sql in SQLITE_SEARCH_TRIGGERS:
+        schema_editor.execute(sql)
+
+
+def frozen_hot_score(options, created_date, like_count, views):
+    if timezone.is_naive(created_date):
+        created_date = timezone.make_aware(created_date)
+    engagement = (
+        options["POST_WEIGHT"]
+        + options["LIKE_WEIGHT"] * like_count
+        + options["VIEW_WEIGHT"] * views
+    )
+    age = (created_date - options["EPOCH"]).total_seconds()
+    return math.log(engagement) + age * math.log(2) / (
+        options["HALF_LIFE_HOURS"] * 3600
+    )
+
+
+def fill_hot_scores(apps, schema_editor):
+    Post = apps.get_model("posts", "Post")
+    alias = schema_editor.connection.alias
+    # 배포에서 바꾼 가중치 설정은 따른다
+    options = {**HOT_SCORE, **getattr(settings, "POSTS_HOT_SCORE", {})}
+    queryset = Post.objects.using(alias).order_by("id")
+    last_id = 0
+    while True:
+        chunk = list(
+            queryset.filter(id__gt=last_id).only(
+                "id", "created_date", "like_count", "views"
+            )[:FILL_CHUNK_SIZE]
+        )
+        if not chunk:
+            return
+        last_id = chunk[-1].id
+        for post in chunk:
+            post.hot_score = frozen_hot_score(
+                options, post.created_date, post.like_count, post.views
+            )
+        Post.objects.using(alias).bulk_update(chunk, ["hot_score"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0006_post_list_indexes"),
+    ]
+
+    operations = [
+        # 되돌릴 때 hot_score 컬럼을 지운 뒤 trigger 를 다시 만든다
+        migrations.RunPython(migrations.RunPython.noop, restore_search_triggers),
+        # 기존 게시글은 DB 에 0 으로 추가한 뒤 fill_hot_scores 에서 채우고,
+        # state 에는 모델과 같은 기본값(새 게시글 작성시점의 점수)을 남긴다
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.AddField(
+                    model_name="post",
+                    name="hot_score",
+                    field=models.FloatField(default=0.0, verbose_name="hot 점수"),
+                ),
+            ],
+            state_operations=[
+                migrations.AddField(
+                    model_name="post",
+                    name="hot_score",
+                    field=models.FloatField(
+                        default=posts.services.hot_services.initial_hot_score,
+                        verbose_name="hot 점수",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["hot_score", "id"], name="posts_post_hot_id_idx"
+            ),
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+        migrations.RunPython(fill_hot_scores, migrations.RunPython.noop),
+    ]
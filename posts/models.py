@@ -1,8 +1,10 @@
 from django.db import models
 
+from posts.services.hot_services import initial_hot_score
+
 
 class TagName(models.Model):
-    name = models.CharField("해쉬태그", max_length=20)
+    name = models.CharField("해쉬태그", max_length=20, unique=True)
 
     def __str__(self):
         return self.name
@@ -18,18 +20,27 @@ class Post(models.Model):
         TagName, verbose_name="해쉬태그", related_name="tags", through="PostTag"
     )
     views = models.PositiveIntegerField("조회수", default=0)
+    like_count = models.PositiveIntegerField("좋아요수", default=0, db_index=True)
     created_date = models.DateTimeField("생성시간", auto_now_add=True)
     updated_date = models.DateTimeField("수정시간", auto_now=True)
     is_active = models.BooleanField("활성화", default=True)
+    # 좋아요/조회수 반영 UPDATE 에서 같이 바뀌는 시간 감쇠 점수 (posts.services.hot_services)
+    hot_score = models.FloatField("hot 점수", default=initial_hot_score)
+
+    class Meta:
+        # 목록 정렬(정렬 컬럼, id)마다 색인을 두어 OFFSET/커서 페이징이 정렬 없이 색인 순서로 읽힌다
+        indexes = [
+            models.Index(
+                fields=["created_date", "id"], name="posts_post_created_id_idx"
+            ),
+            models.Index(fields=["views", "id"], name="posts_post_views_id_idx"),
+            models.Index(fields=["like_count", "id"], name="posts_post_likes_id_idx"),
+            models.Index(fields=["hot_score", "id"], name="posts_post_hot_id_idx"),
+        ]
 
     def __str__(self):
         return f"{self.writer} 님의 글 : {self.title}"
 
-    @property
-    def update_views(self):
-        self.views = self.views + 1
-        self.save()
-
 
 class PostTag(models.Model):
     tags = models.ForeignKey(TagName, on_delete=models.CASCADE)
@@ -37,11 +48,24 @@ class PostTag(models.Model):
 
     class Meta:
         db_table = "posts_tags"
+        indexes = [
+            models.Index(fields=["tags", "posts"], name="posts_tags_tag_post_idx"),
+        ]
 
 
 class Like(models.Model):
     user = models.ForeignKey("users.User", verbose_name="사용자", on_delete=models.CASCADE)
     post = models.ForeignKey(Post, verbose_name="게시글", on_delete=models.CASCADE)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "post"], name="unique_like_user_post"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["post", "user"], name="posts_like_post_user_idx"),
+        ]
+
     def __str__(self):
         return f"{self.user} ❤️ {self.post}"
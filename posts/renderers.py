@@ -0,0 +1,109 @@
+import json
+from typing import Dict, Tuple
+
+from rest_framework.renderers import JSONRenderer
+
+from posts.services.timing_services import timed
+
+
+class RenderedPost:
+    """
+    캐시된 게시글 JSON 조각(prefix, middle, suffix) 사이에 조회수와 좋아요 수만 끼워 넣은 게시글
+    조회수/좋아요 수는 자주 바뀌므로 조각에 넣지 않고 응답할 때의 값을 사용한다.
+    """
+
+    __slots__ = ("fragment", "views", "likes")
+
+    def __init__(self, fragment: Tuple[bytes, bytes, bytes], views: int, likes: int):
+        self.fragment = fragment
+        self.views = views
+        self.likes = likes
+
+    def render(self) -> bytes:
+        prefix, middle, suffix = self.fragment
+        return b"".join(
+            (prefix, str(self.views).encode(), middle, str(self.likes).encode(), suffix)
+        )
+
+
+class RenderedPostList(list):
+    """
+    RenderedPost 목록 : 게시글 조각을 이어 붙여 JSON 배열을 만든다
+    """
+
+    def render(self) -> bytes:
+        return b"[" + b",".join(post.render() for post in self) + b"]"
+
+
+class PostFragmentJSONRenderer(JSONRenderer):
+    """
+    RenderedPost / RenderedPostList 는 캐시된 조각을 그대로 이어 붙이고, 나머지 값은 JSONRenderer 와 같게 만든다.
+    (들여쓰기를 요청한 경우에는 조각을 다시 읽어 JSONRenderer 로 만든다)
+    """
+
+    @timed("render")
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        fragments = (RenderedPost, RenderedPostList)
+        if isinstance(data, dict):
+            has_fragments = any(isinstance(value, fragments) for value in data.values())
+        else:
+            has_fragments = isinstance(data, fragments)
+        if not has_fragments:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            if isinstance(data, dict):
+                data = {key: self._to_data(value) for key, value in data.items()}
+            else:
+                data = self._to_data(data)
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if not isinstance(data, dict):
+            return data.render()
+        return (
+            b"{"
+            + b",".join(
+                self.encode(key) + b":" + self.encode(value)
+                for key, value in data.items()
+            )
+            + b"}"
+        )
+
+    def encode(self, value) -> bytes:
+        """
+        Args:
+            value : JSON 으로 만들 값
+
+        Returns:
+            bytes : JSONRenderer 와 같은 형식(compact)의 JSON (조각은 그대로)
+        """
+        if isinstance(value, (RenderedPost, RenderedPostList)):
+            return value.render()
+        if value is None:
+            return b"null"
+        return super().render(value)
+
+    def _to_data(self, value):
+        if isinstance(value, (RenderedPost, RenderedPostList)):
+            return json.loads(value.render())
+        return value
+
+    def build_fragment(self, post: Dict, likes_key: str) -> Tuple[bytes, bytes, bytes]:
+        """
+        Args:
+            post (Dict) : serializer 로 만든 게시글 ("views" 바로 뒤에 likes_key 가 있어야 한다)
+            likes_key (str) : 좋아요 수 키 (목록 "likes" / 상세 "like_count")
+
+        Returns:
+            Tuple[bytes, bytes, bytes] : (조회수 앞, 조회수와 좋아요 수 사이, 좋아요 수 뒤) JSON 조각
+        """
+        keys = list(post)
+        views_at = keys.index("views")
+        if keys[views_at + 1] != likes_key:
+            raise ValueError(f"'{likes_key}' must follow 'views'")
+        head = {key: post[key] for key in keys[:views_at]}
+        tail = {key: post[key] for key in keys[views_at + 2 :]}
+        prefix = self.encode(head)[:-1] + (b"," if head else b"") + b'"views":'
+        middle = b"," + self.encode(likes_key) + b":"
+        suffix = b"," + self.encode(tail)[1:] if tail else b"}"
+        return prefix, middle, suffix
@@ -0,0 +1,124 @@
+import asyncio
+import functools
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+PIN_COOKIE = "db_primary_pin"
+
+# 요청 1개 동안의 라우팅 상태. middleware 가 요청마다 새 dict 를 넣고, thread 로 복사된
+# context 에서도 같은 dict 를 보도록 값을 바꿀 때는 dict 안을 바꾼다.
+_request_state: ContextVar[Optional[Dict]] = ContextVar(
+    "posts_db_request_state", default=None
+)
+_replica_alias: ContextVar[Optional[str]] = ContextVar(
+    "posts_db_replica_alias", default=None
+)
+
+
+def get_replicas() -> List[str]:
+    """
+    Returns:
+        List[str] : settings.DATABASE_REPLICAS 의 replica DB alias (없으면 빈 list)
+    """
+    return list(getattr(settings, "DATABASE_REPLICAS", []))
+
+
+def begin_request(pinned: bool = False):
+    """
+    Args:
+        pinned (bool) : 이번 요청의 읽기를 primary 로 고정할지 여부
+
+    Returns:
+        Token : end_request 에 넘길 ContextVar token
+    """
+    return _request_state.set({"pinned": pinned, "wrote": False})
+
+
+def end_request(token) -> Dict:
+    """
+    Args:
+        token : begin_request 가 돌려준 token
+
+    Returns:
+        Dict : {"pinned", "wrote"} 이번 요청의 라우팅 상태
+    """
+    state = _request_state.get()
+    _request_state.reset(token)
+    return state
+
+
+def is_pinned() -> bool:
+    state = _request_state.get()
+    return bool(state and state["pinned"])
+
+
+def reads_from_replica() -> bool:
+    """
+    Returns:
+        bool : 지금 읽기가 replica 로 가는지 여부 (use_replicas 블록 안이고 primary 에 고정되지 않았을 때)
+    """
+    return _replica_alias.get() is not None and not is_pinned()
+
+
+@contextmanager
+def use_replicas():
+    """
+    블록 안의 읽기를 replica 1개로 보낸다. replica 가 없거나 이번 요청이 primary 에 고정되어 있으면
+    primary 를 그대로 쓴다. 한 요청의 쿼리들이 서로 다른 replica 를 보지 않도록 블록에 들어갈 때 1번만 고른다.
+    """
+    replicas = get_replicas()
+    alias = random.choice(replicas) if replicas and not is_pinned() else None
+    token = _replica_alias.set(alias)
+    try:
+        yield alias
+    finally:
+        _replica_alias.reset(token)
+
+
+def replica_reads(view_func):
+    """
+    view method 의 읽기를 use_replicas 로 replica 에 보내는 decorator (sync/async view 모두 사용)
+    """
+    if asyncio.iscoroutinefunction(view_func):
+
+        @functools.wraps(view_func)
+        async def async_wrapper(*args, **kwargs):
+            with use_replicas():
+                return await view_func(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(view_func)
+    def wrapper(*args, **kwargs):
+        with use_replicas():
+            return view_func(*args, **kwargs)
+
+    return wrapper
+
+
+class PrimaryReplicaRouter:
+    """
+    쓰기는 항상 primary(default) 로, 읽기는 use_replicas 블록 안에서만 replica 로 보낸다.
+    요청 중에 쓰기가 한번이라도 있으면 그 요청의 남은 읽기는 primary 에서 한다 (read-your-writes).
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = _replica_alias.get()
+        if alias is None or is_pinned():
+            return None
+        return alias
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state["pinned"] = state["wrote"] = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # DB alias 는 primary 와 그 replica 뿐이라 모두 같은 데이터이다
+        return True
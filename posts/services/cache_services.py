@@ -0,0 +1,428 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DatabaseError, connections, transaction
+from django.utils.module_loading import import_string
+
+from posts.routers import is_pinned, reads_from_replica
+from posts.services.timing_services import record_cache
+
+logger = logging.getLogger(__name__)
+
+LIST_SORTS = ("created_date", "views", "likes", "hot")
+
+DEFAULT_LIST_CACHE = {
+    "BACKEND": "posts.services.cache_services.LRUCacheBackend",
+    "OPTIONS": {"max_size": 1024, "timeout": 60},
+    "COUNT_REFRESH_INTERVAL": 30,
+}
+
+_MISSING = object()
+
+
+class LRUCacheBackend:
+    """
+    프로세스 메모리에 최대 max_size개, timeout초 동안 값을 보관하는 LRU 캐시
+    세대(generation) 카운터는 LRU로 밀려나면 안되므로 따로 보관한다.
+    """
+
+    def __init__(self, max_size: int = 1024, timeout: int = 60):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            item = self._values.get(key, _MISSING)
+            if item is not _MISSING and item[1] < time.monotonic():
+                del self._values[key]
+                item = _MISSING
+            if item is _MISSING:
+                self.misses += 1
+                return default
+            self._values.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key: str, value, timeout: Optional[int] = None) -> None:
+        expires = time.monotonic() + (self.timeout if timeout is None else timeout)
+        with self._lock:
+            self._values[key] = (value, expires)
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def get_many(self, keys: Iterable[str]) -> Dict:
+        values = {}
+        for key in keys:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                values[key] = value
+        return values
+
+    def set_many(self, values: Dict, timeout: Optional[int] = None) -> None:
+        for key, value in values.items():
+            self.set(key, value, timeout)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._values.pop(key, None)
+
+    def get_generations(self, keys: Iterable[str]) -> Dict[str, int]:
+        with self._lock:
+            return {key: self._generations.get(key, 0) for key in keys}
+
+    def incr_generations(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._generations.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._values)}
+
+
+class DjangoCacheBackend:
+    """
+    settings.CACHES 의 캐시(alias)를 사용하여 여러 gunicorn worker가 같은 캐시를 공유한다.
+    세대 카운터가 캐시에서 밀려나도 값이 되돌아가지 않도록 현재 시각(ms)으로 다시 시작한다.
+    """
+
+    def __init__(self, alias: str = "default", timeout: int = 60):
+        self.cache = caches[alias]
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, default=None):
+        value = self.cache.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value, timeout: Optional[int] = None) -> None:
+        self.cache.set(key, value, self.timeout if timeout is None else timeout)
+
+    def get_many(self, keys: Iterable[str]) -> Dict:
+        keys = list(keys)
+        values = self.cache.get_many(keys)
+        self.hits += len(values)
+        self.misses += len(keys) - len(values)
+        return values
+
+    def set_many(self, values: Dict, timeout: Optional[int] = None) -> None:
+        self.cache.set_many(values, self.timeout if timeout is None else timeout)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        self.cache.delete_many(list(keys))
+
+    def get_generations(self, keys: Iterable[str]) -> Dict[str, int]:
+        keys = list(keys)
+        generations = self.cache.get_many(keys)
+        for key in keys:
+            if key not in generations:
+                self.cache.add(key, time.time_ns() // 1_000_000, None)
+                generations[key] = self.cache.get(key, 0)
+        return generations
+
+    def incr_generations(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            try:
+                self.cache.incr(key)
+            except ValueError:
+                self.cache.add(key, time.time_ns() // 1_000_000, None)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+_list_cache = None
+_list_cache_lock = threading.Lock()
+
+
+def get_list_cache():
+    """
+    Returns:
+        LRUCacheBackend | DjangoCacheBackend : settings.POSTS_LIST_CACHE 로 만든 게시글 목록 캐시
+    """
+    global _list_cache
+    if _list_cache is None:
+        with _list_cache_lock:
+            if _list_cache is None:
+                config = (
+                    getattr(settings, "POSTS_LIST_CACHE", None) or DEFAULT_LIST_CACHE
+                )
+                _list_cache = import_string(config["BACKEND"])(
+                    **config.get("OPTIONS", {})
+                )
+    return _list_cache
+
+
+def _generation_keys(order_by: str, search: str, tags: List[str]) -> List[str]:
+    """
+    Args:
+        order_by (str) : 정렬 기준
+        search (str) : 검색 키워드
+        tags (List[str]) : 필터링할 해시태그 이름들
+
+    Returns:
+        List[str] : 목록 결과가 의존하는 세대 카운터 키
+                    (태그 필터가 있으면 태그+정렬별, 없으면 정렬별 + 검색어가 있으면 검색)
+    """
+    if tags:
+        keys = [f"posts:gen:tag:{tag}:{order_by}" for tag in tags]
+    else:
+        keys = [f"posts:gen:sort:{order_by}"]
+    if search:
+        keys.append("posts:gen:search")
+    return keys
+
+
+def normalize_tags(tags: str) -> List[str]:
+    """
+    Args:
+        tags (str) : 필터링할 해시태그 /예시)"서울,#맛집"
+
+    Returns:
+        List[str] : 중복과 '#'을 제거하고 정렬한 해시태그 이름들
+    """
+    return sorted({tag.strip().lstrip("#") for tag in tags.split(",")} - {""})
+
+
+def _cache_key(prefix: str, params: Dict) -> str:
+    digest = hashlib.sha1(
+        json.dumps(params, sort_keys=True, ensure_ascii=False).encode()
+    ).hexdigest()
+    return prefix + digest
+
+
+def _current_generations(params: Dict) -> List:
+    list_cache = get_list_cache()
+    generations = list_cache.get_generations(
+        _generation_keys(
+            params["order_by"], params["search"], normalize_tags(params["tags"])
+        )
+    )
+    return sorted(generations.items())
+
+
+def get_or_set_post_list(params: Dict, loader: Callable[[], Dict]) -> Dict:
+    """
+    Args:
+        params (Dict) : {
+            "order_by", "reverse", "search", "tags", "tags_mode", "page_size", "page"
+        } 게시글 목록 조회 조건
+        loader (Callable) : 캐시에 없을 때 한 페이지를 조회하는 함수
+
+    Returns:
+        Dict : loader 결과 ({"post_ids" : 한 페이지의 게시글 id들, "has_next" : 다음 페이지 여부})
+               게시글 내용은 캐시하지 않고 id로 매번 다시 읽어 좋아요/조회수가 최신값
+    """
+    list_cache = get_list_cache()
+    key = _post_list_key(params)
+
+    # primary 에 고정된 요청(read-your-writes)은 캐시를 읽지 않고 primary 에서 읽는다
+    page = None if is_pinned() else list_cache.get(key)
+    record_cache("list", page is not None, page is None)
+    if page is None:
+        page = loader()
+        # 복제가 늦은 replica 의 결과가 새 세대로 저장되지 않도록 primary 에서 읽은 결과만 저장한다
+        if not reads_from_replica():
+            # 커밋되지 않은 데이터가 다른 요청에 보이지 않도록 커밋 이후에 저장한다
+            transaction.on_commit(lambda: list_cache.set(key, page))
+    return page
+
+
+async def aget_or_set_post_list(
+    params: Dict, loader: Callable[[], Awaitable[Dict]]
+) -> Dict:
+    """
+    get_or_set_post_list 의 async 버전 (async view 용)
+    async 코드는 트랜잭션 안에서 실행되지 않으므로(autocommit) 조회한 값을 바로 저장한다.
+
+    Args:
+        params (Dict) : 게시글 목록 조회 조건 (get_or_set_post_list 와 같음)
+        loader (Callable) : 캐시에 없을 때 한 페이지를 조회하는 coroutine 함수
+
+    Returns:
+        Dict : {"post_ids" : 한 페이지의 게시글 id들, "has_next" : 다음 페이지 여부}
+    """
+    list_cache = get_list_cache()
+    key = _post_list_key(params)
+
+    page = None if is_pinned() else list_cache.get(key)
+    record_cache("list", page is not None, page is None)
+    if page is None:
+        page = await loader()
+        if not reads_from_replica():
+            list_cache.set(key, page)
+    return page
+
+
+def _post_list_key(params: Dict) -> str:
+    normalized = dict(
+        params,
+        tags=normalize_tags(params["tags"]),
+        generations=_current_generations(params),
+    )
+    return _cache_key("posts:list:", normalized)
+
+
+_refreshing_counts = set()
+_refreshing_counts_lock = threading.Lock()
+
+
+def _refresh_count_in_background(key: str, counter: Callable[[], int], generations):
+    with _refreshing_counts_lock:
+        if key in _refreshing_counts:
+            return
+        _refreshing_counts.add(key)
+
+    def refresh():
+        try:
+            get_list_cache().set(
+                key,
+                {"count": counter(), "generations": generations, "at": time.time()},
+            )
+        except DatabaseError:
+            logger.exception("post count refresh failed")
+        finally:
+            connections.close_all()
+            with _refreshing_counts_lock:
+                _refreshing_counts.discard(key)
+
+    threading.Thread(target=refresh, name="post-count-refresh", daemon=True).start()
+
+
+def get_or_set_post_count(
+    params: Dict, counter: Callable[[], int], exact: bool = False
+) -> int:
+    """
+    조회 조건별 전체 게시글 수를 캐시한다. 캐시가 오래되었거나(COUNT_REFRESH_INTERVAL)
+    세대 카운터가 바뀐 경우에는 기존 값을 바로 반환하고 백그라운드에서 다시 센다. (백그라운드 thread 는 primary 에서 센다)
+    primary 에 고정된 요청은 캐시를 읽지 않고, replica 에서 센 값은 캐시에 저장하지 않는다.
+
+    Args:
+        params (Dict) : {"order_by", "reverse", "search", "tags", "tags_mode"} 게시글 목록 조회 조건
+        counter (Callable) : 실제 COUNT(*) 를 실행하는 함수
+        exact (bool) : True 이면 캐시를 쓰지 않고 바로 세어 캐시를 갱신한다
+
+    Returns:
+        int : 조회 조건에 맞는 전체 게시글 수 (exact 가 아니면 근사값일 수 있음)
+    """
+    list_cache = get_list_cache()
+    key = _post_count_key(params)
+    generations = _current_generations(params)
+
+    cached = None if exact or is_pinned() else list_cache.get(key)
+    record_cache("count", cached is not None, cached is None)
+    if cached is None:
+        count = counter()
+        if not reads_from_replica():
+            value = {"count": count, "generations": generations, "at": time.time()}
+            transaction.on_commit(lambda: list_cache.set(key, value))
+        return count
+    if _is_count_stale(cached, generations):
+        _refresh_count_in_background(key, counter, generations)
+    return cached["count"]
+
+
+async def aget_or_set_post_count(
+    params: Dict, load_posts: Callable[[], Awaitable], exact: bool = False
+) -> int:
+    """
+    get_or_set_post_count 의 async 버전 (async view 용)
+    처음 셀 때는 QuerySet.acount() 로 세고, 백그라운드 갱신은 sync 버전과 같이 thread 에서 센다.
+    캐시가 있고 오래되지 않았으면 load_posts 를 호출하지 않아 DB 를 읽지 않는다.
+
+    Args:
+        params (Dict) : {"order_by", "reverse", "search", "tags", "tags_mode"} 게시글 목록 조회 조건
+        load_posts (Callable) : 정렬,검색,태그필터링이 된 게시글 QuerySet 을 만드는 async 함수
+        exact (bool) : True 이면 캐시를 쓰지 않고 바로 세어 캐시를 갱신한다
+
+    Returns:
+        int : 조회 조건에 맞는 전체 게시글 수 (exact 가 아니면 근사값일 수 있음)
+    """
+    list_cache = get_list_cache()
+    key = _post_count_key(params)
+    generations = _current_generations(params)
+
+    cached = None if exact or is_pinned() else list_cache.get(key)
+    record_cache("count", cached is not None, cached is None)
+    if cached is None:
+        count = await (await load_posts()).acount()
+        if not reads_from_replica():
+            list_cache.set(
+                key, {"count": count, "generations": generations, "at": time.time()}
+            )
+        return count
+    if _is_count_stale(cached, generations):
+        _refresh_count_in_background(key, (await load_posts()).count, generations)
+    return cached["count"]
+
+
+def _post_count_key(params: Dict) -> str:
+    normalized = {
+        "order_by": params["order_by"],
+        "search": params["search"],
+        "tags": normalize_tags(params["tags"]),
+        "tags_mode": params["tags_mode"],
+    }
+    return _cache_key("posts:count:", normalized)
+
+
+def _is_count_stale(cached: Dict, generations: List) -> bool:
+    config = getattr(settings, "POSTS_LIST_CACHE", None) or DEFAULT_LIST_CACHE
+    refresh_interval = config.get("COUNT_REFRESH_INTERVAL", 30)
+    return (
+        cached["generations"] != generations
+        or time.time() - cached["at"] > refresh_interval
+    )
+
+
+def invalidate_post_lists(
+    tags: Iterable[str],
+    sorts: Iterable[str] = LIST_SORTS,
+    search: bool = False,
+    unfiltered: bool = True,
+) -> None:
+    """
+    Args:
+        tags (Iterable[str]) : 포함 여부나 순서가 바뀐 게시글의 해시태그 이름들
+        sorts (Iterable[str]) : 순서나 포함 여부가 바뀔 수 있는 정렬 기준들
+        search (bool) : 제목/내용이 바뀌어 검색 결과가 바뀔 수 있는지 여부
+        unfiltered (bool) : 태그 필터가 없는 목록도 바뀌는지 여부
+
+    Returns:
+        None : 해당 범위의 세대 카운터를 커밋 이후에 1씩 올린다
+    """
+    sorts = list(sorts)
+    keys = [f"posts:gen:tag:{tag}:{sort}" for tag in set(tags) for sort in sorts]
+    if unfiltered:
+        keys += [f"posts:gen:sort:{sort}" for sort in sorts]
+    if search:
+        keys.append("posts:gen:search")
+    if keys:
+        list_cache = get_list_cache()
+        transaction.on_commit(lambda: list_cache.incr_generations(keys))
@@ -0,0 +1,105 @@
+import datetime
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def _make_etag(*parts, weak: bool = False) -> str:
+    digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    return ("W/" if weak else "") + quote_etag(digest)
+
+
+def post_list_validators(
+    params: Dict,
+    count: int,
+    has_next: bool,
+    post_ids: List[int],
+    versions: Dict[int, Tuple[datetime.datetime, int, int]],
+    media_type: str = "",
+) -> str:
+    """
+    게시글 목록 응답의 ETag 를 게시글 row 를 읽지 않고 만든다.
+    응답 내용은 (페이지의 게시글 id, updated_date, 조회수, 좋아요 수) 와 전체 게시글 수로 정해지므로 이 값들만 사용한다.
+    좋아요로 순서가 바뀌거나 완전삭제로 페이지의 게시글이 바뀌어도 updated_date 는 그대로이므로
+    목록에는 Last-Modified 를 두지 않는다 (If-Modified-Since 만 보내는 client 가 바뀐 목록을 304 로 받지 않도록).
+
+    Args:
+        params (Dict) : 정렬,검색,태그필터링,페이징 조건
+        count (int) : 조건에 맞는 전체 게시글 수
+        has_next (bool) : 다음 페이지 여부
+        post_ids (List[int]) : 페이지의 게시글 PK (순서대로)
+        versions (Dict) : read_post_versions 로 읽은 {게시글 id : (updated_date, 조회수, 좋아요 수)}
+        media_type (str) : 응답 형식 (JSON / Browsable API 의 ETag 를 구분)
+
+    Returns:
+        str : ETag
+    """
+    page = [
+        (post_id, *versions[post_id]) for post_id in post_ids if post_id in versions
+    ]
+    return _make_etag(media_type, sorted(params.items()), count, has_next, page)
+
+
+def post_detail_validators(
+    version: Tuple[int, datetime.datetime, int, int],
+    media_type: str = "",
+) -> Tuple[str, datetime.datetime]:
+    """
+    게시글 상세 응답의 ETag/Last-Modified 를 만든다.
+    조회수는 조회할 때마다 바뀌므로 넣지 않고 weak ETag 로 만든다.
+
+    Args:
+        version (Tuple) : read_detail_version 으로 읽은 (게시글 id, updated_date, 조회수, 좋아요 수)
+        media_type (str) : 응답 형식 (JSON / Browsable API 의 ETag 를 구분)
+
+    Returns:
+        Tuple[str, datetime] : (ETag, updated_date)
+    """
+    post_id, updated_date, _, like_count = version
+    etag = _make_etag(media_type, post_id, updated_date, like_count, weak=True)
+    return etag, updated_date
+
+
+def set_validator_headers(
+    response: HttpResponseBase, etag: str, last_modified: Optional[datetime.datetime]
+) -> HttpResponseBase:
+    """
+    Args:
+        response (HttpResponseBase) : 응답
+        etag (str) : ETag
+        last_modified (datetime) : 마지막 수정시간 (None 이면 Last-Modified 를 넣지 않음)
+
+    Returns:
+        HttpResponseBase : ETag/Last-Modified 헤더를 넣은 응답
+    """
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
+
+
+def get_not_modified_response(
+    request, etag: str, last_modified: Optional[datetime.datetime]
+) -> Optional[HttpResponseBase]:
+    """
+    If-None-Match 가 있으면 ETag 로, 없으면 If-Modified-Since 로 비교한다.
+
+    Args:
+        request : 요청
+        etag (str) : 현재 응답의 ETag
+        last_modified (datetime) : 현재 응답의 마지막 수정시간
+
+    Returns:
+        Optional[HttpResponseBase] : 바뀌지 않았으면 304 응답, 바뀌었으면 None
+    """
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is None:
+        return None
+    return set_validator_headers(response, etag, last_modified)
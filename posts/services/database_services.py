@@ -0,0 +1,40 @@
+from typing import Dict
+
+from django.conf import settings
+
+DEFAULT_SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 20000,
+    "mmap_size": 268435456,
+    "temp_store": "MEMORY",
+}
+
+
+def get_sqlite_pragmas() -> Dict:
+    """
+    Returns:
+        Dict : settings.SQLITE_PRAGMAS 로 덮어쓴 SQLite PRAGMA 설정 (값이 None 이면 설정하지 않음)
+    """
+    pragmas = dict(DEFAULT_SQLITE_PRAGMAS, **getattr(settings, "SQLITE_PRAGMAS", {}))
+    return {name: value for name, value in pragmas.items() if value is not None}
+
+
+def configure_sqlite_connection(sender, connection, **kwargs) -> None:
+    """
+    connection_created signal 에 연결하여 새 SQLite 연결마다 PRAGMA 를 설정한다.
+    WAL 은 읽기와 쓰기가 서로를 막지 않게 하고, busy_timeout 은 쓰기 잠금을 기다리게 하여
+    동시 좋아요/조회수 쓰기에서 "database is locked" 가 나지 않도록 한다.
+
+    Args:
+        sender : 연결의 DatabaseWrapper 클래스
+        connection (DatabaseWrapper) : 새로 만들어진 연결
+
+    Returns:
+        None
+    """
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        for name, value in get_sqlite_pragmas().items():
+            cursor.execute(f"PRAGMA {name} = {value}")
@@ -0,0 +1,191 @@
+import csv
+import datetime
+import json
+from typing import Dict, Iterator, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from posts.models import Post
+
+DEFAULT_EXPORT = {"CHUNK_SIZE": 2000}
+
+EXPORT_FIELDS = [
+    "id",
+    "writer",
+    "title",
+    "content",
+    "tags",
+    "views",
+    "likes",
+    "created_date",
+    "updated_date",
+    "is_active",
+]
+
+BOOLEAN_VALUES = {"1": True, "true": True, "0": False, "false": False}
+
+
+def get_export_chunk_size() -> int:
+    """
+    Returns:
+        int : settings.POSTS_EXPORT 의 CHUNK_SIZE (없으면 기본값)
+    """
+    return {**DEFAULT_EXPORT, **getattr(settings, "POSTS_EXPORT", {})}["CHUNK_SIZE"]
+
+
+def parse_since(since: str) -> datetime.datetime:
+    """
+    Args:
+        since (str) : 작성일 기준 /예시)"2022-10-16" 또는 "2022-10-16T08:00:00"
+
+    Returns:
+        datetime : since 를 timezone 이 있는 datetime 으로 바꾼 값
+
+    Raises:
+        ValueError : 날짜 형식이 아닐 경우
+    """
+    value = parse_datetime(since)
+    if value is None:
+        date = parse_date(since)
+        if date is None:
+            raise ValueError("since must be an ISO 8601 date or datetime")
+        value = datetime.datetime.combine(date, datetime.time())
+    if settings.USE_TZ and timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def parse_is_active(is_active: str) -> bool:
+    """
+    Args:
+        is_active (str) : "1"/"true" 또는 "0"/"false"
+
+    Returns:
+        bool : 활성화 여부
+
+    Raises:
+        ValueError : 위 값이 아닐 경우
+    """
+    try:
+        return BOOLEAN_VALUES[is_active.lower()]
+    except KeyError:
+        raise ValueError("is_active must be one of 1, 0, true, false")
+
+
+def read_export_posts(
+    since: Optional[datetime.datetime] = None, is_active: Optional[bool] = None
+) -> Post:
+    """
+    Args:
+        since (datetime) : 이 시각 이후(포함)에 작성된 게시글만 (None 이면 전체)
+        is_active (bool) : 활성화 여부가 같은 게시글만 (None 이면 전체)
+
+    Returns:
+        Post : id 순으로 정렬된 내보낼 게시글의 QuerySet (해시태그 prefetch)
+    """
+    posts = Post.objects.prefetch_related("tags").order_by("id")
+    if since is not None:
+        posts = posts.filter(created_date__gte=since)
+    if is_active is not None:
+        posts = posts.filter(is_active=is_active)
+    return posts
+
+
+def iter_export_rows(posts: Post, chunk_size: int) -> Iterator[Dict]:
+    """
+    iterator(chunk_size) 로 chunk_size 개씩 읽고 chunk 마다 해시태그를 prefetch 하므로
+    게시글 수와 관계없이 메모리에는 chunk 하나만 올라간다.
+
+    Args:
+        posts (QuerySet) : read_export_posts 로 구한 게시글
+        chunk_size (int) : 한번에 읽을 게시글 수
+
+    Returns:
+        Iterator[Dict] : EXPORT_FIELDS 의 값을 담은 게시글 1개씩
+    """
+    for post in posts.iterator(chunk_size=chunk_size):
+        yield {
+            "id": post.id,
+            "writer": post.writer_id,
+            "title": post.title,
+            "content": post.content,
+            "tags": ["#" + tag.name for tag in post.tags.all()],
+            "views": post.views,
+            "likes": post.like_count,
+            "created_date": post.created_date,
+            "updated_date": post.updated_date,
+            "is_active": post.is_active,
+        }
+
+
+def iter_ndjson(rows: Iterator[Dict]) -> Iterator[str]:
+    """
+    Args:
+        rows (Iterator[Dict]) : iter_export_rows 의 게시글
+
+    Returns:
+        Iterator[str] : 게시글 1개당 JSON 한 줄
+    """
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+
+
+class _LineBuffer:
+    """
+    csv.writer 가 쓴 한 줄을 그대로 돌려주는 file 대용 객체
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_csv(rows: Iterator[Dict]) -> Iterator[str]:
+    """
+    Args:
+        rows (Iterator[Dict]) : iter_export_rows 의 게시글
+
+    Returns:
+        Iterator[str] : 헤더 한 줄 + 게시글 1개당 CSV 한 줄 (tags 는 "#맛집,#서울" 형식)
+    """
+    writer = csv.writer(_LineBuffer())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        row["tags"] = ",".join(row["tags"])
+        row["created_date"] = row["created_date"].isoformat()
+        row["updated_date"] = row["updated_date"].isoformat()
+        yield writer.writerow([row[field] for field in EXPORT_FIELDS])
+
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", iter_ndjson),
+    "csv": ("text/csv", iter_csv),
+}
+
+
+def export_posts(
+    export_format: str,
+    since: Optional[datetime.datetime] = None,
+    is_active: Optional[bool] = None,
+    chunk_size: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Args:
+        export_format (str) : "ndjson" 또는 "csv"
+        since (datetime) : 이 시각 이후(포함)에 작성된 게시글만
+        is_active (bool) : 활성화 여부가 같은 게시글만
+        chunk_size (int) : 한번에 읽을 게시글 수 (None 이면 settings.POSTS_EXPORT)
+
+    Returns:
+        Iterator[str] : 내보낼 게시글을 export_format 으로 한 줄씩
+
+    Raises:
+        ValueError : export_format 이 "ndjson", "csv" 가 아닐 경우
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError("export format must be 'ndjson' or 'csv'")
+    posts = read_export_posts(since, is_active)
+    rows = iter_export_rows(posts, chunk_size or get_export_chunk_size())
+    return EXPORT_FORMATS[export_format][1](rows)
@@ -0,0 +1,149 @@
+import datetime
+import threading
+from typing import Awaitable, Callable, Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from posts.renderers import PostFragmentJSONRenderer
+from posts.services.timing_services import record_cache, timed
+
+DEFAULT_FRAGMENT_CACHE = {
+    "BACKEND": "posts.services.cache_services.LRUCacheBackend",
+    "OPTIONS": {"max_size": 10000, "timeout": 3600},
+}
+
+FRAGMENT_KINDS = {"list": "likes", "detail": "like_count"}
+
+fragment_renderer = PostFragmentJSONRenderer()
+
+_fragment_cache = None
+_fragment_cache_lock = threading.Lock()
+
+
+def get_fragment_cache():
+    """
+    Returns:
+        LRUCacheBackend | DjangoCacheBackend : settings.POSTS_FRAGMENT_CACHE 로 만든 게시글 JSON 조각 캐시
+    """
+    global _fragment_cache
+    if _fragment_cache is None:
+        with _fragment_cache_lock:
+            if _fragment_cache is None:
+                config = (
+                    getattr(settings, "POSTS_FRAGMENT_CACHE", None)
+                    or DEFAULT_FRAGMENT_CACHE
+                )
+                _fragment_cache = import_string(config["BACKEND"])(
+                    **config.get("OPTIONS", {})
+                )
+    return _fragment_cache
+
+
+def _fragment_key(kind: str, post_id: int) -> str:
+    return f"posts:fragment:{kind}:{post_id}"
+
+
+def get_or_set_fragments(
+    kind: str,
+    versions: Dict[int, datetime.datetime],
+    loader: Callable[[List[int]], List[Dict]],
+) -> Dict[int, Tuple[bytes, bytes, bytes]]:
+    """
+    게시글별 JSON 조각을 (게시글 id, updated_date) 기준으로 캐시한다.
+    updated_date 가 바뀐 게시글(수정/비활성화/복구)은 조각을 다시 만든다.
+
+    Args:
+        kind (str) : "list" (PostSerializer 형식) / "detail" (PostDetailSerializer 형식)
+        versions (Dict[int, datetime]) : {게시글 id : updated_date}
+        loader (Callable) : 조각이 없는 게시글 id 들로 serializer 형식의 게시글 목록을 만드는 함수
+
+    Returns:
+        Dict[int, Tuple[bytes, bytes, bytes]] : {게시글 id : 조회수/좋아요 수를 뺀 JSON 조각}
+    """
+    fragment_cache = get_fragment_cache()
+    fragments, missing_ids = _get_cached_fragments(kind, versions)
+    if not missing_ids:
+        return fragments
+
+    new_items = _build_fragments(kind, versions, loader(missing_ids), fragments)
+    # 커밋되지 않은 데이터가 다른 요청에 보이지 않도록 커밋 이후에 저장한다
+    transaction.on_commit(lambda: fragment_cache.set_many(new_items))
+    return fragments
+
+
+async def aget_or_set_fragments(
+    kind: str,
+    versions: Dict[int, datetime.datetime],
+    loader: Callable[[List[int]], Awaitable[List[Dict]]],
+) -> Dict[int, Tuple[bytes, bytes, bytes]]:
+    """
+    get_or_set_fragments 의 async 버전 (async 코드는 트랜잭션 밖에서 실행되므로 만든 조각을 바로 저장한다)
+
+    Args:
+        kind (str) : "list" / "detail"
+        versions (Dict[int, datetime]) : {게시글 id : updated_date}
+        loader (Callable) : 조각이 없는 게시글 id 들로 serializer 형식의 게시글 목록을 만드는 coroutine 함수
+
+    Returns:
+        Dict[int, Tuple[bytes, bytes, bytes]] : {게시글 id : 조회수/좋아요 수를 뺀 JSON 조각}
+    """
+    fragments, missing_ids = _get_cached_fragments(kind, versions)
+    if missing_ids:
+        new_items = _build_fragments(
+            kind, versions, await loader(missing_ids), fragments
+        )
+        get_fragment_cache().set_many(new_items)
+    return fragments
+
+
+def _get_cached_fragments(
+    kind: str, versions: Dict[int, datetime.datetime]
+) -> Tuple[Dict[int, Tuple[bytes, bytes, bytes]], List[int]]:
+    keys = {post_id: _fragment_key(kind, post_id) for post_id in versions}
+    cached = get_fragment_cache().get_many(keys.values())
+
+    fragments = {}
+    missing_ids = []
+    for post_id, version in versions.items():
+        item = cached.get(keys[post_id])
+        if item is not None and item[0] == version:
+            fragments[post_id] = item[1]
+        else:
+            missing_ids.append(post_id)
+    record_cache("fragment", len(fragments), len(missing_ids))
+    return fragments, missing_ids
+
+
+def _build_fragments(
+    kind: str,
+    versions: Dict[int, datetime.datetime],
+    posts: List[Dict],
+    fragments: Dict[int, Tuple[bytes, bytes, bytes]],
+) -> Dict[str, Tuple]:
+    # 새로 만든 조각을 fragments 에 넣고, 캐시에 저장할 {키 : (updated_date, 조각)} 을 반환한다
+    new_items = {}
+    with timed("serialize"):
+        for post in posts:
+            fragment = fragment_renderer.build_fragment(post, FRAGMENT_KINDS[kind])
+            fragments[post["id"]] = fragment
+            new_items[_fragment_key(kind, post["id"])] = (
+                versions[post["id"]],
+                fragment,
+            )
+    return new_items
+
+
+def evict_post_fragments(post_ids: Iterable[int]) -> None:
+    """
+    Args:
+        post_ids (Iterable[int]) : 작성/수정/비활성화/복구/삭제된 게시글의 PK
+
+    Returns:
+        None : 커밋 이후 해당 게시글의 목록/상세 JSON 조각을 캐시에서 지운다
+    """
+    keys = [
+        _fragment_key(kind, post_id) for post_id in post_ids for kind in FRAGMENT_KINDS
+    ]
+    transaction.on_commit(lambda: get_fragment_cache().delete_many(keys))
@@ -0,0 +1,156 @@
+import datetime
+import math
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Expression, F
+from django.db.models.functions import Ln
+from django.utils import timezone
+
+DEFAULT_HOT_SCORE = {
+    "HALF_LIFE_HOURS": 24,
+    "POST_WEIGHT": 1.0,
+    "LIKE_WEIGHT": 1.0,
+    "VIEW_WEIGHT": 0.1,
+    "EPOCH": datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc),
+    "CHUNK_SIZE": 5000,
+    "TOLERANCE": 1e-6,
+}
+
+
+def get_hot_score_options() -> Dict:
+    """
+    Returns:
+        Dict : settings.POSTS_HOT_SCORE 를 기본값과 합친 설정
+               ({"HALF_LIFE_HOURS", "POST_WEIGHT", "LIKE_WEIGHT", "VIEW_WEIGHT", "EPOCH", "CHUNK_SIZE", "TOLERANCE"})
+    """
+    return {**DEFAULT_HOT_SCORE, **getattr(settings, "POSTS_HOT_SCORE", {})}
+
+
+def _engagement(options: Dict, like_count, views):
+    # 숫자와 F() 식에 모두 쓸 수 있도록 연산자만 사용한다
+    return (
+        options["POST_WEIGHT"]
+        + options["LIKE_WEIGHT"] * like_count
+        + options["VIEW_WEIGHT"] * views
+    )
+
+
+def _decay_rate(options: Dict) -> float:
+    return math.log(2) / (options["HALF_LIFE_HOURS"] * 3600)
+
+
+def _age_seconds(created_date: datetime.datetime, epoch: datetime.datetime) -> float:
+    if timezone.is_naive(created_date):
+        created_date = timezone.make_aware(created_date)
+    return (created_date - epoch).total_seconds()
+
+
+def hot_score(created_date: datetime.datetime, like_count: int, views: int) -> float:
+    """
+    hot_score = ln(게시글 가중치 + 좋아요 가중치 x 좋아요 수 + 조회 가중치 x 조회수) + (작성시간 - EPOCH) x ln2 / 반감기
+    모든 게시글의 점수에서 같은 현재 시각 항을 빼면 (참여도 x 0.5^(게시글 나이 / 반감기)) 의 log 이므로,
+    시간이 지나도 저장된 점수를 다시 계산하지 않고 점수 순서가 곧 지금의 hot 순서가 된다.
+
+    Args:
+        created_date (datetime) : 게시글 작성시간
+        like_count (int) : 좋아요 수
+        views (int) : 조회수
+
+    Returns:
+        float : 게시글의 hot 점수
+    """
+    options = get_hot_score_options()
+    age = _age_seconds(created_date, options["EPOCH"])
+    return math.log(_engagement(options, like_count, views)) + age * _decay_rate(
+        options
+    )
+
+
+def initial_hot_score() -> float:
+    """
+    Returns:
+        float : 지금 작성한 (좋아요/조회수가 없는) 게시글의 hot 점수 (Post.hot_score 기본값)
+    """
+    return hot_score(timezone.now(), 0, 0)
+
+
+def hot_score_change(
+    like_count: Optional[Expression] = None, views: Optional[Expression] = None
+) -> Expression:
+    """
+    좋아요 수/조회수를 바꾸는 UPDATE 에 같이 넣어 hot_score 를 ln(바뀐 참여도) - ln(이전 참여도) 만큼 바꾸는 식
+    (SET 의 오른쪽은 UPDATE 이전 값을 읽으므로 row 를 따로 읽지 않는다)
+
+    Args:
+        like_count (Expression) : 바뀐 좋아요 수 식 /예시) Greatest(F("like_count") + 1, 0) (없으면 그대로)
+        views (Expression) : 바뀐 조회수 식 /예시) F("views") + 3 (없으면 그대로)
+
+    Returns:
+        Expression : update(hot_score=...) 에 넘길 식
+    """
+    options = get_hot_score_options()
+    before = _engagement(options, F("like_count"), F("views"))
+    after = _engagement(
+        options,
+        F("like_count") if like_count is None else like_count,
+        F("views") if views is None else views,
+    )
+    return F("hot_score") + Ln(after) - Ln(before)
+
+
+def rescore_posts(
+    model,
+    using: str = DEFAULT_DB_ALIAS,
+    chunk_size: Optional[int] = None,
+    post_ids: Optional[Iterable[int]] = None,
+) -> int:
+    """
+    전체(또는 post_ids) 게시글의 hot_score 를 id 순으로 chunk_size 개씩 읽어 열(작성시간/좋아요 수/조회수) 단위로 다시 계산하고,
+    저장된 값과 TOLERANCE 보다 차이가 나는 row 만 chunk 마다 bulk_update 한다.
+    (설정을 바꾸었거나 like_count/views 를 직접 고친 경우의 보정용, 어긋난 게 없으면 읽기만 한다)
+
+    Args:
+        model (Model) : Post 모델 (migration 에서는 historical 모델)
+        using (str) : DB alias
+        chunk_size (int) : 한번에 읽고 저장하는 게시글 수 (없으면 settings.POSTS_HOT_SCORE["CHUNK_SIZE"])
+        post_ids (Iterable[int]) : 다시 계산할 게시글들의 PK (없으면 전체)
+
+    Returns:
+        int : hot_score 가 바뀐 게시글 수
+    """
+    options = get_hot_score_options()
+    chunk_size = chunk_size or options["CHUNK_SIZE"]
+    decay_rate = _decay_rate(options)
+    epoch = options["EPOCH"]
+    posts = model.objects.using(using).order_by("id")
+    if post_ids is not None:
+        posts = posts.filter(id__in=list(post_ids))
+    fields = ("id", "created_date", "like_count", "views", "hot_score")
+    changed = 0
+    last_id = 0
+    while True:
+        rows = list(posts.filter(id__gt=last_id).values_list(*fields)[:chunk_size])
+        if not rows:
+            return changed
+        last_id = rows[-1][0]
+        ids, created_dates, like_counts, views, scores = zip(*rows)
+        ages = [_age_seconds(created_date, epoch) for created_date in created_dates]
+        engagements = [
+            _engagement(options, like_count, view)
+            for like_count, view in zip(like_counts, views)
+        ]
+        new_scores = [
+            math.log(engagement) + age * decay_rate
+            for engagement, age in zip(engagements, ages)
+        ]
+        drifted = [
+            model(id=post_id, hot_score=new_score)
+            for post_id, score, new_score in zip(ids, scores, new_scores)
+            if abs(score - new_score) > options["TOLERANCE"]
+        ]
+        if drifted:
+            with transaction.atomic(using=using):
+                model.objects.using(using).bulk_update(drifted, ["hot_score"])
+            changed += len(drifted)
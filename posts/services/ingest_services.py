@@ -0,0 +1,163 @@
+import json
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+
+from posts.models import Post, PostTag, TagName
+from posts.serializers import PostIngestSerializer
+from posts.services.cache_services import invalidate_post_lists
+from posts.services.search_services import get_search_backend
+from posts.services.tag_services import parse_tags, resolve_tag_ids
+from users.models import User
+
+DEFAULT_BULK_INGEST = {"CHUNK_SIZE": 500, "MAX_ERRORS": 1000, "MAX_LINE_SIZE": 65536}
+
+TAG_NAME_MAX_LENGTH = TagName._meta.get_field("name").max_length
+
+
+def get_ingest_options() -> Dict[str, int]:
+    """
+    Returns:
+        Dict[str, int] : settings.POSTS_BULK_INGEST 에 기본값을 채운 설정
+    """
+    return {**DEFAULT_BULK_INGEST, **getattr(settings, "POSTS_BULK_INGEST", {})}
+
+
+def iter_ndjson_lines(stream, max_line_size: int) -> Iterator[Tuple[int, bytes]]:
+    """
+    Args:
+        stream : readline(size) 를 지원하는 요청 본문 (HttpRequest 등)
+        max_line_size (int) : 한 줄의 최대 바이트 수
+
+    Returns:
+        Iterator[Tuple[int, bytes]] : (줄 번호, 줄) / 빈 줄은 건너뛰고, 너무 긴 줄은 끝까지 버린 뒤 b"" 로 반환
+    """
+    line_number = 0
+    while True:
+        line = stream.readline(max_line_size + 1)
+        if not line:
+            return
+        line_number += 1
+        if len(line) > max_line_size and not line.endswith(b"\n"):
+            while line and not line.endswith(b"\n"):
+                line = stream.readline(max_line_size + 1)
+            yield line_number, b""
+            continue
+        if line.strip():
+            yield line_number, line
+
+
+def _validate_row(line: bytes) -> Tuple[Dict, List[str], Dict]:
+    """
+    Args:
+        line (bytes) : NDJSON 한 줄
+
+    Returns:
+        Tuple[Dict, List[str], Dict] : (검증된 게시글 데이터, 해시태그 이름들, 에러) / 에러가 있으면 데이터는 None
+    """
+    if not line:
+        return None, [], {"detail": "한 줄의 크기가 너무 큽니다"}
+    try:
+        row = json.loads(line)
+    except ValueError:
+        return None, [], {"detail": "JSON 형식이 아닙니다"}
+    if not isinstance(row, dict):
+        return None, [], {"detail": "JSON 객체가 아닙니다"}
+
+    tags = row.get("tags", "")
+    if not isinstance(tags, str):
+        return None, [], {"tags": ["문자열이어야 합니다"]}
+    tag_names = parse_tags(tags)
+    if any(len(tag_name) > TAG_NAME_MAX_LENGTH for tag_name in tag_names):
+        return None, [], {"tags": [f"해시태그는 {TAG_NAME_MAX_LENGTH}자 이하여야 합니다"]}
+
+    serializer = PostIngestSerializer(data=row)
+    if not serializer.is_valid():
+        return None, [], serializer.errors
+    return serializer.validated_data, tag_names, None
+
+
+def _write_chunk(rows: List[Tuple[int, Dict, List[str]]], user: User) -> List[str]:
+    """
+    Args:
+        rows (List[Tuple[int, Dict, List[str]]]) : 검증된 (줄 번호, 게시글 데이터, 해시태그 이름들)
+        user (User) : 게시글 작성자
+
+    Returns:
+        List[str] : 작성된 게시글들의 해시태그 이름들
+    """
+    tag_names = list(dict.fromkeys(name for _, _, names in rows for name in names))
+    with transaction.atomic():
+        posts = Post.objects.bulk_create(
+            [Post(writer=user, **validated_data) for _, validated_data, _ in rows]
+        )
+        tag_ids = resolve_tag_ids(tag_names)
+        PostTag.objects.bulk_create(
+            [
+                PostTag(posts_id=post.id, tags_id=tag_ids[name])
+                for post, (_, _, names) in zip(posts, rows)
+                for name in names
+            ]
+        )
+    search_backend = get_search_backend()
+    for post in posts:
+        search_backend.update_post(post)
+    return tag_names
+
+
+def ingest_posts(
+    lines: Iterable[Tuple[int, bytes]],
+    user: User,
+    chunk_size: int = 500,
+    max_errors: int = 1000,
+) -> Dict:
+    """
+    NDJSON 한 줄을 게시글 1개로 보고 chunk_size 줄씩 검증한 뒤,
+    게시글/해시태그/posts_tags 를 chunk 마다 bulk_create 로 한 트랜잭션에 작성한다.
+    잘못된 줄은 에러로 기록하고 건너뛰므로 나머지 줄은 계속 작성된다.
+
+    Args:
+        lines (Iterable[Tuple[int, bytes]]) : iter_ndjson_lines 로 읽은 (줄 번호, 줄)
+        user (User) : 로그인이 되어있는 작성자
+        chunk_size (int) : 한 트랜잭션에 작성할 줄 수
+        max_errors (int) : 응답에 담을 에러의 최대 개수 (실패 수는 모두 센다)
+
+    Returns:
+        Dict : {
+            "created" : 작성된 게시글 수,
+            "failed" : 실패한 줄 수,
+            "errors" : [{"line" : 줄 번호, "errors" : 에러 내용}, ...]
+            }
+    """
+    result = {"created": 0, "failed": 0, "errors": []}
+
+    def add_error(line_number, errors):
+        result["failed"] += 1
+        if len(result["errors"]) < max_errors:
+            result["errors"].append({"line": line_number, "errors": errors})
+
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            break
+        rows = []
+        for line_number, line in chunk:
+            validated_data, tag_names, errors = _validate_row(line)
+            if errors is None:
+                rows.append((line_number, validated_data, tag_names))
+            else:
+                add_error(line_number, errors)
+        if not rows:
+            continue
+        try:
+            tag_names = _write_chunk(rows, user)
+        except DatabaseError:
+            for line_number, _, _ in rows:
+                add_error(line_number, {"detail": "게시글을 저장하지 못했습니다"})
+            continue
+        result["created"] += len(rows)
+        invalidate_post_lists(tag_names)
+    return result
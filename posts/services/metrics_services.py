@@ -0,0 +1,424 @@
+import glob
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+DEFAULT_METRICS = {
+    "ENABLED": False,
+    "DIRECTORY": os.path.join(tempfile.gettempdir(), "goals-metrics"),
+}
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+METRIC_FAMILIES = {
+    "goals_http_requests_total": (
+        "counter",
+        "HTTP responses by view, method and status code",
+    ),
+    "goals_http_request_duration_seconds": (
+        "histogram",
+        "HTTP request latency by view and method",
+    ),
+    "goals_db_queries_total": ("counter", "SQL queries executed by view and method"),
+    "goals_cache_requests_total": ("counter", "Cache lookups by cache and result"),
+    "goals_cache_hit_ratio": (
+        "gauge",
+        "Cache hits / lookups since the workers started",
+    ),
+    "goals_view_count_pending_posts": (
+        "gauge",
+        "Posts with view counts buffered but not yet written",
+    ),
+    "goals_view_count_pending_views": (
+        "gauge",
+        "Views buffered but not yet written",
+    ),
+    "goals_view_count_flushed_total": (
+        "counter",
+        "Views written by the view count buffer",
+    ),
+    "goals_view_count_flushes_total": ("counter", "View count buffer flushes"),
+}
+
+VIEW_COUNT_METRICS = {
+    "pending_posts": "goals_view_count_pending_posts",
+    "pending_views": "goals_view_count_pending_views",
+    "flushed_views": "goals_view_count_flushed_total",
+    "flush_count": "goals_view_count_flushes_total",
+}
+
+# 파일 구조 : [사용한 바이트 수(8)] + 항목 반복 [키 길이(4)][키(utf-8, 8바이트 단위로 맞춤)][값(double 8)]
+_HEADER = struct.Struct("<Q")
+_KEY_LENGTH = struct.Struct("<I")
+_VALUE = struct.Struct("<d")
+_INITIAL_SIZE = 64 * 1024
+
+
+def get_metrics_options() -> Dict:
+    """
+    Returns:
+        Dict : settings.POSTS_METRICS 를 기본값과 합친 설정 ({"ENABLED", "DIRECTORY"})
+    """
+    return {**DEFAULT_METRICS, **getattr(settings, "POSTS_METRICS", {})}
+
+
+def _padded_key(key: str) -> bytes:
+    encoded = key.encode()
+    return encoded + b" " * (-(len(encoded) + _KEY_LENGTH.size) % 8)
+
+
+def read_metric_file(path: str) -> Iterable[Tuple[str, float]]:
+    """
+    Args:
+        path (str) : worker 1개의 metric 파일 경로
+
+    Returns:
+        Iterable[Tuple[str, float]] : (metric 키, 값)
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        return
+    used = min(_HEADER.unpack_from(data, 0)[0], len(data))
+    position = _HEADER.size
+    while position < used:
+        (length,) = _KEY_LENGTH.unpack_from(data, position)
+        key_end = position + _KEY_LENGTH.size + length
+        value_at = key_end + (-(length + _KEY_LENGTH.size) % 8)
+        key = data[position + _KEY_LENGTH.size : key_end].decode()
+        yield key, _VALUE.unpack_from(data, value_at)[0]
+        position = value_at + _VALUE.size
+
+
+class MmapMetricStore:
+    """
+    process 1개가 혼자 쓰는 mmap 파일. 키는 처음 쓸 때 1번만 파일 끝에 붙이고, 이후에는 값 8바이트만 바꾼다.
+    worker 마다 파일이 따로 있어 process 사이에는 잠금이 없고, 읽을 때 모든 파일의 값을 더한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a+b")
+        if os.fstat(self._file.fileno()).st_size < _HEADER.size:
+            self._file.truncate(_INITIAL_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._used = _HEADER.unpack_from(self._map, 0)[0] or _HEADER.size
+        _HEADER.pack_into(self._map, 0, self._used)
+        self._positions = {}
+        position = _HEADER.size
+        for key, _ in read_metric_file(path):
+            length = len(_padded_key(key))
+            self._positions[key] = position + _KEY_LENGTH.size + length
+            position += _KEY_LENGTH.size + length + _VALUE.size
+
+    def increment(self, key: str, amount: float) -> None:
+        position = self._positions.get(key)
+        if position is None:
+            position = self._append(key)
+        value = _VALUE.unpack_from(self._map, position)[0]
+        _VALUE.pack_into(self._map, position, value + amount)
+
+    def set(self, key: str, value: float) -> None:
+        position = self._positions.get(key)
+        if position is None:
+            position = self._append(key)
+        _VALUE.pack_into(self._map, position, value)
+
+    def _append(self, key: str) -> int:
+        padded = _padded_key(key)
+        size = _KEY_LENGTH.size + len(padded) + _VALUE.size
+        if self._used + size > len(self._map):
+            capacity = len(self._map)
+            while self._used + size > capacity:
+                capacity *= 2
+            self._map.close()
+            self._file.truncate(capacity)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+
+        position = self._used
+        _KEY_LENGTH.pack_into(self._map, position, len(key.encode()))
+        self._map[position + _KEY_LENGTH.size : position + size - _VALUE.size] = padded
+        value_at = position + size - _VALUE.size
+        _VALUE.pack_into(self._map, value_at, 0.0)
+        # 읽는 쪽이 다 쓰지 않은 항목을 읽지 않도록 항목을 쓴 뒤에 사용한 바이트 수를 늘린다
+        self._used += size
+        _HEADER.pack_into(self._map, 0, self._used)
+        self._positions[key] = value_at
+        return value_at
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+@lru_cache(maxsize=4096)
+def metric_key(name: str, labels: Tuple[Tuple[str, str], ...] = ()) -> str:
+    return json.dumps([name, list(labels)], ensure_ascii=False)
+
+
+@lru_cache(maxsize=1024)
+def _request_keys(view: str, method: str, status: int) -> Tuple[str, ...]:
+    labels = (("method", method), ("view", view))
+    return (
+        metric_key("goals_http_requests_total", labels + (("status", str(status)),)),
+        metric_key("goals_http_request_duration_seconds_sum", labels),
+        metric_key("goals_http_request_duration_seconds_count", labels),
+        metric_key("goals_db_queries_total", labels),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _bucket_key(view: str, method: str, bucket: str) -> str:
+    return metric_key(
+        "goals_http_request_duration_seconds_bucket",
+        (("le", bucket), ("method", method), ("view", view)),
+    )
+
+
+def _bucket_label(seconds: float) -> str:
+    # 값이 들어가는 가장 작은 bucket 에만 더하고, 누적 값은 내보낼 때 만든다
+    for bound in LATENCY_BUCKETS:
+        if seconds <= bound:
+            return repr(float(bound))
+    return "+Inf"
+
+
+class MetricsRecorder:
+    """
+    현재 process 의 MmapMetricStore 에 요청 metric 을 쓴다.
+    요청 1개의 값은 process 안의 잠금 1번으로 모두 쓰고, fork 된 worker 는 자기 pid 파일을 새로 연다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._store = None
+        self._pid = None
+
+    def _get_store(self, directory: str) -> MmapMetricStore:
+        pid = os.getpid()
+        if (
+            self._store is None
+            or self._pid != pid
+            or os.path.dirname(self._store.path) != directory
+        ):
+            if self._store is not None:
+                self._store.close()
+            os.makedirs(directory, exist_ok=True)
+            self._store = MmapMetricStore(os.path.join(directory, f"metrics_{pid}.db"))
+            self._pid = pid
+        return self._store
+
+    def record_request(
+        self,
+        view: str,
+        method: str,
+        status: int,
+        seconds: float,
+        queries: int,
+        cache_counts: Optional[Dict[str, List[int]]] = None,
+    ) -> None:
+        """
+        Args:
+            view (str) : view class 이름
+            method (str) : HTTP method
+            status (int) : 응답 status code
+            seconds (float) : 응답 시간(초)
+            queries (int) : 요청에서 실행한 SQL 쿼리 수
+            cache_counts (Dict) : {캐시 이름 : [hit 수, miss 수]}
+        """
+        requests_key, sum_key, count_key, queries_key = _request_keys(
+            view, method, status
+        )
+        updates = [
+            (requests_key, 1),
+            (sum_key, seconds),
+            (count_key, 1),
+            (_bucket_key(view, method, _bucket_label(seconds)), 1),
+            (queries_key, queries),
+        ]
+        for cache, (hits, misses) in (cache_counts or {}).items():
+            if hits:
+                updates.append((_cache_key(cache, "hit"), hits))
+            if misses:
+                updates.append((_cache_key(cache, "miss"), misses))
+
+        directory = get_metrics_options()["DIRECTORY"]
+        with self._lock:
+            store = self._get_store(directory)
+            for key, amount in updates:
+                store.increment(key, amount)
+
+    def set_values(self, values: Dict[str, float]) -> None:
+        """
+        worker 가 직접 세는 값(gauge, 누적 counter)을 더하지 않고 그대로 쓴다. (/metrics 에서 worker 끼리는 더한다)
+
+        Args:
+            values (Dict[str, float]) : {metric 키 : 값}
+        """
+        directory = get_metrics_options()["DIRECTORY"]
+        with self._lock:
+            store = self._get_store(directory)
+            for key, value in values.items():
+                store.set(key, value)
+
+    def reset(self) -> None:
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+            self._store = None
+            self._pid = None
+
+
+@lru_cache(maxsize=64)
+def _cache_key(cache: str, result: str) -> str:
+    return metric_key(
+        "goals_cache_requests_total", (("cache", cache), ("result", result))
+    )
+
+
+metrics_recorder = MetricsRecorder()
+
+
+def record_view_count_stats(stats: Dict[str, int]) -> None:
+    """
+    settings.POSTS_METRICS["ENABLED"] 이면 ViewCountBuffer.stats() 를 현재 worker 의 metric 파일에 쓴다.
+
+    Args:
+        stats (Dict[str, int]) : {"pending_posts", "pending_views", "flushed_views", "flush_count"}
+    """
+    if not get_metrics_options()["ENABLED"]:
+        return
+    metrics_recorder.set_values(
+        {metric_key(name): stats[stat] for stat, name in VIEW_COUNT_METRICS.items()}
+    )
+
+
+@lru_cache(maxsize=4096)
+def _is_gauge(key: str) -> bool:
+    name = json.loads(key)[0]
+    return METRIC_FAMILIES.get(name, ("counter",))[0] == "gauge"
+
+
+def _is_worker_alive(path: str) -> bool:
+    try:
+        pid = int(os.path.basename(path)[len("metrics_") : -len(".db")])
+    except ValueError:
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def collect_metrics(directory: Optional[str] = None) -> Dict[str, float]:
+    """
+    종료된 worker(pid 가 없는 파일)의 값은 counter 만 더하고, gauge 는 지금 상태가 아니므로 뺀다.
+
+    Args:
+        directory (str) : metric 파일 폴더 (없으면 settings.POSTS_METRICS["DIRECTORY"])
+
+    Returns:
+        Dict[str, float] : 모든 worker 파일의 값을 더한 {metric 키 : 값}
+    """
+    directory = directory or get_metrics_options()["DIRECTORY"]
+    values = defaultdict(float)
+    for path in glob.glob(os.path.join(directory, "metrics_*.db")):
+        alive = _is_worker_alive(path)
+        try:
+            for key, value in read_metric_file(path):
+                if alive or not _is_gauge(key):
+                    values[key] += value
+        except (OSError, struct.error, UnicodeDecodeError):
+            continue
+    return values
+
+
+def clear_metrics(directory: Optional[str] = None) -> None:
+    """
+    Args:
+        directory (str) : metric 파일 폴더 (서버를 시작할 때 이전 실행의 파일을 지운다)
+    """
+    directory = directory or get_metrics_options()["DIRECTORY"]
+    metrics_recorder.reset()
+    for path in glob.glob(os.path.join(directory, "metrics_*.db")):
+        os.remove(path)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_sample(name: str, labels: Iterable[Tuple[str, str]], value: float) -> str:
+    label_text = ",".join(f'{key}="{_escape(text)}"' for key, text in labels)
+    if label_text:
+        name = f"{name}{{{label_text}}}"
+    return f"{name} {int(value) if value.is_integer() else repr(value)}"
+
+
+def render_metrics(values: Dict[str, float]) -> str:
+    """
+    Args:
+        values (Dict[str, float]) : collect_metrics 로 모은 값
+
+    Returns:
+        str : Prometheus text format (0.0.4)
+    """
+    samples = defaultdict(list)
+    buckets = defaultdict(dict)
+    cache_counts = defaultdict(lambda: {"hit": 0.0, "miss": 0.0})
+    for key, value in values.items():
+        name, labels = json.loads(key)
+        labels = [tuple(label) for label in labels]
+        if name == "goals_http_request_duration_seconds_bucket":
+            le = dict(labels)["le"]
+            other_labels = tuple(label for label in labels if label[0] != "le")
+            buckets[other_labels][le] = value
+            continue
+        if name == "goals_cache_requests_total":
+            label_map = dict(labels)
+            cache_counts[label_map["cache"]][label_map["result"]] += value
+        samples[name].append((labels, value))
+
+    histogram = "goals_http_request_duration_seconds"
+    for other_labels, counts in sorted(buckets.items()):
+        cumulative = 0.0
+        for bound in [repr(float(bound)) for bound in LATENCY_BUCKETS] + ["+Inf"]:
+            cumulative += counts.get(bound, 0.0)
+            samples[f"{histogram}_bucket"].append(
+                ([*other_labels, ("le", bound)], cumulative)
+            )
+    for cache, counts in sorted(cache_counts.items()):
+        lookups = counts["hit"] + counts["miss"]
+        samples["goals_cache_hit_ratio"].append(
+            ([("cache", cache)], counts["hit"] / lookups if lookups else 0.0)
+        )
+
+    lines = []
+    for family, (metric_type, help_text) in METRIC_FAMILIES.items():
+        names = (
+            [f"{family}_bucket", f"{family}_sum", f"{family}_count"]
+            if metric_type == "histogram"
+            else [family]
+        )
+        if not any(samples.get(name) for name in names):
+            continue
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {metric_type}")
+        for name in names:
+            # bucket 은 label 별로 le 순서대로 만들었으므로 그대로 내보낸다
+            rows = samples.get(name, [])
+            if not name.endswith("_bucket"):
+                rows = sorted(rows)
+            lines.extend(_format_sample(name, labels, value) for labels, value in rows)
+    return "\n".join(lines) + "\n"
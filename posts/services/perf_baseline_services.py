@@ -0,0 +1,114 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+DEFAULT_PERF_BASELINE = {
+    "PATH": os.path.join(settings.BASE_DIR, "perf_baseline.json"),
+    "TESTS": ["posts.tests.test_post_api", "users.tests.tests_user_apis"],
+    "QUERY_TOLERANCE": 0,
+    "TIME_RATIO": 3.0,
+    "TIME_SLACK_MS": 50,
+    "CHECK_TIME": True,
+}
+
+
+def get_perf_baseline_options() -> Dict:
+    """
+    Returns:
+        Dict : settings.POSTS_PERF_BASELINE 을 기본값과 합친 설정
+               ({"PATH", "TESTS", "QUERY_TOLERANCE", "TIME_RATIO", "TIME_SLACK_MS", "CHECK_TIME"})
+    """
+    return {**DEFAULT_PERF_BASELINE, **getattr(settings, "POSTS_PERF_BASELINE", {})}
+
+
+_baselines = {}
+_baselines_lock = threading.Lock()
+
+
+def load_baseline(path: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Args:
+        path (str) : 기준 파일 경로 (없으면 settings.POSTS_PERF_BASELINE["PATH"])
+
+    Returns:
+        Dict[str, Dict] : {테스트 id : {"queries" : SQL 쿼리 수, "ms" : 걸린 시간}} (파일이 없으면 빈 dict)
+    """
+    path = str(path or get_perf_baseline_options()["PATH"])
+    with _baselines_lock:
+        if path not in _baselines:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    _baselines[path] = json.load(f)
+            except FileNotFoundError:
+                _baselines[path] = {}
+        return _baselines[path]
+
+
+def save_baseline(measurements: Dict[str, Dict], path: Optional[str] = None) -> None:
+    """
+    Args:
+        measurements (Dict[str, Dict]) : {테스트 id : {"queries", "ms"}}
+        path (str) : 기준 파일 경로 (없으면 settings.POSTS_PERF_BASELINE["PATH"])
+    """
+    path = str(path or get_perf_baseline_options()["PATH"])
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(measurements, f, indent=2, sort_keys=True)
+        f.write("\n")
+    with _baselines_lock:
+        _baselines.pop(path, None)
+
+
+def check_measurement(test_id: str, queries: int, ms: float) -> List[str]:
+    """
+    Args:
+        test_id (str) : 테스트 id /예시) posts.tests.test_post_api.TestAPI.test_post_view_def_get_ok
+        queries (int) : 테스트에서 실행한 SQL 쿼리 수
+        ms (float) : 테스트에 걸린 시간(ms)
+
+    Returns:
+        List[str] : 기준보다 나빠진 항목의 설명 (기준이 없는 테스트는 검사하지 않아 빈 list)
+    """
+    baseline = load_baseline().get(test_id)
+    if baseline is None:
+        return []
+    options = get_perf_baseline_options()
+    problems = []
+    allowed_queries = baseline["queries"] + options["QUERY_TOLERANCE"]
+    if queries > allowed_queries:
+        problems.append(
+            f"SQL 쿼리 {queries}개 (기준 {baseline['queries']}개, 허용 {allowed_queries}개)"
+        )
+    allowed_ms = baseline["ms"] * options["TIME_RATIO"] + options["TIME_SLACK_MS"]
+    if options["CHECK_TIME"] and ms > allowed_ms:
+        problems.append(
+            f"{ms:.1f}ms (기준 {baseline['ms']:.1f}ms, 허용 {allowed_ms:.1f}ms)"
+        )
+    return problems
+
+
+class PerfRecorder:
+    """
+    기준 파일을 갱신하는 동안(refresh_perf_baseline) 테스트별 SQL 쿼리 수와 시간을 모은다.
+    모으는 동안에는 기준과 비교하지 않는다.
+    """
+
+    def __init__(self):
+        self.recording = False
+        self.measurements = {}
+
+    def start(self) -> None:
+        self.recording = True
+        self.measurements = {}
+
+    def stop(self) -> Dict[str, Dict]:
+        self.recording = False
+        return self.measurements
+
+    def record(self, test_id: str, queries: int, ms: float) -> None:
+        self.measurements[test_id] = {"queries": queries, "ms": round(ms, 1)}
+
+
+perf_recorder = PerfRecorder()
@@ -1,34 +1,86 @@
-from typing import Dict
+import base64
+import datetime
+import json
+import sqlite3
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from django.db.models import Count, Q
+from asgiref.sync import sync_to_async
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, connection, transaction
+from django.db.models import Count, F, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.sql.subqueries import UpdateQuery
+from django.utils.dateparse import parse_datetime
 
-from posts.models import Like, Post, TagName
-from posts.serializers import PostDetailSerializer, PostSerializer
+from posts.models import Like, Post, PostTag, TagName
+from posts.renderers import RenderedPost, RenderedPostList
+from posts.serializers import (PostDetailSerializer, PostListSerializer,
+                               PostSerializer)
+from posts.services.cache_services import invalidate_post_lists
+from posts.services.fragment_services import (aget_or_set_fragments,
+                                              evict_post_fragments,
+                                              get_or_set_fragments)
+from posts.services.hot_services import hot_score_change, rescore_posts
+from posts.services.search_services import get_search_backend
+from posts.services.tag_services import (aget_tag_ids, get_tag_ids, parse_tags,
+                                         resolve_tag_ids, sync_post_tags)
+from posts.services.timing_services import timed
+from posts.services.view_services import view_count_buffer
 from users.models import User
 
+CURSOR_SORT_FIELDS = {
+    "created_date": "created_date",
+    "views": "views",
+    "likes": "like_count",
+    "hot": "hot_score",
+}
+
+TAG_FILTER_MODES = ("and", "or")
+
+
+def _tags_prefetch() -> Prefetch:
+    # 해시태그는 게시글에 연결된 순서(posts_tags.id)로 보여준다 (PostListSerializer 와 같은 순서)
+    return Prefetch("tags", queryset=TagName.objects.order_by("posttag__id"))
+
+
+def _sort_field(order_by: str) -> str:
+    """
+    Args:
+        order_by (str) : 정렬 기준 (created_date, views, likes, hot 중 1개)
+
+    Returns:
+        str : 정렬 컬럼 (OFFSET 페이징과 커서 페이징이 같은 컬럼으로 정렬)
+
+    Raises:
+        ValueError : 없는 정렬 기준일 경우
+    """
+    try:
+        return CURSOR_SORT_FIELDS[order_by]
+    except (KeyError, TypeError):
+        raise ValueError(f"invalid order_by: {order_by!r}") from None
+
 
 def read_posts(order_by: str, reverse: int) -> Post:
     """
     Args:
-        order_by (str) : 정렬 기준 (작성일, 조회수, 좋아요수 중 1개)
+        order_by (str) : 정렬 기준 (작성일, 조회수, 좋아요수, hot 중 1개)
         reverse (int) : 정렬 기준(1-내림차순 / 0-오름차순)
 
     Returns:
-        Post : 정렬(작성일/조회수/좋아요수/내림차순/오름차순)이 된 게시글의 QuerySet
+        Post : 정렬(작성일/조회수/좋아요수/hot/내림차순/오름차순)이 된 게시글의 QuerySet
+               (해시태그는 prefetch 되어 페이지 크기와 상관없이 쿼리 1번으로 가져온다)
+
+    Raises:
+        ValueError : 없는 정렬 기준일 경우
     """
+    # hot 은 시간 감쇠가 반영된 저장 점수라 요청마다 계산하지 않고 (hot_score, id) 색인 순서로 읽는다
+    sort_field = _sort_field(order_by)
     if reverse == 1:
         reverse = "-"
     elif reverse == 0:
         reverse = ""
-    if order_by == "created_date" or order_by == "views":
-        posts = Post.objects.all().order_by(reverse + order_by)
-    elif order_by == "likes":
-        posts = (
-            Post.objects.all()
-            .annotate(like_count=Count("like"))
-            .order_by(reverse + "like_count")
-        )
-    return posts
+    posts = Post.objects.prefetch_related(_tags_prefetch())
+    return posts.order_by(reverse + sort_field, reverse + "id")
 
 
 def search_posts(posts: Post, search: str) -> Post:
@@ -38,47 +90,507 @@ def search_posts(posts: Post, search: str) -> Post:
         search (str) : 검색 키워드
 
     Returns:
-        Post : 정렬,검색이 된 게시글의 QuerySet
+        Post : 정렬,검색이 된 게시글의 QuerySet (검색어가 제목이나 내용에 포함된 게시글)
     """
-    posts = posts.filter(Q(title__icontains=search) | Q(content__icontains=search))
+    if not search:
+        return posts
+    posts = get_search_backend().filter(posts, search)
     return posts
 
 
-def filtering_posts(posts: Post, tags: str) -> Post:
+async def asearch_posts(posts: Post, search: str) -> Post:
     """
+    search_posts 의 async 버전
+    검색 백엔드를 처음 고를 때 테이블 목록을 조회하므로 sync 코드(thread)에서 고른다.
+
+    Args:
+        posts (QuerySet) : 정렬이 된 게시글
+        search (str) : 검색 키워드
+
+    Returns:
+        Post : 정렬,검색이 된 게시글의 QuerySet
+    """
+    if not search:
+        return posts
+    search_backend = await sync_to_async(get_search_backend)()
+    return search_backend.filter(posts, search)
+
+
+def filtering_posts(posts: Post, tags: str, mode: str = "and") -> Post:
+    """
+    해시태그 이름을 한번에 id로 바꾼 뒤, posts_tags 를 게시글별로 묶어(HAVING COUNT = n) 필터링한다.
+
     Args:
         posts (QuerySet) : 정렬,검색이 된 게시글
-        tags (str) : 필터링할 해시태그
+        tags (str) : 필터링할 해시태그 /예시)"서울,맛집"
+        mode (str) : "and" - 모든 해시태그를 가진 게시글 / "or" - 하나라도 가진 게시글
 
     Returns:
         Post : 정렬,검색,태그필터링이 된 게시글의 QuerySet
+
+    Raises:
+        ValueError : mode가 "and", "or" 가 아닐 경우
     """
-    if tags == "":
-        query_set = posts.all()
-    else:
-        tags = tags.split(",")
-        query_set = posts.none()
-        for tag in tags:
-            query_set = (
-                query_set | posts.filter(posttag__tags__name__icontains=tag).distinct()
-            )
+    tag_names = _parse_filter_tags(tags, mode)
+    if not tag_names:
+        return posts.all()
+    return _filter_by_tag_ids(posts, get_tag_ids(tag_names), tag_names, mode)
+
+
+async def afiltering_posts(posts: Post, tags: str, mode: str = "and") -> Post:
+    """
+    filtering_posts 의 async 버전 (해시태그 id 조회만 async ORM 으로 실행한다)
+
+    Args:
+        posts (QuerySet) : 정렬,검색이 된 게시글
+        tags (str) : 필터링할 해시태그 /예시)"서울,맛집"
+        mode (str) : "and" - 모든 해시태그를 가진 게시글 / "or" - 하나라도 가진 게시글
+
+    Returns:
+        Post : 정렬,검색,태그필터링이 된 게시글의 QuerySet
+
+    Raises:
+        ValueError : mode가 "and", "or" 가 아닐 경우
+    """
+    tag_names = _parse_filter_tags(tags, mode)
+    if not tag_names:
+        return posts.all()
+    return _filter_by_tag_ids(posts, await aget_tag_ids(tag_names), tag_names, mode)
+
+
+def _parse_filter_tags(tags: str, mode: str) -> set:
+    if mode not in TAG_FILTER_MODES:
+        raise ValueError("tag filter mode must be 'and' or 'or'")
+    return {tag.strip().lstrip("#") for tag in tags.split(",")} - {""}
+
+
+def _filter_by_tag_ids(
+    posts: Post, tag_ids: Dict[str, int], tag_names: set, mode: str
+) -> Post:
+    tag_ids = list(tag_ids.values())
+    if not tag_ids or mode == "and" and len(tag_ids) < len(tag_names):
+        return posts.none()
+
+    tagged_posts = PostTag.objects.filter(tags_id__in=tag_ids)
+    if mode == "and":
+        tagged_posts = (
+            tagged_posts.values("posts_id")
+            .annotate(tag_count=Count("tags_id", distinct=True))
+            .filter(tag_count=len(tag_ids))
+        )
+    query_set = posts.filter(id__in=tagged_posts.values("posts_id"))
     return query_set
 
 
-def pagination_posts(posts: Post, page_size: int, page: int) -> PostSerializer:
+def pagination_posts(posts: Post, page_size: int, page: int) -> List[Dict]:
+    """
+    Args:
+        posts (QuerySet) : 정렬,검색,태그필터링이 된 게시글
+        page_size (int) : 한 페이지에 보여지는 게시글 수
+        page (int) : 보고자하는 페이지
+
+    Returns:
+        List[Dict] : 정렬,검색,태그필터링,페이징이 된 게시글들 (PostSerializer 와 같은 JSON)
+    """
+    start_post = page_size * (page - 1)
+    end_post = page * page_size
+    rows = list(posts.values(*PostListSerializer.values_fields)[start_post:end_post])
+    return project_posts(rows)
+
+
+def pagination_post_ids(posts: Post, page_size: int, page: int) -> Dict:
+    """
+    Args:
+        posts (QuerySet) : 정렬,검색,태그필터링이 된 게시글
+        page_size (int) : 한 페이지에 보여지는 게시글 수
+        page (int) : 보고자하는 페이지
+
+    Returns:
+        Dict : {
+            "post_ids" : 정렬,검색,태그필터링,페이징이 된 게시글들의 PK,
+            "has_next" : 다음 페이지 여부 (게시글을 1개 더 조회하여 확인)
+        } 목록 캐시에 저장되는 값
+    """
+    start_post = page_size * (page - 1)
+    end_post = page * page_size
+    post_ids = list(posts.values_list("id", flat=True)[start_post : end_post + 1])
+    return {"post_ids": post_ids[:page_size], "has_next": len(post_ids) > page_size}
+
+
+async def apagination_post_ids(posts: Post, page_size: int, page: int) -> Dict:
     """
+    pagination_post_ids 의 async 버전
+
     Args:
         posts (QuerySet) : 정렬,검색,태그필터링이 된 게시글
         page_size (int) : 한 페이지에 보여지는 게시글 수
         page (int) : 보고자하는 페이지
 
     Returns:
-        PostSerializer : 정렬,검색,태그필터링,페이징이 된 게시글들
+        Dict : {"post_ids" : 한 페이지의 게시글 PK, "has_next" : 다음 페이지 여부}
     """
     start_post = page_size * (page - 1)
     end_post = page * page_size
-    posts_serializer = PostSerializer(posts[start_post:end_post], many=True).data
-    return posts_serializer
+    post_ids = [
+        post_id
+        async for post_id in posts.values_list("id", flat=True)[
+            start_post : end_post + 1
+        ]
+    ]
+    return {"post_ids": post_ids[:page_size], "has_next": len(post_ids) > page_size}
+
+
+def project_posts(rows: List[Dict]) -> List[Dict]:
+    """
+    .values() 로 읽은 게시글에 해시태그를 한번에(쿼리 1번) 붙여 목록 응답을 만든다.
+
+    Args:
+        rows (List[Dict]) : PostListSerializer.values_fields 로 읽은 게시글들
+
+    Returns:
+        List[Dict] : rows 순서대로 PostSerializer 와 같은 JSON 이 되는 게시글들
+    """
+    if not rows:
+        return []
+    return _attach_tags(rows, _post_tag_rows(rows))
+
+
+async def aproject_posts(rows: List[Dict]) -> List[Dict]:
+    """
+    project_posts 의 async 버전
+
+    Args:
+        rows (List[Dict]) : PostListSerializer.values_fields 로 읽은 게시글들
+
+    Returns:
+        List[Dict] : rows 순서대로 PostSerializer 와 같은 JSON 이 되는 게시글들
+    """
+    if not rows:
+        return []
+    return _attach_tags(rows, [tag_row async for tag_row in _post_tag_rows(rows)])
+
+
+def _post_tag_rows(rows: List[Dict]) -> PostTag:
+    return (
+        PostTag.objects.filter(posts_id__in=[row["id"] for row in rows])
+        .order_by("posts_id", "id")
+        .values_list("posts_id", "tags_id", "tags__name")
+    )
+
+
+def _attach_tags(rows: List[Dict], tag_rows: Iterable[Tuple]) -> List[Dict]:
+    post_tags = defaultdict(list)
+    for post_id, tag_id, tag_name in tag_rows:
+        post_tags[post_id].append((tag_id, tag_name))
+    serializer = PostListSerializer()
+    with timed("serialize"):
+        return [serializer.to_representation(row, post_tags[row["id"]]) for row in rows]
+
+
+def read_posts_by_ids(post_ids: List[int]) -> List[Dict]:
+    """
+    Args:
+        post_ids (List[int]) : pagination_post_ids 로 구한 게시글들의 PK
+
+    Returns:
+        List[Dict] : post_ids 순서대로 정렬된 게시글들 (PostSerializer 와 같은 JSON)
+    """
+    rows = {
+        row["id"]: row
+        for row in Post.objects.filter(id__in=post_ids).values(
+            *PostListSerializer.values_fields
+        )
+    }
+    return project_posts([rows[post_id] for post_id in post_ids if post_id in rows])
+
+
+async def aread_posts_by_ids(post_ids: List[int]) -> List[Dict]:
+    """
+    read_posts_by_ids 의 async 버전
+
+    Args:
+        post_ids (List[int]) : 게시글들의 PK
+
+    Returns:
+        List[Dict] : post_ids 순서대로 정렬된 게시글들 (PostSerializer 와 같은 JSON)
+    """
+    rows = {
+        row["id"]: row
+        async for row in Post.objects.filter(id__in=post_ids).values(
+            *PostListSerializer.values_fields
+        )
+    }
+    return await aproject_posts(
+        [rows[post_id] for post_id in post_ids if post_id in rows]
+    )
+
+
+def _encode_cursor(post: Dict, sort_field: str, reverse: int, direction: str) -> str:
+    """
+    Args:
+        post (Dict) : 커서의 기준이 되는 게시글 (PostListSerializer.values_fields)
+        sort_field (str) : 정렬 컬럼 (created_date, views, like_count, hot_score 중 1개)
+        reverse (int) : 정렬 기준(1-내림차순 / 0-오름차순)
+        direction (str) : 커서 방향 ("next" / "prev")
+
+    Returns:
+        str : 정렬 값 + id 를 담은 url-safe base64 커서
+    """
+    value = post[sort_field]
+    if sort_field == "created_date":
+        value = value.isoformat()
+    payload = {
+        "k": sort_field,
+        "r": reverse,
+        "v": value,
+        "id": post["id"],
+        "d": direction,
+    }
+    encoded = base64.urlsafe_b64encode(json.dumps(payload).encode())
+    return encoded.decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_field: str, reverse: int) -> Dict:
+    """
+    Args:
+        cursor (str) : _encode_cursor로 만든 커서
+        sort_field (str) : 현재 요청의 정렬 컬럼
+        reverse (int) : 현재 요청의 정렬 기준
+
+    Returns:
+        Dict : {"v" : 정렬 값, "id" : 게시글 PK, "d" : 커서 방향}
+
+    Raises:
+        ValueError : 커서가 손상되었거나 현재 정렬 기준과 맞지 않을 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value, post_id, direction = payload["v"], int(payload["id"]), payload["d"]
+        if payload["k"] != sort_field or payload["r"] != reverse:
+            raise ValueError("cursor does not match the current ordering")
+    except (KeyError, TypeError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("invalid cursor") from e
+    if direction not in ("next", "prev"):
+        raise ValueError("invalid cursor direction")
+    if sort_field == "created_date":
+        value = parse_datetime(value)
+        if value is None:
+            raise ValueError("invalid cursor value")
+    return {"v": value, "id": post_id, "d": direction}
+
+
+def read_post_versions(
+    post_ids: List[int],
+) -> Dict[int, Tuple[datetime.datetime, int, int]]:
+    """
+    Args:
+        post_ids (List[int]) : 게시글들의 PK
+
+    Returns:
+        Dict[int, Tuple[datetime, int, int]] : {게시글 id : (updated_date, 조회수, 좋아요 수)} (없는 게시글은 빠짐)
+    """
+    return {
+        post_id: (updated_date, views, like_count)
+        for post_id, updated_date, views, like_count in Post.objects.filter(
+            id__in=post_ids
+        ).values_list("id", "updated_date", "views", "like_count")
+    }
+
+
+def render_posts_by_ids(
+    post_ids: List[int],
+    versions: Optional[Dict[int, Tuple[datetime.datetime, int, int]]] = None,
+) -> RenderedPostList:
+    """
+    게시글 id 로 updated_date, 조회수, 좋아요 수만 읽고(쿼리 1번) 캐시된 JSON 조각 사이에 끼워 넣는다.
+    조각이 없거나 updated_date 가 바뀐 게시글만 read_posts_by_ids 로 다시 만든다.
+
+    Args:
+        post_ids (List[int]) : pagination_post_ids 로 구한 게시글들의 PK
+        versions (Dict) : 이미 read_post_versions 로 읽은 값 (없으면 새로 읽음)
+
+    Returns:
+        RenderedPostList : post_ids 순서대로 정렬된 게시글들 (read_posts_by_ids 와 같은 JSON)
+    """
+    rows = read_post_versions(post_ids) if versions is None else versions
+    post_ids = [post_id for post_id in post_ids if post_id in rows]
+    fragments = get_or_set_fragments(
+        "list", {post_id: rows[post_id][0] for post_id in post_ids}, read_posts_by_ids
+    )
+    return _rendered_post_list(post_ids, rows, fragments)
+
+
+async def aread_post_versions(
+    post_ids: List[int],
+) -> Dict[int, Tuple[datetime.datetime, int, int]]:
+    """
+    read_post_versions 의 async 버전
+
+    Args:
+        post_ids (List[int]) : 게시글들의 PK
+
+    Returns:
+        Dict[int, Tuple[datetime, int, int]] : {게시글 id : (updated_date, 조회수, 좋아요 수)}
+    """
+    return {
+        post_id: (updated_date, views, like_count)
+        async for post_id, updated_date, views, like_count in Post.objects.filter(
+            id__in=post_ids
+        ).values_list("id", "updated_date", "views", "like_count")
+    }
+
+
+async def arender_posts_by_ids(
+    post_ids: List[int],
+    versions: Optional[Dict[int, Tuple[datetime.datetime, int, int]]] = None,
+) -> RenderedPostList:
+    """
+    render_posts_by_ids 의 async 버전 (조각이 없는 게시글은 aread_posts_by_ids 로 만든다)
+
+    Args:
+        post_ids (List[int]) : pagination_post_ids 로 구한 게시글들의 PK
+        versions (Dict) : 이미 aread_post_versions 로 읽은 값 (없으면 새로 읽음)
+
+    Returns:
+        RenderedPostList : post_ids 순서대로 정렬된 게시글들
+    """
+    rows = await aread_post_versions(post_ids) if versions is None else versions
+    post_ids = [post_id for post_id in post_ids if post_id in rows]
+    fragments = await aget_or_set_fragments(
+        "list", {post_id: rows[post_id][0] for post_id in post_ids}, aread_posts_by_ids
+    )
+    return _rendered_post_list(post_ids, rows, fragments)
+
+
+def _rendered_post_list(
+    post_ids: List[int], rows: Dict[int, Tuple], fragments: Dict[int, Tuple]
+) -> RenderedPostList:
+    return RenderedPostList(
+        RenderedPost(fragments[post_id], rows[post_id][1], rows[post_id][2])
+        for post_id in post_ids
+    )
+
+
+def cursor_pagination_posts(
+    posts: Post, order_by: str, reverse: int, page_size: int, cursor: str
+) -> Dict:
+    """
+    OFFSET 대신 (정렬 값, id) 기준의 keyset 페이징으로, 페이지 깊이와 상관없이 같은 비용이 든다.
+
+    Args:
+        posts (QuerySet) : 정렬,검색,태그필터링이 된 게시글
+        order_by (str) : read_posts에 전달한 정렬 기준 (작성일, 조회수, 좋아요수, hot 중 1개)
+        reverse (int) : read_posts에 전달한 정렬 기준(1-내림차순 / 0-오름차순)
+        page_size (int) : 한 페이지에 보여지는 게시글 수
+        cursor (str) : 이전 응답의 next/prev 커서 (첫 페이지는 빈 문자열)
+
+    Returns:
+        Dict : {
+            "results" : 정렬,검색,태그필터링,페이징이 된 게시글들,
+            "next" : 다음 페이지 커서 (없으면 None),
+            "prev" : 이전 페이지 커서 (없으면 None)
+        }
+
+    Raises:
+        ValueError : 커서가 올바르지 않거나 없는 정렬 기준일 경우
+    """
+    sort_field = _sort_field(order_by)
+    posts, direction = _cursor_page_query(posts, sort_field, reverse, cursor)
+    page = list(posts.values(*_cursor_values_fields(sort_field))[: page_size + 1])
+    page, next_cursor, prev_cursor = _cursor_page(
+        page, sort_field, reverse, page_size, cursor, direction
+    )
+    return {
+        "results": project_posts(page),
+        "next": next_cursor,
+        "prev": prev_cursor,
+    }
+
+
+async def acursor_pagination_posts(
+    posts: Post, order_by: str, reverse: int, page_size: int, cursor: str
+) -> Dict:
+    """
+    cursor_pagination_posts 의 async 버전
+
+    Args:
+        posts (QuerySet) : 정렬,검색,태그필터링이 된 게시글
+        order_by (str) : read_posts에 전달한 정렬 기준
+        reverse (int) : read_posts에 전달한 정렬 기준(1-내림차순 / 0-오름차순)
+        page_size (int) : 한 페이지에 보여지는 게시글 수
+        cursor (str) : 이전 응답의 next/prev 커서 (첫 페이지는 빈 문자열)
+
+    Returns:
+        Dict : {"results", "next", "prev"} (cursor_pagination_posts 와 같음)
+
+    Raises:
+        ValueError : 커서가 올바르지 않거나 없는 정렬 기준일 경우
+    """
+    sort_field = _sort_field(order_by)
+    posts, direction = _cursor_page_query(posts, sort_field, reverse, cursor)
+    page = [
+        row
+        async for row in posts.values(*_cursor_values_fields(sort_field))[
+            : page_size + 1
+        ]
+    ]
+    page, next_cursor, prev_cursor = _cursor_page(
+        page, sort_field, reverse, page_size, cursor, direction
+    )
+    return {
+        "results": await aproject_posts(page),
+        "next": next_cursor,
+        "prev": prev_cursor,
+    }
+
+
+def _cursor_values_fields(sort_field: str) -> List[str]:
+    # 목록 응답에 없는 정렬 컬럼(hot_score)은 커서를 만들 수 있도록 같이 읽는다
+    if sort_field in PostListSerializer.values_fields:
+        return PostListSerializer.values_fields
+    return PostListSerializer.values_fields + [sort_field]
+
+
+def _cursor_page_query(
+    posts: Post, sort_field: str, reverse: int, cursor: str
+) -> Tuple[Post, str]:
+    direction = "next"
+    if cursor:
+        payload = _decode_cursor(cursor, sort_field, reverse)
+        direction = payload["d"]
+        # 내림차순에서 다음 페이지로 가면 값이 작아지고, 이전 페이지로 가면 커진다
+        lookup = "lt" if (reverse == 1) == (direction == "next") else "gt"
+        posts = posts.filter(
+            Q(**{sort_field + "__" + lookup: payload["v"]})
+            | Q(**{sort_field: payload["v"], "id__" + lookup: payload["id"]})
+        )
+    if direction == "prev":
+        posts = posts.reverse()
+    return posts, direction
+
+
+def _cursor_page(
+    page: List[Dict],
+    sort_field: str,
+    reverse: int,
+    page_size: int,
+    cursor: str,
+    direction: str,
+) -> Tuple[List[Dict], Optional[str], Optional[str]]:
+    # page_size + 1 개를 읽은 row 로 (페이지, next 커서, prev 커서) 를 만든다
+    has_more = len(page) > page_size
+    page = page[:page_size]
+    if direction == "prev":
+        page.reverse()
+
+    next_cursor = prev_cursor = None
+    if page:
+        if direction == "next" and has_more or direction == "prev":
+            next_cursor = _encode_cursor(page[-1], sort_field, reverse, "next")
+        if direction == "prev" and has_more or direction == "next" and cursor:
+            prev_cursor = _encode_cursor(page[0], sort_field, reverse, "prev")
+    return page, next_cursor, prev_cursor
 
 
 def create_post(create_data: Dict[str, str], user: User) -> None:
@@ -97,13 +609,15 @@ def create_post(create_data: Dict[str, str], user: User) -> None:
     create_data["writer"] = user.id
     post_data_serializer = PostSerializer(data=create_data)
     post_data_serializer.is_valid(raise_exception=True)
-    post_data_serializer.save()
-
-    tags_data_list = create_data["tags"].replace(",", "").split("#")
-    del tags_data_list[0]
-    for tag in tags_data_list:
-        TagName.objects.get_or_create(name=tag)
-        post_data_serializer.instance.tags.add(TagName.objects.get(name=tag))
+    tags_data_list = parse_tags(create_data.get("tags", ""))
+    with transaction.atomic():
+        post = post_data_serializer.save()
+        tag_ids = resolve_tag_ids(tags_data_list)
+        PostTag.objects.bulk_create(
+            [PostTag(posts=post, tags_id=tag_ids[tag]) for tag in tags_data_list]
+        )
+    get_search_backend().update_post(post)
+    invalidate_post_lists(tags_data_list)
 
 
 def edit_post(edit_data: Dict[str, str], user: User, post_id: int) -> None:
@@ -112,7 +626,7 @@ def edit_post(edit_data: Dict[str, str], user: User, post_id: int) -> None:
         edit_data (Dict[str, str]) : {
             "title" : post의 title,
             "content" : post의 content,
-            "tags" : post의 hashtags /예시)"#제목,#내용,#태그"
+            "tags" : post의 hashtags /예시)"#제목,#내용,#태그" (없어진 해시태그는 삭제)
             }
         user (int) : 로그인이 되어있는 작성자의 FK
         post_id (int) : 수정하고자 하는 게시글의 PK
@@ -122,14 +636,15 @@ def edit_post(edit_data: Dict[str, str], user: User, post_id: int) -> None:
     """
     post = Post.objects.get(id=post_id, writer_id=user)
     post_serializer = PostSerializer(post, data=edit_data, partial=True)
-    if post_serializer.is_valid(raise_exception=True):
+    post_serializer.is_valid(raise_exception=True)
+    changed_tags = []
+    with transaction.atomic():
         post_serializer.save()
-
-    tags_data_list = edit_data["tags"].replace(",", "").split("#")
-    del tags_data_list[0]
-    for tag in tags_data_list:
-        TagName.objects.get_or_create(name=tag)
-        post_serializer.instance.tags.add(TagName.objects.get(name=tag))
+        if "tags" in edit_data:
+            changed_tags = sync_post_tags(post.id, parse_tags(edit_data["tags"]))
+    get_search_backend().update_post(post)
+    evict_post_fragments([post.id])
+    invalidate_post_lists(changed_tags, search=True, unfiltered=False)
 
 
 def soft_delete_post(user: User, post_id: int) -> None:
@@ -144,6 +659,7 @@ def soft_delete_post(user: User, post_id: int) -> None:
     post = Post.objects.get(id=post_id, writer_id=user)
     post.is_active = False
     post.save()
+    evict_post_fragments([post.id])
 
 
 def recover_post(user: User, post_id: int) -> None:
@@ -159,6 +675,7 @@ def recover_post(user: User, post_id: int) -> None:
     if post.is_active == False:
         post.is_active = True
         post.save()
+        evict_post_fragments([post.id])
 
 
 def hard_delete_post(user: User, post_id: int) -> None:
@@ -171,7 +688,11 @@ def hard_delete_post(user: User, post_id: int) -> None:
         None
     """
     post = Post.objects.get(id=post_id, writer_id=user)
+    tags = list(post.tags.values_list("name", flat=True))
     post.delete()
+    get_search_backend().delete_post(post_id)
+    evict_post_fragments([post_id])
+    invalidate_post_lists(tags)
 
 
 def read_detail_post(post_id: int) -> PostDetailSerializer:
@@ -180,14 +701,279 @@ def read_detail_post(post_id: int) -> PostDetailSerializer:
         post_id (int) : 자세한 내용을 열람하고자 하는 게시글의 PK
 
     Returns:
-        PostDetailSerializer : 해당 게시글의 상세정보
+        PostDetailSerializer : 해당 게시글의 상세정보 (조회수 +1 은 view_count_buffer 에 모았다가 반영)
     """
     post = Post.objects.get(id=post_id)
-    post.update_views
+    post.views += view_count_buffer.add(post.id)
     post_serializer = PostDetailSerializer(post).data
+    view_count_buffer.flush_if_due()
     return post_serializer
 
 
+def _read_detail_posts(post_ids: List[int]) -> List[Dict]:
+    posts = list(
+        Post.objects.prefetch_related(_tags_prefetch()).filter(id__in=post_ids)
+    )
+    with timed("serialize"):
+        return PostDetailSerializer(posts, many=True).data
+
+
+def read_detail_version(post_id: int) -> Tuple[int, datetime.datetime, int, int]:
+    """
+    Args:
+        post_id (int) : 자세한 내용을 열람하고자 하는 게시글의 PK
+
+    Returns:
+        Tuple[int, datetime, int, int] : (게시글 id, updated_date, 조회수, 좋아요 수)
+
+    Raises:
+        Post.DoesNotExist : 게시글이 없을 경우
+    """
+    version = (
+        Post.objects.filter(id=post_id)
+        .values_list("id", "updated_date", "views", "like_count")
+        .first()
+    )
+    if version is None:
+        raise Post.DoesNotExist("Post matching query does not exist.")
+    return version
+
+
+def count_post_view(post_id: int) -> int:
+    """
+    Args:
+        post_id (int) : 조회된 게시글의 PK
+
+    Returns:
+        int : 아직 DB에 반영되지 않은 해당 게시글의 조회수 증가분 (view_count_buffer 에 +1)
+    """
+    pending = view_count_buffer.add(post_id)
+    view_count_buffer.flush_if_due()
+    return pending
+
+
+def render_detail_post(
+    post_id: int, version: Optional[Tuple[int, datetime.datetime, int, int]] = None
+) -> RenderedPost:
+    """
+    Args:
+        post_id (int) : 자세한 내용을 열람하고자 하는 게시글의 PK
+        version (Tuple) : 이미 read_detail_version 으로 읽은 값 (없으면 새로 읽음)
+
+    Returns:
+        RenderedPost : 캐시된 상세 JSON 조각에 조회수(+1, view_count_buffer)와 좋아요 수를 끼워 넣은 게시글
+                       (read_detail_post 와 같은 JSON, 조각이 있으면 쿼리 1번)
+
+    Raises:
+        Post.DoesNotExist : 게시글이 없을 경우
+    """
+    if version is None:
+        version = read_detail_version(post_id)
+    post_id, updated_date, views, like_count = version
+    fragments = get_or_set_fragments(
+        "detail", {post_id: updated_date}, _read_detail_posts
+    )
+    return RenderedPost(
+        fragments[post_id], views + count_post_view(post_id), like_count
+    )
+
+
+async def aread_detail_version(post_id: int) -> Tuple[int, datetime.datetime, int, int]:
+    """
+    read_detail_version 의 async 버전
+
+    Args:
+        post_id (int) : 자세한 내용을 열람하고자 하는 게시글의 PK
+
+    Returns:
+        Tuple[int, datetime, int, int] : (게시글 id, updated_date, 조회수, 좋아요 수)
+
+    Raises:
+        Post.DoesNotExist : 게시글이 없을 경우
+    """
+    version = (
+        await Post.objects.filter(id=post_id)
+        .values_list("id", "updated_date", "views", "like_count")
+        .afirst()
+    )
+    if version is None:
+        raise Post.DoesNotExist("Post matching query does not exist.")
+    return version
+
+
+async def acount_post_view(post_id: int) -> int:
+    """
+    count_post_view 의 async 버전 (DB에 반영할 때만 sync 코드(thread)에서 flush 한다)
+
+    Args:
+        post_id (int) : 조회된 게시글의 PK
+
+    Returns:
+        int : 아직 DB에 반영되지 않은 해당 게시글의 조회수 증가분
+    """
+    pending = view_count_buffer.add(post_id)
+    if view_count_buffer.is_due():
+        await sync_to_async(view_count_buffer.flush)()
+    return pending
+
+
+async def _aread_detail_posts(post_ids: List[int]) -> List[Dict]:
+    posts = Post.objects.prefetch_related(_tags_prefetch()).filter(id__in=post_ids)
+    return PostDetailSerializer([post async for post in posts], many=True).data
+
+
+async def aread_detail_post(
+    post_id: int, version: Optional[Tuple[int, datetime.datetime, int, int]] = None
+) -> RenderedPost:
+    """
+    상세 조회(render_detail_post)의 async 버전
+
+    Args:
+        post_id (int) : 자세한 내용을 열람하고자 하는 게시글의 PK
+        version (Tuple) : 이미 aread_detail_version 으로 읽은 값 (없으면 새로 읽음)
+
+    Returns:
+        RenderedPost : 캐시된 상세 JSON 조각에 조회수(+1)와 좋아요 수를 끼워 넣은 게시글
+
+    Raises:
+        Post.DoesNotExist : 게시글이 없을 경우
+    """
+    if version is None:
+        version = await aread_detail_version(post_id)
+    post_id, updated_date, views, like_count = version
+    fragments = await aget_or_set_fragments(
+        "detail", {post_id: updated_date}, _aread_detail_posts
+    )
+    return RenderedPost(
+        fragments[post_id], views + await acount_post_view(post_id), like_count
+    )
+
+
+def _add_like_count(post_id: int, delta: int) -> int:
+    """
+    Args:
+        post_id (int) : 좋아요 수를 바꿀 게시글의 PK
+        delta (int) : 좋아요 수 증감 (+1 / -1)
+
+    Returns:
+        int : 바뀐 좋아요 수 (UPDATE ... RETURNING 한 문장으로 바꾸고 읽음, hot_score 도 같은 문장에서 바뀜)
+
+    Raises:
+        Post.DoesNotExist : 게시글이 없을 경우
+    """
+    like_count = Greatest(F("like_count") + delta, 0)
+    values = {
+        "like_count": like_count,
+        "hot_score": hot_score_change(like_count=like_count),
+    }
+    if connection.vendor == "postgresql" or (
+        connection.vendor == "sqlite" and sqlite3.sqlite_version_info >= (3, 35)
+    ):
+        # QuerySet.update 가 만드는 UPDATE 문 뒤에 RETURNING 을 붙인다
+        query = UpdateQuery(Post)
+        query.add_update_values(values)
+        query.add_q(Q(id=post_id))
+        sql, params = query.get_compiler(connection=connection).as_sql()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"{sql} RETURNING {connection.ops.quote_name('like_count')}", params
+            )
+            row = cursor.fetchone()
+        if row is None:
+            raise Post.DoesNotExist("Post matching query does not exist.")
+        return row[0]
+    Post.objects.filter(id=post_id).update(**values)
+    return count_likes(post_id)
+
+
+def _toggle_like(user: User, post_id: int) -> Tuple[bool, int]:
+    """
+    좋아요가 있으면 지우고 없으면 만든 뒤 Post.like_count 를 바꾼다. 트랜잭션 안에서 호출한다.
+
+    Args:
+        user (int) : 좋아요/좋아요취소 하는 사용자의 FK
+        post_id (int) : 좋아요/좋아요취소 하는 게시글의 PK
+
+    Returns:
+        Tuple[bool, int] : (좋아요 여부, 바뀐 좋아요 수)
+    """
+    liked = not Like.objects.filter(user=user, post_id=post_id).delete()[0]
+    if liked:
+        try:
+            with transaction.atomic():
+                Like.objects.create(user=user, post_id=post_id)
+        except IntegrityError:
+            # 같은 좋아요가 동시에 먼저 저장되었으면 그 좋아요를 취소하고, 지울 것도 없으면 없는 게시글
+            liked = not Like.objects.filter(user=user, post_id=post_id).delete()[0]
+            if liked:
+                raise Post.DoesNotExist("Post matching query does not exist.")
+    return liked, _add_like_count(post_id, 1 if liked else -1)
+
+
+def toggle_like(user: User, post_id: int) -> Tuple[bool, int]:
+    """
+    Args:
+        user (int) : 좋아요/좋아요취소 하는 사용자의 FK
+        post_id (int) : 좋아요/좋아요취소 하는 게시글의 PK
+
+    Returns:
+        Tuple[bool, int] : (True-"좋아요" / False-"좋아요취소", 바뀐 좋아요 수)
+
+    Raises:
+        Post.DoesNotExist : 게시글이 없을 경우
+    """
+    tags = list(TagName.objects.filter(tags=post_id).values_list("name", flat=True))
+    with transaction.atomic():
+        liked, like_count = _toggle_like(user, post_id)
+    invalidate_post_lists(tags, sorts=["likes", "hot"])
+    return liked, like_count
+
+
+def toggle_likes(user: User, post_ids: List[int]) -> List[Dict]:
+    """
+    모바일에서 모아둔 좋아요/좋아요취소를 한 트랜잭션으로 순서대로 처리한다.
+
+    Args:
+        user (int) : 좋아요/좋아요취소 하는 사용자의 FK
+        post_ids (List[int]) : 좋아요/좋아요취소 하는 게시글들의 PK (같은 게시글이 여러번 와도 됨)
+
+    Returns:
+        List[Dict] : [{"post_id" : 게시글 PK, "liked" : 좋아요 여부, "like_count" : 바뀐 좋아요 수}]
+
+    Raises:
+        Post.DoesNotExist : 없는 게시글이 하나라도 있을 경우 (전체 취소)
+    """
+    tags = TagName.objects.filter(tags__in=post_ids).values_list("name", flat=True)
+    tags = list(tags.distinct())
+    results = []
+    with transaction.atomic():
+        for post_id in post_ids:
+            liked, like_count = _toggle_like(user, post_id)
+            results.append(
+                {"post_id": post_id, "liked": liked, "like_count": like_count}
+            )
+    invalidate_post_lists(tags, sorts=["likes", "hot"])
+    return results
+
+
+async def atoggle_like(user: User, post_id: int) -> Tuple[bool, int]:
+    """
+    toggle_like 의 async 버전
+    좋아요는 트랜잭션(atomic)이 필요한데 async ORM 은 트랜잭션을 지원하지 않으므로 sync 코드(thread)에서 실행한다.
+
+    Args:
+        user (int) : 좋아요/좋아요취소 하는 사용자의 FK
+        post_id (int) : 좋아요/좋아요취소 하는 게시글의 PK
+
+    Returns:
+        Tuple[bool, int] : (True-"좋아요" / False-"좋아요취소", 바뀐 좋아요 수)
+
+    Raises:
+        Post.DoesNotExist : 게시글이 없을 경우
+    """
+    return await sync_to_async(toggle_like)(user, post_id)
+
+
 def like_post(user: User, post_id: int) -> bool:
     """
     Args:
@@ -198,9 +984,70 @@ def like_post(user: User, post_id: int) -> bool:
         True : "좋아요"
         False : "좋아요취소"
     """
-    post = Post.objects.get(id=post_id)
-    getted_like_obj, created_like_obj = Like.objects.get_or_create(user=user, post=post)
-    if created_like_obj:
-        return True
-    getted_like_obj.delete()
-    return False
+    return toggle_like(user, post_id)[0]
+
+
+def count_likes(post_id: int) -> int:
+    """
+    Args:
+        post_id (int) : 좋아요 수를 확인하고자 하는 게시글의 PK
+
+    Returns:
+        int : 게시글에 저장된 좋아요 수 (Post.like_count)
+    """
+    return Post.objects.values_list("like_count", flat=True).get(id=post_id)
+
+
+def reconcile_like_count() -> int:
+    """
+    Post.like_count 값을 Like 테이블의 실제 개수와 맞춘다.
+    보정된 게시글은 hot_score 도 다시 계산하고, 해당 해시태그의 좋아요순/hot 목록 캐시를 무효화한다.
+
+    Returns:
+        int : 좋아요 수가 어긋나 보정된 게시글 수
+    """
+    actual_count = Coalesce(
+        Subquery(
+            Like.objects.filter(post=OuterRef("pk"))
+            .order_by()
+            .values("post")
+            .annotate(count=Count("id"))
+            .values("count")
+        ),
+        0,
+    )
+    drifted_posts = (
+        Post.objects.annotate(actual_count=actual_count)
+        .exclude(like_count=F("actual_count"))
+        .values_list("id", flat=True)
+    )
+    post_ids = list(drifted_posts)
+    if not post_ids:
+        return 0
+    tags = TagName.objects.filter(tags__in=post_ids).values_list("name", flat=True)
+    tags = list(tags.distinct())
+    with transaction.atomic():
+        reconciled_count = Post.objects.filter(id__in=post_ids).update(
+            like_count=actual_count
+        )
+        rescore_posts(Post, using=DEFAULT_DB_ALIAS, post_ids=post_ids)
+    invalidate_post_lists(tags, sorts=["likes", "hot"])
+    return reconciled_count
+
+
+def recompute_hot_scores(chunk_size: Optional[int] = None) -> int:
+    """
+    전체 게시글의 hot_score 를 작성시간/좋아요 수/조회수로 다시 계산하여 어긋난 게시글만 저장한다.
+    (hot 설정을 바꾸었거나 좋아요 수/조회수를 직접 고친 뒤, 또는 주기적으로 실행)
+
+    Args:
+        chunk_size (int) : 한번에 읽고 저장하는 게시글 수 (없으면 settings.POSTS_HOT_SCORE["CHUNK_SIZE"])
+
+    Returns:
+        int : hot_score 가 보정된 게시글 수
+    """
+    changed = rescore_posts(Post, using=DEFAULT_DB_ALIAS, chunk_size=chunk_size)
+    if changed:
+        # 해시태그별 hot 목록은 캐시 timeout 이 지나면 새로 읽는다
+        invalidate_post_lists([], sorts=["hot"])
+    return changed
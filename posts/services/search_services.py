@@ -0,0 +1,125 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from posts.models import Post
+
+SEARCH_TABLE = "posts_search"
+
+DEFAULT_SEARCH_BACKENDS = {
+    "sqlite": "posts.services.search_services.SQLiteFTS5SearchBackend",
+    "postgresql": "posts.services.search_services.PostgresTrigramSearchBackend",
+}
+
+
+class LikeSearchBackend:
+    """
+    검색어가 제목이나 내용에 포함된 게시글을 LIKE '%검색어%' 로 찾는 기본 검색 백엔드
+    다른 백엔드도 이 클래스를 상속하여 같은 검색 결과(부분 문자열 포함)를 보장한다.
+    """
+
+    def filter(self, posts: Post, search: str) -> Post:
+        """
+        Args:
+            posts (QuerySet) : 정렬이 된 게시글
+            search (str) : 검색 키워드
+
+        Returns:
+            Post : 검색어가 제목이나 내용에 포함된 게시글의 QuerySet
+        """
+        return posts.filter(Q(title__icontains=search) | Q(content__icontains=search))
+
+    def update_post(self, post: Post) -> None:
+        """
+        Args:
+            post (Post) : 작성/수정된 게시글
+
+        Returns:
+            None : DB가 색인을 관리하지 않는 백엔드만 재정의한다
+        """
+
+    def delete_post(self, post_id: int) -> None:
+        """
+        Args:
+            post_id (int) : 완전 삭제된 게시글의 PK
+
+        Returns:
+            None : DB가 색인을 관리하지 않는 백엔드만 재정의한다
+        """
+
+    def rebuild(self) -> int:
+        """
+        Returns:
+            int : 다시 색인된 게시글 수
+        """
+        return 0
+
+
+class SQLiteFTS5SearchBackend(LikeSearchBackend):
+    """
+    SQLite FTS5(trigram) 가상 테이블로 검색 후보를 좁히는 검색 백엔드
+    색인은 posts_post 트리거가 관리하며(0003 migration), trigram 은 3글자 이상부터 동작한다.
+    """
+
+    min_length = 3
+
+    def filter(self, posts: Post, search: str) -> Post:
+        posts = super().filter(posts, search)
+        if len(search) < self.min_length:
+            return posts
+        phrase = '"' + search.replace('"', '""') + '"'
+        return posts.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s",
+                (phrase,),
+            )
+        )
+
+    def rebuild(self) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"
+            )
+        return Post.objects.count()
+
+
+class PostgresTrigramSearchBackend(LikeSearchBackend):
+    """
+    pg_trgm GIN 색인으로 ILIKE '%검색어%' 를 색인 검색으로 바꾸는 PostgreSQL 검색 백엔드
+    tsvector 는 단어 단위라 부분 문자열 검색 결과를 보장하지 못해 trigram 색인을 사용한다.
+    """
+
+    def rebuild(self) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute("REINDEX INDEX posts_post_title_trgm")
+            cursor.execute("REINDEX INDEX posts_post_content_trgm")
+        return Post.objects.count()
+
+
+@lru_cache(maxsize=None)
+def _load_search_backend(backend_path: str) -> LikeSearchBackend:
+    return import_string(backend_path)()
+
+
+def get_search_backend() -> LikeSearchBackend:
+    """
+    Returns:
+        LikeSearchBackend : settings.POSTS_SEARCH_BACKEND 또는 DB 종류에 맞는 검색 백엔드
+    """
+    backend_path = getattr(settings, "POSTS_SEARCH_BACKEND", None)
+    if backend_path is None:
+        backend_path = DEFAULT_SEARCH_BACKENDS.get(
+            connection.vendor, "posts.services.search_services.LikeSearchBackend"
+        )
+        if connection.vendor == "sqlite" and not _has_search_table():
+            backend_path = "posts.services.search_services.LikeSearchBackend"
+    return _load_search_backend(backend_path)
+
+
+@lru_cache(maxsize=None)
+def _has_search_table() -> bool:
+    return SEARCH_TABLE in connection.introspection.table_names()
@@ -0,0 +1,278 @@
+import contextlib
+import datetime
+import functools
+import itertools
+import multiprocessing
+import os
+import random
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, connections, transaction
+from django.db.models import F, Max
+
+from posts.models import Like, Post, PostTag, TagName
+from posts.services.cache_services import get_list_cache
+from posts.services.fragment_services import get_fragment_cache
+from posts.services.hot_services import hot_score
+from posts.services.tag_services import tag_id_cache
+from users.models import User
+
+DATASET_PRESETS = {
+    "1k": {"posts": 1_000, "users": 100, "tags": 50},
+    "100k": {"posts": 100_000, "users": 2_000, "tags": 1_000},
+    "1m": {"posts": 1_000_000, "users": 20_000, "tags": 5_000},
+}
+
+SEED_WORDS = [
+    "서울",
+    "맛집",
+    "여행",
+    "카페",
+    "운동",
+    "독서",
+    "영화",
+    "음악",
+    "공부",
+    "개발",
+    "요리",
+    "주말",
+    "산책",
+    "사진",
+    "바다",
+    "캠핑",
+    "브런치",
+    "디저트",
+    "전시",
+    "공연",
+]
+
+SEED_DAYS = 365
+
+# 작성일의 기준 시각 (실행한 날짜와 상관없이 같은 seed 면 같은 작성일/hot 점수가 되도록 고정)
+SEED_ANCHOR = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+# 해시태그/좋아요 사용자 인기도의 Zipf 지수 (순위 r 의 비율이 1 / r^s)
+ZIPF_EXPONENT = 1.1
+
+MAX_SEED_WORKERS = 8
+
+# SQLite 에서 process 들이 번갈아 쓰도록 나누어 쓰는 잠금 (fork 한 worker 에서만 설정)
+_write_lock = None
+
+
+def _next_id(model) -> int:
+    return (model.objects.aggregate(max_id=Max("id"))["max_id"] or 0) + 1
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(SEED_WORDS) for _ in range(words))
+
+
+@functools.lru_cache(maxsize=8)
+def zipf_cum_weights(size: int, exponent: float = ZIPF_EXPONENT) -> List[float]:
+    """
+    Args:
+        size (int) : 순위 수
+        exponent (float) : Zipf 지수
+
+    Returns:
+        List[float] : random.choices(cum_weights=) 에 넘길 누적 비율 (1위가 가장 많이 뽑힘)
+    """
+    return list(
+        itertools.accumulate(1 / rank**exponent for rank in range(1, size + 1))
+    )
+
+
+def _zipf_sample(rng: random.Random, ids: range, k: int) -> List[int]:
+    # Zipf 비율로 서로 다른 id 를 k 개 고른다 (뽑힌 id 가 많아지면 나머지는 고르게 채움)
+    cum_weights = zipf_cum_weights(len(ids))
+    picked = dict.fromkeys(rng.choices(ids, cum_weights=cum_weights, k=k))
+    while len(picked) < k:
+        picked.setdefault(rng.choice(ids))
+    return list(picked)
+
+
+class SeedPlan(NamedTuple):
+    seed: int
+    first_user: int
+    users: int
+    first_tag: int
+    tags: int
+    anchor: datetime.datetime
+
+
+def _seed_chunk(plan: SeedPlan, chunk: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    """
+    게시글 id [start, stop) 을 만들어 트랜잭션 1번으로 넣는다.
+    chunk 번호로 random seed 를 정하므로 어느 process 가 어떤 순서로 넣어도 같은 데이터가 된다.
+
+    Returns:
+        Tuple[int, int, int] : (게시글 수, 게시글-해시태그 수, 좋아요 수)
+    """
+    index, start, stop = chunk
+    rng = random.Random(f"{plan.seed}:{index}")
+    user_ids = range(plan.first_user, plan.first_user + plan.users)
+    tag_ids = range(plan.first_tag, plan.first_tag + plan.tags)
+    post_rows, created_dates, post_tag_rows, like_rows = [], [], [], []
+    for post_id in range(start, stop):
+        created_date = plan.anchor - datetime.timedelta(
+            seconds=rng.randrange(SEED_DAYS * 86400)
+        )
+        # 좋아요 수는 꼬리가 긴 분포(대부분 0~2개, 일부 게시글에 몰림), 좋아요 사용자는 Zipf
+        like_count = min(int(rng.paretovariate(1.5)) - 1, plan.users // 2)
+        likers = _zipf_sample(rng, user_ids, like_count)
+        views = min(int(rng.paretovariate(1.2)) - 1, 1_000_000)
+        post_rows.append(
+            Post(
+                id=post_id,
+                writer_id=rng.choice(user_ids),
+                title=f"{_sentence(rng, 3)} {post_id}",
+                content=_sentence(rng, rng.randint(5, 40)),
+                views=views,
+                like_count=like_count,
+                hot_score=hot_score(created_date, like_count, views),
+                is_active=rng.random() >= 0.02,
+            )
+        )
+        created_dates.append(created_date)
+        post_tag_rows += [
+            PostTag(posts_id=post_id, tags_id=tag_id)
+            for tag_id in _zipf_sample(rng, tag_ids, min(rng.randint(0, 3), plan.tags))
+        ]
+        like_rows += [Like(user_id=user_id, post_id=post_id) for user_id in likers]
+
+    with _write_lock or contextlib.nullcontext(), transaction.atomic():
+        Post.objects.bulk_create(post_rows)
+        # bulk_create 는 auto_now_add/auto_now 인 작성/수정시간을 현재 시각으로 넣으므로 넣은 뒤에 바꾼다
+        for post, created_date in zip(post_rows, created_dates):
+            post.created_date = created_date
+        Post.objects.bulk_update(post_rows, ["created_date"])
+        Post.objects.filter(id__gte=start, id__lt=stop).update(
+            updated_date=F("created_date")
+        )
+        PostTag.objects.bulk_create(post_tag_rows)
+        Like.objects.bulk_create(like_rows)
+    return len(post_rows), len(post_tag_rows), len(like_rows)
+
+
+def _init_seed_worker(write_lock) -> None:
+    global _write_lock
+    _write_lock = write_lock
+
+
+def _seed_worker_count(workers: Optional[int]) -> int:
+    # 메모리 SQLite(테스트 DB)는 다른 process 에서 열 수 없고, fork 가 없으면 process 를 나누지 않는다
+    if (
+        connection.vendor == "sqlite" and connection.is_in_memory_db()
+    ) or "fork" not in multiprocessing.get_all_start_methods():
+        return 1
+    if workers is None:
+        workers = min(os.cpu_count() or 1, MAX_SEED_WORKERS)
+    return max(workers, 1)
+
+
+def seed_dataset(
+    posts: int,
+    users: int,
+    tags: int,
+    seed: int = 0,
+    chunk_size: int = 5000,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    anchor: Optional[datetime.datetime] = None,
+) -> Dict[str, int]:
+    """
+        측정용 사용자, 해시태그, 게시글, 게시글-해시태그, 좋아요를 bulk_create 로 chunk_size 개씩 넣는다.
+        PK 를 직접 정해 넣으므로 다시 읽지 않고 관계를 만들며, 해시태그와 좋아요 사용자는 Zipf 분포로 고른다.
+        게시글 chunk 는 workers 개의 process 가 나누어 만들고 넣는다 (SQLite 는 쓰기를 잠금으로 1개씩 실행하고
+        row 를 만드는 작업만 나누어진다). 같은 seed, chunk_size, anchor 면 workers 수나 실행한 날짜와 상관없이
+    같은 데이터가 만들어진다.
+
+        Args:
+            posts (int) : 만들 게시글 수
+            users (int) : 만들 사용자 수 (게시글 작성자, 좋아요 사용자)
+            tags (int) : 만들 해시태그 수
+            seed (int) : random seed
+            chunk_size (int) : 트랜잭션 1번에 넣는 게시글 수 (process 1개가 한번에 메모리에 두는 양)
+            workers (int) : 게시글을 나누어 넣을 process 수 (없으면 CPU 수, 최대 MAX_SEED_WORKERS)
+            progress (Callable[[int], None]) : chunk 마다 지금까지 넣은 게시글 수로 호출
+            anchor (datetime) : 작성일 기준 시각, 게시글은 이 시각 이전 SEED_DAYS 일 사이에 작성됨 (없으면 SEED_ANCHOR)
+
+        Returns:
+            Dict[str, int] : 테이블별로 넣은 row 수 {"users", "tags", "posts", "post_tags", "likes"}
+
+        Raises:
+            ValueError : 수가 올바르지 않을 경우
+    """
+    if posts < 0 or users < 1 or tags < 1 or chunk_size < 1:
+        raise ValueError("posts 는 0 이상, users/tags/chunk_size 는 1 이상이어야 합니다")
+    first_user = _next_id(User)
+    first_tag = _next_id(TagName)
+    first_post = _next_id(Post)
+    unusable_password = make_password(None)
+    plan = SeedPlan(seed, first_user, users, first_tag, tags, anchor or SEED_ANCHOR)
+
+    with transaction.atomic():
+        User.objects.bulk_create(
+            [
+                User(
+                    id=user_id,
+                    username=f"u{user_id}",
+                    email=f"u{user_id}@seed.local",
+                    password=unusable_password,
+                )
+                for user_id in range(first_user, first_user + users)
+            ],
+            batch_size=chunk_size,
+        )
+        TagName.objects.bulk_create(
+            [
+                TagName(id=tag_id, name=f"tag{tag_id}")
+                for tag_id in range(first_tag, first_tag + tags)
+            ],
+            batch_size=chunk_size,
+        )
+
+    last_post = first_post + posts
+    chunks = [
+        (index, start, min(start + chunk_size, last_post))
+        for index, start in enumerate(range(first_post, last_post, chunk_size))
+    ]
+    counts = {"users": users, "tags": tags, "posts": 0, "post_tags": 0, "likes": 0}
+    workers = min(_seed_worker_count(workers), max(len(chunks), 1))
+    if workers > 1:
+        # fork 된 process 가 부모의 DB 연결을 같이 쓰지 않도록 먼저 닫는다 (process 마다 새로 연결)
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        # SQLite 의 deferred 트랜잭션은 다른 process 가 쓰는 중이면 기다리지 않고 "database is locked" 로
+        # 실패하므로 쓰기만 잠금으로 1개씩 실행한다 (row 를 만드는 작업은 동시에 실행)
+        write_lock = context.Lock() if connection.vendor == "sqlite" else None
+        pool = context.Pool(workers, _init_seed_worker, (write_lock,))
+        results = pool.imap_unordered(functools.partial(_seed_chunk, plan), chunks)
+    else:
+        pool = None
+        results = (_seed_chunk(plan, chunk) for chunk in chunks)
+    try:
+        for chunk_posts, chunk_post_tags, chunk_likes in results:
+            counts["posts"] += chunk_posts
+            counts["post_tags"] += chunk_post_tags
+            counts["likes"] += chunk_likes
+            if progress is not None:
+                progress(counts["posts"])
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    # PK 를 직접 넣었으므로 PostgreSQL 등의 sequence 를 마지막 id 뒤로 옮긴다
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(
+            no_style(), [User, TagName, Post, PostTag, Like]
+        ):
+            cursor.execute(sql)
+    get_list_cache().clear()
+    get_fragment_cache().clear()
+    tag_id_cache.clear()
+    return counts
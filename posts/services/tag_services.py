@@ -0,0 +1,141 @@
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+from posts.models import PostTag, TagName
+from posts.services.cache_services import LRUCacheBackend
+from posts.services.timing_services import record_cache
+
+DEFAULT_TAG_CACHE = {"max_size": 10000, "timeout": 3600}
+
+tag_id_cache = LRUCacheBackend(
+    **(getattr(settings, "POSTS_TAG_CACHE", None) or DEFAULT_TAG_CACHE)
+)
+
+
+def parse_tags(tags: str) -> List[str]:
+    """
+    Args:
+        tags (str) : post의 hashtags /예시)"#맛집,#서울,#브런치 카페"
+
+    Returns:
+        List[str] : 중복을 제거한 해시태그 이름들 (입력 순서 유지)
+    """
+    tag_names = tags.replace(",", "").split("#")[1:]
+    return list(dict.fromkeys(tag_name for tag_name in tag_names if tag_name))
+
+
+def _cache_tag_ids(tag_ids: Dict[str, int]) -> None:
+    # 롤백될 수 있는 id가 다른 요청에 보이지 않도록 커밋 이후에 캐시한다
+    transaction.on_commit(
+        lambda: [tag_id_cache.set(name, tag_id) for name, tag_id in tag_ids.items()]
+    )
+
+
+def get_tag_ids(tag_names: Iterable[str]) -> Dict[str, int]:
+    """
+    Args:
+        tag_names (Iterable[str]) : 해시태그 이름들
+
+    Returns:
+        Dict[str, int] : 존재하는 해시태그의 {이름 : id} (캐시에 없는 이름만 IN 조회 1번)
+    """
+    tag_ids, missing_names = _get_cached_tag_ids(tag_names)
+    if missing_names:
+        found_tag_ids = dict(
+            TagName.objects.filter(name__in=missing_names).values_list("name", "id")
+        )
+        _cache_tag_ids(found_tag_ids)
+        tag_ids.update(found_tag_ids)
+    return tag_ids
+
+
+async def aget_tag_ids(tag_names: Iterable[str]) -> Dict[str, int]:
+    """
+    get_tag_ids 의 async 버전 (async 코드는 트랜잭션 밖에서 실행되므로 찾은 id를 바로 캐시한다)
+
+    Args:
+        tag_names (Iterable[str]) : 해시태그 이름들
+
+    Returns:
+        Dict[str, int] : 존재하는 해시태그의 {이름 : id} (캐시에 없는 이름만 IN 조회 1번)
+    """
+    tag_ids, missing_names = _get_cached_tag_ids(tag_names)
+    if missing_names:
+        found_tag_ids = {
+            name: tag_id
+            async for name, tag_id in TagName.objects.filter(
+                name__in=missing_names
+            ).values_list("name", "id")
+        }
+        for name, tag_id in found_tag_ids.items():
+            tag_id_cache.set(name, tag_id)
+        tag_ids.update(found_tag_ids)
+    return tag_ids
+
+
+def _get_cached_tag_ids(tag_names: Iterable[str]) -> Tuple[Dict[str, int], List[str]]:
+    tag_ids = {}
+    missing_names = []
+    for tag_name in tag_names:
+        tag_id = tag_id_cache.get(tag_name)
+        if tag_id is None:
+            missing_names.append(tag_name)
+        else:
+            tag_ids[tag_name] = tag_id
+    record_cache("tag", len(tag_ids), len(missing_names))
+    return tag_ids, missing_names
+
+
+def resolve_tag_ids(tag_names: Iterable[str]) -> Dict[str, int]:
+    """
+    Args:
+        tag_names (Iterable[str]) : 해시태그 이름들
+
+    Returns:
+        Dict[str, int] : {이름 : id} (없는 해시태그는 bulk_create(ignore_conflicts)로 한번에 생성)
+    """
+    tag_names = list(tag_names)
+    tag_ids = get_tag_ids(tag_names)
+    missing_names = [tag_name for tag_name in tag_names if tag_name not in tag_ids]
+    if missing_names:
+        TagName.objects.bulk_create(
+            [TagName(name=tag_name) for tag_name in missing_names],
+            ignore_conflicts=True,
+        )
+        created_tag_ids = dict(
+            TagName.objects.filter(name__in=missing_names).values_list("name", "id")
+        )
+        _cache_tag_ids(created_tag_ids)
+        tag_ids.update(created_tag_ids)
+    return tag_ids
+
+
+def sync_post_tags(post_id: int, tag_names: List[str]) -> List[str]:
+    """
+    게시글의 해시태그를 tag_names 와 같아지도록 없어진 것은 지우고 새로 생긴 것만 추가한다.
+
+    Args:
+        post_id (int) : 해시태그를 맞출 게시글의 PK
+        tag_names (List[str]) : 게시글이 가져야 할 해시태그 이름들
+
+    Returns:
+        List[str] : 추가되거나 지워진 해시태그 이름들
+    """
+    current_tags = dict(
+        PostTag.objects.filter(posts_id=post_id).values_list("tags__name", "tags_id")
+    )
+    stale_names = [name for name in current_tags if name not in tag_names]
+    new_names = [name for name in tag_names if name not in current_tags]
+    if stale_names:
+        PostTag.objects.filter(
+            posts_id=post_id,
+            tags_id__in=[current_tags[name] for name in stale_names],
+        ).delete()
+    if new_names:
+        tag_ids = resolve_tag_ids(new_names)
+        PostTag.objects.bulk_create(
+            [PostTag(posts_id=post_id, tags_id=tag_ids[name]) for name in new_names]
+        )
+    return stale_names + new_names
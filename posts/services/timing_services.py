@@ -0,0 +1,209 @@
+import functools
+import math
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import connections
+
+from posts.services.metrics_services import get_metrics_options
+
+DEFAULT_SERVER_TIMING = {"ENABLED": False, "LOG": True}
+
+
+def get_server_timing_options() -> Dict:
+    """
+    Returns:
+        Dict : settings.POSTS_SERVER_TIMING 을 기본값과 합친 설정 ({"ENABLED", "LOG"})
+    """
+    return {
+        **DEFAULT_SERVER_TIMING,
+        **getattr(settings, "POSTS_SERVER_TIMING", {}),
+    }
+
+
+class RequestTimings:
+    """
+    요청 1개의 단계별 시간(ms)과 SQL 쿼리 수/시간을 모은다
+    """
+
+    __slots__ = ("stages", "sql_count", "sql_time", "cache_counts")
+
+    def __init__(self):
+        self.stages = {}
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.cache_counts = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds * 1000
+
+    def add_query(self, seconds: float) -> None:
+        self.sql_count += 1
+        self.sql_time += seconds * 1000
+
+    def add_cache(self, cache: str, hits: int, misses: int) -> None:
+        counts = self.cache_counts.setdefault(cache, [0, 0])
+        counts[0] += hits
+        counts[1] += misses
+
+    def as_header(self, total: float) -> str:
+        """
+        Args:
+            total (float) : 요청 전체 시간(ms)
+
+        Returns:
+            str : Server-Timing 헤더 값 /예시) sql;dur=1.20;desc="3 queries", read;dur=0.05, total;dur=4.10
+        """
+        metrics = [f'sql;dur={self.sql_time:.2f};desc="{self.sql_count} queries"']
+        metrics += [f"{name};dur={ms:.2f}" for name, ms in self.stages.items()]
+        metrics.append(f"total;dur={total:.2f}")
+        return ", ".join(metrics)
+
+    def as_dict(self) -> Dict:
+        return {
+            "sql_count": self.sql_count,
+            "sql_ms": round(self.sql_time, 2),
+            **{f"{name}_ms": round(ms, 2) for name, ms in self.stages.items()},
+        }
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "posts_request_timings", default=None
+)
+
+
+def get_current_timings() -> Optional[RequestTimings]:
+    """
+    Returns:
+        Optional[RequestTimings] : 측정 중인 요청의 RequestTimings (없으면 None)
+    """
+    return _current_timings.get()
+
+
+def begin_timings():
+    """
+    Returns:
+        Tuple[RequestTimings, Token] : 이번 요청의 RequestTimings 와 end_timings 에 넘길 token
+    """
+    timings = RequestTimings()
+    return timings, _current_timings.set(timings)
+
+
+def end_timings(token) -> None:
+    _current_timings.reset(token)
+
+
+class StageTimer:
+    """
+    블록(또는 decorator 로 감싼 함수)의 시간을 현재 요청의 단계 시간에 더한다.
+    측정 중인 요청이 없으면(Server-Timing 이 꺼져 있으면) ContextVar 1번만 읽고 넘어간다.
+    """
+
+    __slots__ = ("name", "timings", "started")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.timings = _current_timings.get()
+        if self.timings is not None:
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.timings is not None:
+            self.timings.add(self.name, time.perf_counter() - self.started)
+            self.timings = None
+        return False
+
+    def __call__(self, func):
+        name = self.name
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with StageTimer(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+def timed(name: str) -> StageTimer:
+    """
+    사용 예시) with timed("search"): posts = search_posts(posts, search) / @timed("service")
+
+    Args:
+        name (str) : Server-Timing 에 나갈 단계 이름
+
+    Returns:
+        StageTimer : with 블록 또는 decorator 로 사용
+    """
+    return StageTimer(name)
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    connection.execute_wrappers 에 넣는 wrapper : 측정 중인 요청이면 쿼리 수와 시간을 더한다
+    """
+    timings = _current_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add_query(time.perf_counter() - started)
+
+
+def record_cache(cache: str, hits: int, misses: int) -> None:
+    """
+    측정 중인 요청이면 캐시 hit/miss 수를 더한다 (요청이 끝날 때 metric 으로 한번에 쓴다)
+
+    Args:
+        cache (str) : 캐시 이름 (list, count, fragment, tag)
+        hits (int) : 캐시에 있던 항목 수
+        misses (int) : 캐시에 없던 항목 수
+    """
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add_cache(cache, hits, misses)
+
+
+def install_query_timer(sender, connection, **kwargs) -> None:
+    """
+    connection_created signal receiver. Server-Timing 이나 metric 이 켜져 있으면 연결에 record_query 를 1번만 넣는다.
+    (둘 다 꺼져 있으면 쿼리마다 드는 비용이 없도록 넣지 않는다)
+
+    Args:
+        sender : DB backend 의 DatabaseWrapper class
+        connection (DatabaseWrapper) : 새로 만든 DB 연결
+    """
+    if not (get_server_timing_options()["ENABLED"] or get_metrics_options()["ENABLED"]):
+        return
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def install_query_timers() -> None:
+    # 설정을 켜기 전에 열린 현재 thread 의 연결에도 쿼리 측정을 넣는다
+    for connection in connections.all(initialized_only=True):
+        install_query_timer(None, connection)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    bench, bench_http management command 의 p50/p95/p99 계산
+
+    Args:
+        values (List[float]) : 측정값들
+        percent (float) : 구할 백분위 (0 ~ 100)
+
+    Returns:
+        float : nearest-rank 방식의 백분위 값 (측정값이 없으면 0)
+    """
+    if not values:
+        return 0.0
+    values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
@@ -0,0 +1,167 @@
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.db.models import F
+
+from posts.models import Post
+from posts.services.hot_services import hot_score_change
+from posts.services.metrics_services import record_view_count_stats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VIEW_COUNT = {"FLUSH_INTERVAL": 5, "BATCH_SIZE": 500}
+
+
+class ViewCountBuffer:
+    """
+    게시글 조회수 증가분을 메모리에 모아두었다가 F("views") + n 으로 한번에 반영한다. (hot_score 도 같은 UPDATE 에서 반영)
+    증가분이 같은 게시글끼리 묶어 batch_size개씩 UPDATE 하므로 조회 1번마다 row 전체를 저장하지 않는다.
+    """
+
+    def __init__(self, flush_interval: float = 5, batch_size: int = 500):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.flushed_views = 0
+        self.flush_count = 0
+        self._pending = defaultdict(int)
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, post_id: int, count: int = 1) -> int:
+        """
+        Args:
+            post_id (int) : 조회된 게시글의 PK
+            count (int) : 늘어난 조회수
+
+        Returns:
+            int : 아직 DB에 반영되지 않은 해당 게시글의 조회수 증가분
+        """
+        with self._lock:
+            self._pending[post_id] += count
+            return self._pending[post_id]
+
+    def is_due(self) -> bool:
+        """
+        Returns:
+            bool : flush_interval 이 지났거나 쌓인 게시글 수가 batch_size 이상인지 여부
+        """
+        return (
+            len(self._pending) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    def flush_if_due(self) -> int:
+        """
+        Returns:
+            int : DB에 반영한 조회수 (반영할 때가 아니면 0)
+        """
+        if not self.is_due():
+            return 0
+        return self.flush()
+
+    def flush(self) -> int:
+        """
+        Returns:
+            int : DB에 반영한 조회수
+        """
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+            self._last_flush = time.monotonic()
+        post_ids_by_count = defaultdict(list)
+        for post_id, count in pending.items():
+            post_ids_by_count[count].append(post_id)
+
+        flushed_views = 0
+        for count, post_ids in post_ids_by_count.items():
+            for start in range(0, len(post_ids), self.batch_size):
+                batch = post_ids[start : start + self.batch_size]
+                try:
+                    # 조회수 반영은 client 의 쓰기가 아니므로 router 를 거치지 않고 primary 에 직접 써서
+                    # 조회한 client 가 primary 에 고정되지 않게 한다
+                    Post.objects.using(DEFAULT_DB_ALIAS).filter(id__in=batch).update(
+                        views=F("views") + count,
+                        hot_score=hot_score_change(views=F("views") + count),
+                    )
+                except DatabaseError:
+                    logger.exception("view count flush failed")
+                    for post_id in batch:
+                        self.add(post_id, count)
+                    continue
+                flushed_views += count * len(batch)
+
+        with self._lock:
+            self.flushed_views += flushed_views
+            self.flush_count += 1
+        return flushed_views
+
+    def start(self) -> None:
+        """
+        요청이 없어도 flush_interval 마다 반영하도록 백그라운드 스레드를 시작한다.
+        (gunicorn.conf.py post_worker_init 에서 worker 마다 호출)
+        """
+        if getattr(self, "_thread", None) is not None:
+            return
+
+        def run():
+            while True:
+                time.sleep(self.flush_interval)
+                if self._pending:
+                    self.flush()
+                # 요청이 없는 worker 도 /metrics 의 대기중인 조회수가 flush 후 값으로 바뀌도록 쓴다
+                record_view_count_stats(self.stats())
+                connections.close_all()
+
+        self._thread = threading.Thread(
+            target=run, name="view-count-flush", daemon=True
+        )
+        self._thread.start()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int] : {
+                "pending_posts" : 반영 대기중인 게시글 수,
+                "pending_views" : 반영 대기중인 조회수,
+                "flushed_views" : 지금까지 반영한 조회수,
+                "flush_count" : flush 횟수
+            }
+        """
+        with self._lock:
+            return {
+                "pending_posts": len(self._pending),
+                "pending_views": sum(self._pending.values()),
+                "flushed_views": self.flushed_views,
+                "flush_count": self.flush_count,
+            }
+
+
+_view_count_config = getattr(settings, "POSTS_VIEW_COUNT", None) or DEFAULT_VIEW_COUNT
+view_count_buffer = ViewCountBuffer(
+    flush_interval=_view_count_config["FLUSH_INTERVAL"],
+    batch_size=_view_count_config["BATCH_SIZE"],
+)
+
+
+def flush_view_counts() -> int:
+    """
+    worker 종료 시(gunicorn.conf.py worker_exit, atexit) 남은 조회수를 반영한다.
+
+    Returns:
+        int : DB에 반영한 조회수
+    """
+    try:
+        flushed_views = view_count_buffer.flush()
+        record_view_count_stats(view_count_buffer.stats())
+        return flushed_views
+    except Exception:
+        logger.exception("view count flush on shutdown failed")
+        return 0
+
+
+atexit.register(flush_view_counts)
@@ -0,0 +1,40 @@
+import time
+
+from django.db import connection
+
+from posts.services.perf_baseline_services import (check_measurement,
+                                                   perf_recorder)
+
+
+class PerfBaselineMixin:
+    """
+    테스트 1개(setUp 이후부터 tearDown 까지)의 SQL 쿼리 수와 시간을 재어 perf_baseline.json 의 기준과 비교한다.
+    기준보다 쿼리가 많아지거나(N+1 등) 허용 시간을 넘으면 테스트가 실패한다.
+    의도한 변경이면 python manage.py refresh_perf_baseline 으로 기준을 갱신한다.
+    """
+
+    def setUp(self):
+        super().setUp()
+        query_count = [0]
+
+        def count_query(execute, sql, params, many, context):
+            query_count[0] += 1
+            return execute(sql, params, many, context)
+
+        connection.execute_wrappers.append(count_query)
+        self.addCleanup(
+            self._check_perf_baseline, count_query, query_count, time.perf_counter()
+        )
+
+    def _check_perf_baseline(self, count_query, query_count, started):
+        ms = (time.perf_counter() - started) * 1000
+        connection.execute_wrappers.remove(count_query)
+        if perf_recorder.recording:
+            perf_recorder.record(self.id(), query_count[0], ms)
+            return
+        problems = check_measurement(self.id(), query_count[0], ms)
+        if problems:
+            self.fail(
+                f"성능 기준을 넘었습니다 : {', '.join(problems)} "
+                "(의도한 변경이면 python manage.py refresh_perf_baseline)"
+            )
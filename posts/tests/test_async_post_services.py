@@ -0,0 +1,134 @@
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+
+from posts.models import Post, PostTag, TagName
+from posts.renderers import PostFragmentJSONRenderer
+from posts.services.cache_services import get_list_cache
+from posts.services.fragment_services import get_fragment_cache
+from posts.services.post_services import (acursor_pagination_posts,
+                                          afiltering_posts,
+                                          apagination_post_ids,
+                                          aread_detail_post,
+                                          aread_posts_by_ids,
+                                          arender_posts_by_ids, asearch_posts,
+                                          atoggle_like,
+                                          cursor_pagination_posts,
+                                          filtering_posts, pagination_post_ids,
+                                          read_detail_post, read_posts,
+                                          read_posts_by_ids, search_posts)
+from posts.services.tag_services import tag_id_cache
+from posts.services.view_services import view_count_buffer
+from users.models import User
+
+
+class TestAsyncPostService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        tag_data1 = TagName.objects.create(name="sns")
+        tag_data2 = TagName.objects.create(name="서울")
+
+        for i in range(5):
+            post = Post.objects.create(
+                writer=user,
+                title=f"test_title{i}",
+                content=f"test_content{i}",
+                views=i * 10,
+                like_count=i % 3,
+            )
+            PostTag.objects.create(tags=tag_data1, posts=post)
+            if i % 2:
+                PostTag.objects.create(tags=tag_data2, posts=post)
+
+    def tearDown(self):
+        get_list_cache().clear()
+        get_fragment_cache().clear()
+        tag_id_cache.clear()
+        view_count_buffer.flush()
+
+    async def test_async_list_services_match_sync(self):
+        """
+        게시글 목록 async service(asearch_posts, afiltering_posts, apagination_post_ids) 검증
+        case : 검색어, 해시태그(and/or), 페이지를 바꿔가며 sync service 와 비교할 경우
+        result : 정상/sync service 와 같은 게시글 id, 다음 페이지 여부
+        """
+        for search, tags, mode, page in [
+            ("", "", "and", 1),
+            ("test", "sns,서울", "and", 1),
+            ("content3", "", "and", 1),
+            ("", "sns,없는태그", "or", 2),
+            ("", "sns,없는태그", "and", 1),
+        ]:
+            posts = read_posts("views", 1)
+
+            def sync_page():
+                sync_posts = filtering_posts(search_posts(posts, search), tags, mode)
+                return pagination_post_ids(sync_posts, 2, page)
+
+            async_posts = await afiltering_posts(
+                await asearch_posts(posts, search), tags, mode
+            )
+            self.assertEqual(
+                await apagination_post_ids(async_posts, 2, page),
+                await self.sync(sync_page),
+            )
+
+    async def test_async_render_services_match_sync(self):
+        """
+        게시글 목록/상세 async service(aread_posts_by_ids, arender_posts_by_ids, aread_detail_post) 검증
+        case : 조각이 없을 때와 저장된 이후 / 상세 조회
+        result : 정상/sync service 와 같은 JSON, 상세 조회는 조회수 +1
+        """
+        post_ids = [post.id async for post in Post.objects.order_by("-id")]
+        expected = await self.sync(read_posts_by_ids, post_ids)
+
+        self.assertEqual(await aread_posts_by_ids(post_ids), expected)
+        for _ in range(2):
+            rendered = await arender_posts_by_ids(post_ids)
+            self.assertEqual(
+                PostFragmentJSONRenderer().render(rendered),
+                PostFragmentJSONRenderer().render(expected),
+            )
+
+        post = await aread_detail_post(post_ids[0])
+        detail = await self.sync(read_detail_post, post_ids[0])
+        self.assertEqual(
+            PostFragmentJSONRenderer().render(post),
+            PostFragmentJSONRenderer().render(dict(detail, views=detail["views"] - 1)),
+        )
+        with self.assertRaises(Post.DoesNotExist):
+            await aread_detail_post(10000)
+
+    async def test_acursor_pagination_posts(self):
+        """
+        커서 페이징 async service(acursor_pagination_posts) 검증
+        case : 첫 페이지와 next 커서로 다음 페이지를 조회할 경우
+        result : 정상/cursor_pagination_posts 와 같은 결과
+        """
+        posts = read_posts("likes", 1)
+        cursor = ""
+        for _ in range(3):
+            result = await acursor_pagination_posts(posts, "likes", 1, 2, cursor)
+            expected = await self.sync(
+                cursor_pagination_posts, posts, "likes", 1, 2, cursor
+            )
+            self.assertEqual(result, expected)
+            cursor = result["next"]
+        self.assertIsNone(cursor)
+
+    async def test_atoggle_like(self):
+        """
+        좋아요 async service(atoggle_like) 검증
+        case : 같은 사용자가 두번 좋아요를 누를 경우
+        result : 정상/좋아요 후 좋아요 취소, 좋아요 수 원래대로
+        """
+        user = await User.objects.aget(username="test_user")
+        post = await Post.objects.aget(title="test_title1")
+
+        self.assertEqual(await atoggle_like(user, post.id), (True, 2))
+        self.assertEqual(await atoggle_like(user, post.id), (False, 1))
+
+    async def sync(self, func, *args):
+        return await sync_to_async(func)(*args)
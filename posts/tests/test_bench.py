@@ -0,0 +1,164 @@
+import datetime
+import io
+import json
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count, F
+from django.test import TestCase
+
+from posts.management.commands.bench import BENCH_CASES, public_functions
+from posts.models import Like, Post, PostTag
+from posts.services import post_services
+from posts.services.cache_services import get_list_cache
+from posts.services.fragment_services import get_fragment_cache
+from posts.services.seed_services import SEED_ANCHOR, seed_dataset
+from posts.services.tag_services import tag_id_cache
+from posts.services.view_services import view_count_buffer
+from users.services import user_services
+
+
+class TestSeedService(TestCase):
+    def test_seed_dataset(self):
+        """
+        측정용 데이터를 만드는 seed_dataset service 검증
+        case : 같은 seed 로 2번 만들 경우
+        result : 정상/요청한 수만큼 만들어지고, 2번째 데이터가 1번째와 같은 제목/좋아요 수/작성일/hot 점수
+        """
+        fields = ("title", "like_count", "created_date", "hot_score")
+        counts = seed_dataset(posts=30, users=5, tags=4, seed=7, chunk_size=8)
+        first = list(Post.objects.order_by("id").values_list(*fields))
+        self.assertEqual(len(first), 30)
+        self.assertEqual(PostTag.objects.count(), counts["post_tags"])
+        self.assertEqual(Like.objects.count(), counts["likes"])
+        self.assertEqual(sum(row[1] for row in first), Like.objects.count())
+        self.assertLessEqual(max(row[2] for row in first), SEED_ANCHOR)
+        self.assertFalse(Post.objects.exclude(updated_date=F("created_date")).exists())
+
+        seed_dataset(posts=30, users=5, tags=4, seed=7, chunk_size=8)
+        second = list(Post.objects.order_by("id").values_list(*fields)[30:])
+        # 제목 끝에는 게시글 id 가 붙으므로 앞부분만 비교한다
+        self.assertEqual(
+            [(title.rsplit(" ", 1)[0], *rest) for title, *rest in first],
+            [(title.rsplit(" ", 1)[0], *rest) for title, *rest in second],
+        )
+
+    def test_seed_goals_command(self):
+        """
+        seed_goals management command 검증
+        case : 게시글 300개, 해시태그 20개를 chunk 50개씩 만들 경우
+        result : 정상/요청한 수만큼 --anchor 이전에 작성되고, 해시태그는 Zipf 분포(1위 해시태그가 가장 많이 쓰임)
+        """
+        stdout = io.StringIO()
+        call_command(
+            "seed_goals",
+            "--posts",
+            "300",
+            "--users",
+            "20",
+            "--tags",
+            "20",
+            "--chunk-size",
+            "50",
+            "--workers",
+            "4",
+            "--anchor",
+            "2024-06-01",
+            stdout=stdout,
+            stderr=io.StringIO(),
+        )
+
+        self.assertIn("posts=300", stdout.getvalue())
+        self.assertLessEqual(
+            Post.objects.latest("created_date").created_date,
+            datetime.datetime(2024, 6, 1, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(Post.objects.count(), 300)
+        tag_counts = list(
+            PostTag.objects.values("tags")
+            .annotate(count=Count("id"))
+            .order_by("tags")
+            .values_list("count", flat=True)
+        )
+        self.assertEqual(max(tag_counts), tag_counts[0])
+        self.assertGreater(tag_counts[0], tag_counts[-1] * 3)
+
+
+class TestBenchCommand(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.output = os.path.join(self.directory.name, "bench.json")
+
+    def tearDown(self):
+        get_list_cache().clear()
+        get_fragment_cache().clear()
+        tag_id_cache.clear()
+        view_count_buffer.flush()
+
+    def test_bench_cases_cover_services(self):
+        """
+        bench 의 측정 case 검증
+        case : post_services, user_services 의 public 함수를 모두 확인할 경우
+        result : 정상/모든 public 함수에 측정 case 가 있음
+        """
+        for module in [post_services, user_services]:
+            for name, _ in public_functions(module):
+                self.assertIn(name, BENCH_CASES)
+
+    def test_bench_command(self):
+        """
+        bench management command 검증
+        case : 빈 DB 에 작은 데이터를 만들고 모든 함수를 잴 경우
+        result : 정상/함수마다 p50/p95/p99, 처리량, 쿼리 수가 담긴 JSON
+        """
+        call_command(
+            "bench",
+            "--posts",
+            "40",
+            "--users",
+            "5",
+            "--tags",
+            "5",
+            "--iterations",
+            "2",
+            "--warmup",
+            "1",
+            "--output",
+            self.output,
+            stdout=io.StringIO(),
+            stderr=io.StringIO(),
+        )
+
+        with open(self.output, encoding="utf-8") as f:
+            report = json.load(f)
+        self.assertEqual(report["meta"]["seed"], 0)
+        self.assertEqual(report["meta"]["posts"], 40)
+        self.assertEqual(report["missing"], [])
+        self.assertEqual(len(report["results"]), len(BENCH_CASES))
+        for name, result in report["results"].items():
+            self.assertNotIn("error", result, name)
+            self.assertEqual(result["iterations"], 2)
+            self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+            self.assertGreater(result["ops_per_sec"], 0)
+        self.assertEqual(
+            report["results"]["post_services.pagination_posts"]["queries_per_call"], 2
+        )
+        self.assertEqual(
+            report["results"]["post_services.apagination_post_ids"]["queries_per_call"],
+            1,
+        )
+
+    def test_fail_bench_command_not_empty_database(self):
+        """
+        bench management command 검증
+        case : 게시글이 있는 DB 에서 --reuse 없이 실행하거나, 없는 함수를 고를 경우
+        result : 실패/CommandError 발생
+        """
+        seed_dataset(posts=1, users=1, tags=1)
+        with self.assertRaises(CommandError):
+            call_command("bench", "--output", self.output)
+        with self.assertRaises(CommandError):
+            call_command("bench", "--reuse", "--function", "unknown")
@@ -0,0 +1,59 @@
+import io
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import LiveServerTestCase
+
+from posts.models import Post
+from posts.services.cache_services import get_list_cache
+from posts.services.fragment_services import get_fragment_cache
+from users.models import User
+
+
+class TestBenchHttpCommand(LiveServerTestCase):
+    def setUp(self):
+        user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        Post.objects.create(writer=user, title="test_title", content="test_content")
+
+    def tearDown(self):
+        get_list_cache().clear()
+        get_fragment_cache().clear()
+
+    def test_bench_http_command(self):
+        """
+        bench_http management command 검증
+        case : 실행 중인 서버의 게시글 목록에 동시 요청을 보낼 경우
+        result : 정상/URL 별 요청 수, 오류 수, rps, p50/p99 출력
+        """
+        stdout = io.StringIO()
+        call_command(
+            "bench_http",
+            "--url",
+            self.live_server_url + "/posts",
+            "--requests",
+            "20",
+            "--concurrency",
+            "2",
+            "--warmup",
+            "2",
+            stdout=stdout,
+        )
+
+        output = stdout.getvalue()
+        self.assertIn("requests=20 errors=0", output)
+        self.assertIn("p99=", output)
+
+    def test_fail_bench_http_command_bad_arguments(self):
+        """
+        bench_http management command 검증
+        case : URL 이나 헤더 형식이 잘못된 경우
+        result : 실패/CommandError 발생
+        """
+        with self.assertRaises(CommandError):
+            call_command("bench_http", "--url", "posts")
+        with self.assertRaises(CommandError):
+            call_command(
+                "bench_http", "--url", self.live_server_url, "--header", "broken"
+            )
@@ -0,0 +1,198 @@
+import time
+
+from django.test import TestCase
+
+from posts.models import Post, PostTag, TagName
+from posts.services.cache_services import (LRUCacheBackend,
+                                           aget_or_set_post_count,
+                                           get_list_cache,
+                                           get_or_set_post_count,
+                                           get_or_set_post_list)
+from posts.services.post_services import (create_post, like_post,
+                                          pagination_post_ids, read_posts,
+                                          reconcile_like_count)
+from posts.services.tag_services import tag_id_cache
+from users.models import User
+
+
+class TestCacheService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        tag_data1 = TagName.objects.create(name="sns")
+        tag_data2 = TagName.objects.create(name="apple")
+
+        created_data = Post.objects.create(
+            writer=user, title="test_title", content="test_content"
+        )
+        created_data2 = Post.objects.create(
+            writer=user, title="test_title2", content="test_content2"
+        )
+        PostTag.objects.create(tags=tag_data1, posts=created_data)
+        PostTag.objects.create(tags=tag_data2, posts=created_data2)
+
+    def tearDown(self):
+        get_list_cache().clear()
+        tag_id_cache.clear()
+
+    def load_page(self, order_by="created_date", tags="", search=""):
+        """
+        게시글 목록 캐시를 거쳐 한 페이지를 조회하고, 실제 DB 조회 여부를 함께 반환
+        """
+        loaded = []
+
+        def loader():
+            loaded.append(True)
+            return pagination_post_ids(read_posts(order_by, 1), 10, 1)
+
+        params = {
+            "order_by": order_by,
+            "reverse": 1,
+            "search": search,
+            "tags": tags,
+            "tags_mode": "and",
+            "page_size": 10,
+            "page": 1,
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            post_page = get_or_set_post_list(params, loader)
+        return post_page, bool(loaded)
+
+    def test_lru_cache_backend_evicts_oldest_and_expired(self):
+        """
+        프로세스 메모리 LRU 캐시 LRUCacheBackend 검증
+        case : 최대 개수를 넘거나 timeout이 지났을 경우
+        result : 정상/가장 오래 사용되지 않은 값과 만료된 값은 캐시에서 빠짐
+        """
+        lru_cache = LRUCacheBackend(max_size=2, timeout=60)
+        lru_cache.set("a", 1)
+        lru_cache.set("b", 2)
+        lru_cache.get("a")
+        lru_cache.set("c", 3)
+        self.assertIsNone(lru_cache.get("b"))
+        self.assertEqual(lru_cache.get("a"), 1)
+
+        lru_cache.set("d", 4, timeout=0)
+        time.sleep(0.001)
+        self.assertIsNone(lru_cache.get("d"))
+
+    def test_get_or_set_post_list_hit(self):
+        """
+        게시글 목록 캐시 get_or_set_post_list 검증
+        case : 같은 조회 조건으로 두번 조회할 경우
+        result : 정상/두번째는 DB를 조회하지 않고 같은 게시글 id를 반환
+        """
+        post_page, loaded = self.load_page()
+        self.assertTrue(loaded)
+        with self.assertNumQueries(0):
+            cached_post_page, loaded = self.load_page()
+        self.assertFalse(loaded)
+        self.assertEqual(post_page, cached_post_page)
+
+    def test_like_post_invalidates_only_likes_sort(self):
+        """
+        게시글 목록 캐시 무효화 검증
+        case : 좋아요를 했을 경우
+        result : 정상/좋아요수 정렬 목록만 다시 조회되고 작성일 정렬 목록은 캐시를 사용
+        """
+        self.load_page("created_date")
+        self.load_page("likes")
+        user = User.objects.get(username="test_user")
+        post = Post.objects.get(title="test_title")
+        with self.captureOnCommitCallbacks(execute=True):
+            like_post(user, post.id)
+        self.assertFalse(self.load_page("created_date")[1])
+        post_page, loaded = self.load_page("likes")
+        self.assertTrue(loaded)
+        self.assertEqual(post_page["post_ids"][0], post.id)
+
+    def test_reconcile_like_count_invalidates_likes_lists(self):
+        """
+        게시글 목록 캐시 무효화 검증
+        case : reconcile_like_count 로 좋아요 수가 보정되었을 경우
+        result : 정상/보정된 게시글의 해시태그와 전체의 좋아요순/hot 목록만 다시 조회
+        """
+        self.load_page("created_date")
+        self.load_page("likes")
+        self.load_page("hot")
+        self.load_page("likes", tags="sns")
+        self.load_page("likes", tags="apple")
+        post = Post.objects.get(title="test_title")
+        Post.objects.filter(id=post.id).update(like_count=10)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(reconcile_like_count(), 1)
+        self.assertFalse(self.load_page("created_date")[1])
+        self.assertTrue(self.load_page("likes")[1])
+        self.assertTrue(self.load_page("hot")[1])
+        self.assertTrue(self.load_page("likes", tags="sns")[1])
+        self.assertFalse(self.load_page("likes", tags="apple")[1])
+
+    def test_create_post_invalidates_only_its_tags(self):
+        """
+        게시글 목록 캐시 무효화 검증
+        case : 해시태그가 있는 게시글을 작성했을 경우
+        result : 정상/작성한 게시글의 해시태그 목록과 전체 목록만 다시 조회
+        """
+        self.load_page()
+        self.load_page(tags="sns")
+        self.load_page(tags="apple")
+        user = User.objects.get(username="test_user")
+        with self.captureOnCommitCallbacks(execute=True):
+            create_post(
+                {"title": "new_title", "content": "new_content", "tags": "#sns"}, user
+            )
+        self.assertTrue(self.load_page()[1])
+        self.assertTrue(self.load_page(tags="sns")[1])
+        self.assertFalse(self.load_page(tags="apple")[1])
+
+    def test_get_or_set_post_count(self):
+        """
+        게시글 수 캐시 get_or_set_post_count 검증
+        case : 캐시된 게시글 수가 있을 때 게시글이 늘어난 경우
+        result : 정상/기본은 캐시된 값을 반환하고, exact 이면 다시 세어 캐시를 갱신
+        """
+        params = {
+            "order_by": "created_date",
+            "search": "",
+            "tags": "",
+            "tags_mode": "and",
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            count = get_or_set_post_count(params, lambda: Post.objects.count())
+        self.assertEqual(count, 2)
+
+        user = User.objects.get(username="test_user")
+        Post.objects.create(writer=user, title="new_title", content="new_content")
+        with self.assertNumQueries(0):
+            count = get_or_set_post_count(params, lambda: Post.objects.count())
+        self.assertEqual(count, 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            count = get_or_set_post_count(
+                params, lambda: Post.objects.count(), exact=True
+            )
+        self.assertEqual(count, 3)
+        self.assertEqual(get_or_set_post_count(params, lambda: 0), 3)
+
+    async def test_aget_or_set_post_count_hit_skips_loader(self):
+        """
+        게시글 수 캐시 aget_or_set_post_count 검증
+        case : 캐시된 게시글 수가 있을 경우
+        result : 정상/게시글 QuerySet 을 만드는 함수(태그 id 조회 등)를 호출하지 않고 캐시된 값 반환
+        """
+        params = {
+            "order_by": "created_date",
+            "search": "",
+            "tags": "",
+            "tags_mode": "and",
+        }
+        loaded = []
+
+        async def load_posts():
+            loaded.append(True)
+            return Post.objects.all()
+
+        self.assertEqual(await aget_or_set_post_count(params, load_posts), 2)
+        self.assertEqual(await aget_or_set_post_count(params, load_posts), 2)
+        self.assertEqual(len(loaded), 1)
@@ -0,0 +1,114 @@
+from django.test import RequestFactory, TestCase
+
+from posts.models import Post
+from posts.services.conditional_services import (get_not_modified_response,
+                                                 post_detail_validators,
+                                                 post_list_validators)
+from posts.services.post_services import (read_detail_version,
+                                          read_post_versions)
+from users.models import User
+
+
+class TestConditionalService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        Post.objects.create(writer=user, title="test_title", content="test_content")
+        Post.objects.create(writer=user, title="test_title2", content="test_content2")
+
+    def list_validators(self, post_ids, count=2, has_next=False):
+        params = {"order_by": "created_date", "page_size": 10, "page": 1}
+        versions = read_post_versions(post_ids)
+        return post_list_validators(params, count, has_next, post_ids, versions)
+
+    def test_post_list_validators(self):
+        """
+        게시글 목록 ETag 를 만드는 post_list_validators service 검증
+        case : 게시글 내용/조회수/좋아요 수/순서/전체 게시글 수가 바뀌었을 경우
+        result : 정상/ETag 가 바뀌고, 바뀌지 않았으면 같은 ETag
+        """
+        post_ids = list(Post.objects.order_by("-id").values_list("id", flat=True))
+        etag = self.list_validators(post_ids)
+
+        self.assertEqual(self.list_validators(post_ids), etag)
+        self.assertNotEqual(self.list_validators(post_ids, count=3), etag)
+        self.assertNotEqual(self.list_validators(post_ids[::-1]), etag)
+        self.assertNotEqual(self.list_validators(post_ids[:1], count=1), etag)
+
+        Post.objects.filter(id=post_ids[0]).update(like_count=1)
+        self.assertNotEqual(self.list_validators(post_ids), etag)
+
+    def test_post_list_validators_query(self):
+        """
+        게시글 목록 ETag 를 만드는 post_list_validators service 검증
+        case : 페이지에 게시글이 없을 경우 / 게시글 id 로 validator 를 만들 경우
+        result : 정상/빈 페이지도 ETag 가 있고, 게시글 row 대신 (id, updated_date, 조회수, 좋아요 수)만 쿼리 1번
+        """
+        self.assertTrue(self.list_validators([], count=0))
+
+        post_ids = list(Post.objects.values_list("id", flat=True))
+        with self.assertNumQueries(1) as queries:
+            self.list_validators(post_ids)
+        self.assertNotIn("content", queries.captured_queries[0]["sql"])
+
+    def test_post_detail_validators(self):
+        """
+        게시글 상세 ETag/Last-Modified 를 만드는 post_detail_validators service 검증
+        case : 조회수만 바뀌었을 경우 / 좋아요 수가 바뀌었을 경우
+        result : 정상/조회수는 ETag 에 영향이 없고, 좋아요 수가 바뀌면 ETag 가 바뀜 (weak ETag)
+        """
+        post = Post.objects.get(title="test_title")
+        etag, last_modified = post_detail_validators(read_detail_version(post.id))
+        self.assertTrue(etag.startswith("W/"))
+        self.assertEqual(last_modified, post.updated_date)
+
+        Post.objects.filter(id=post.id).update(views=10)
+        self.assertEqual(post_detail_validators(read_detail_version(post.id))[0], etag)
+
+        Post.objects.filter(id=post.id).update(like_count=1)
+        self.assertNotEqual(
+            post_detail_validators(read_detail_version(post.id))[0], etag
+        )
+
+    def test_get_not_modified_response(self):
+        """
+        조건부 요청을 확인하는 get_not_modified_response service 검증
+        case : If-None-Match 가 같을 때 / 다를 때 / If-None-Match 없이 If-Modified-Since 만 있을 때
+        result : 정상/같으면 ETag 를 담은 304, 다르면 None, If-Modified-Since 는 Last-Modified 와 비교
+        """
+        post = Post.objects.get(title="test_title")
+        etag, last_modified = post_detail_validators(read_detail_version(post.id))
+        factory = RequestFactory()
+
+        response = get_not_modified_response(
+            factory.get("/", HTTP_IF_NONE_MATCH=etag), etag, last_modified
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertIsNone(
+            get_not_modified_response(
+                factory.get("/", HTTP_IF_NONE_MATCH='"other"'), etag, last_modified
+            )
+        )
+
+        request = factory.get(
+            "/", HTTP_IF_MODIFIED_SINCE="Sat, 01 Oct 2022 00:00:00 GMT"
+        )
+        self.assertIsNone(get_not_modified_response(request, etag, last_modified))
+        request = factory.get(
+            "/", HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT"
+        )
+        self.assertEqual(
+            get_not_modified_response(request, etag, last_modified).status_code, 304
+        )
+
+    def test_fail_read_detail_version_not_found(self):
+        """
+        게시글 상세 validator 를 읽는 read_detail_version service 검증
+        case : 없는 게시글일 경우
+        result : 실패/DoesNotExist 발생
+        """
+        with self.assertRaises(Post.DoesNotExist):
+            read_detail_version(10000)
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from posts.services.database_services import get_sqlite_pragmas
+
+
+class TestDatabaseService(TestCase):
+    def test_configure_sqlite_connection(self):
+        """
+        connection_created 에 연결된 configure_sqlite_connection service 검증
+        case : SQLite 연결이 만들어졌을 경우
+        result : 정상/settings.SQLITE_PRAGMAS 의 busy_timeout, synchronous 가 설정됨
+        """
+        if connection.vendor != "sqlite":
+            self.skipTest("SQLite 전용")
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(
+                cursor.fetchone()[0], settings.SQLITE_PRAGMAS["busy_timeout"]
+            )
+            cursor.execute("PRAGMA synchronous")
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+    @override_settings(SQLITE_PRAGMAS={"mmap_size": None, "cache_size": -16000})
+    def test_get_sqlite_pragmas(self):
+        """
+        SQLite PRAGMA 설정을 만드는 get_sqlite_pragmas service 검증
+        case : settings 에서 값을 None 으로 끄거나 새 PRAGMA 를 추가할 경우
+        result : 정상/기본값에 덮어쓰고 None 인 PRAGMA 는 빠짐
+        """
+        pragmas = get_sqlite_pragmas()
+
+        self.assertNotIn("mmap_size", pragmas)
+        self.assertEqual(pragmas["cache_size"], -16000)
+        self.assertEqual(pragmas["journal_mode"], "WAL")
+
+
+class TestStressWritesCommand(SimpleTestCase):
+    def test_stress_writes_50_writers(self):
+        """
+        stress_writes management command 검증
+        case : 파일 SQLite DB 에 writer 50개가 동시에 좋아요/조회수를 쓸 경우
+        result : 정상/"database is locked" 등 DB 오류 0건
+        """
+        if connection.vendor != "sqlite":
+            self.skipTest("SQLite 전용")
+        manage_py = os.path.join(settings.BASE_DIR, "manage.py")
+        with tempfile.TemporaryDirectory() as directory:
+            env = dict(
+                os.environ,
+                DB_ENGINE="sqlite",
+                SQLITE_PATH=os.path.join(directory, "stress.sqlite3"),
+                SECRET_KEY=settings.SECRET_KEY or "stress",
+            )
+            subprocess.run(
+                [sys.executable, manage_py, "migrate", "-v", "0"],
+                env=env,
+                check=True,
+                capture_output=True,
+            )
+            result = subprocess.run(
+                [sys.executable, manage_py, "stress_writes", "--writers", "50"],
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertIn("writers=50 ops=1000 errors=0", result.stdout)
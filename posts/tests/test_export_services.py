@@ -0,0 +1,118 @@
+import csv
+import io
+import json
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from posts.models import Post, PostTag, TagName
+from posts.services.export_services import (export_posts, parse_is_active,
+                                            parse_since)
+from users.models import User
+
+
+class TestExportService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        tag_data1 = TagName.objects.create(name="sns")
+        tag_data2 = TagName.objects.create(name="서울")
+
+        for i in range(5):
+            post = Post.objects.create(
+                writer=user,
+                title=f"test_title{i}",
+                content=f"test_content{i}",
+                like_count=i,
+                is_active=i != 4,
+            )
+            PostTag.objects.create(tags=tag_data1, posts=post)
+            if i % 2:
+                PostTag.objects.create(tags=tag_data2, posts=post)
+        Post.objects.filter(title="test_title0").update(
+            created_date="2022-10-01 08:00:00.000000"
+        )
+
+    def test_export_posts_ndjson(self):
+        """
+        게시글을 내보내는 export_posts service 검증
+        case : ndjson 으로 내보낼 경우
+        result : 정상/게시글 1개당 한 줄, 해시태그와 좋아요 수 포함
+        """
+        rows = [json.loads(line) for line in export_posts("ndjson")]
+
+        self.assertEqual(
+            [row["title"] for row in rows][:2], ["test_title0", "test_title1"]
+        )
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[1]["tags"], ["#sns", "#서울"])
+        self.assertEqual(rows[3]["likes"], 3)
+
+    def test_export_posts_csv(self):
+        """
+        게시글을 내보내는 export_posts service 검증
+        case : csv 로 내보낼 경우
+        result : 정상/헤더 + 게시글 1개당 한 줄, 해시태그는 "#sns,#서울" 형식
+        """
+        rows = list(csv.DictReader(io.StringIO("".join(export_posts("csv")))))
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[1]["tags"], "#sns,#서울")
+        self.assertEqual(rows[4]["is_active"], "False")
+
+    def test_export_posts_filters(self):
+        """
+        게시글을 내보내는 export_posts service 검증
+        case : since, is_active 조건을 줄 경우
+        result : 정상/작성일이 since 이후이고 활성화 여부가 같은 게시글만
+        """
+        rows = [
+            json.loads(line)
+            for line in export_posts(
+                "ndjson", since=parse_since("2022-10-02"), is_active=True
+            )
+        ]
+
+        self.assertEqual(
+            [row["title"] for row in rows],
+            ["test_title1", "test_title2", "test_title3"],
+        )
+
+    def test_export_posts_chunked_queries(self):
+        """
+        게시글을 내보내는 export_posts service 검증
+        case : chunk_size 가 2일 경우
+        result : 정상/게시글 조회 1번(chunk 단위로 fetch) + chunk 마다 해시태그 조회 1번
+        """
+        with self.assertNumQueries(4):
+            lines = list(export_posts("ndjson", chunk_size=2))
+        self.assertEqual(len(lines), 5)
+
+    def test_fail_export_posts_bad_arguments(self):
+        """
+        게시글을 내보내는 export_posts service 검증
+        case : 지원하지 않는 형식이나 잘못된 since, is_active 일 경우
+        result : 실패/ValueError 발생
+        """
+        with self.assertRaises(ValueError):
+            export_posts("xml")
+        with self.assertRaises(ValueError):
+            parse_since("yesterday")
+        with self.assertRaises(ValueError):
+            parse_is_active("maybe")
+
+    def test_export_posts_command(self):
+        """
+        export_posts management command 검증
+        case : --format csv --is-active false 로 실행할 경우
+        result : 정상/stdout 에 비활성화된 게시글만 CSV 로 출력
+        """
+        stdout = io.StringIO()
+        call_command(
+            "export_posts", "--format", "csv", "--is-active", "false", stdout=stdout
+        )
+
+        rows = list(csv.DictReader(io.StringIO(stdout.getvalue())))
+        self.assertEqual([row["title"] for row in rows], ["test_title4"])
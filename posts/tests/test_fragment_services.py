@@ -0,0 +1,149 @@
+import json
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from posts.models import Post, PostTag, TagName
+from posts.renderers import PostFragmentJSONRenderer
+from posts.serializers import PostDetailSerializer
+from posts.services.fragment_services import get_fragment_cache
+from posts.services.post_services import (edit_post, read_posts_by_ids,
+                                          render_detail_post,
+                                          render_posts_by_ids)
+from posts.services.tag_services import tag_id_cache
+from posts.services.view_services import view_count_buffer
+from users.models import User
+
+
+class TestFragmentService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        tag_data1 = TagName.objects.create(name="sns")
+        tag_data2 = TagName.objects.create(name="서울")
+
+        created_data = Post.objects.create(
+            writer=user, title="test_title", content="test_content", views=3
+        )
+        created_data2 = Post.objects.create(
+            writer=user, title="test_title2", content="test_content2", like_count=2
+        )
+        Post.objects.create(writer=user, title="test_title3", content="test_content3")
+        PostTag.objects.create(tags=tag_data2, posts=created_data)
+        PostTag.objects.create(tags=tag_data1, posts=created_data)
+        PostTag.objects.create(tags=tag_data1, posts=created_data2)
+
+    def tearDown(self):
+        get_fragment_cache().clear()
+        tag_id_cache.clear()
+        view_count_buffer.flush()
+
+    def render(self, data):
+        return PostFragmentJSONRenderer().render(data)
+
+    def test_render_posts_by_ids_matches_read_posts_by_ids(self):
+        """
+        JSON 조각으로 목록을 만드는 render_posts_by_ids service 검증
+        case : 조각이 없을 때와 캐시된 이후
+        result : 정상/read_posts_by_ids 를 JSONRenderer 로 만든 값과 byte 단위로 같음
+        """
+        post_ids = list(Post.objects.order_by("-id").values_list("id", flat=True))
+        expected = JSONRenderer().render(read_posts_by_ids(post_ids + [404]))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(
+                self.render(render_posts_by_ids(post_ids + [404])), expected
+            )
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.render(render_posts_by_ids(post_ids + [404])), expected
+            )
+
+    def test_render_posts_by_ids_live_counters(self):
+        """
+        JSON 조각으로 목록을 만드는 render_posts_by_ids service 검증
+        case : 조각이 캐시된 뒤 조회수/좋아요 수만 바뀌었을 경우
+        result : 정상/조각을 다시 만들지 않고 바뀐 조회수/좋아요 수를 응답
+        """
+        post = Post.objects.get(title="test_title")
+        with self.captureOnCommitCallbacks(execute=True):
+            render_posts_by_ids([post.id])
+        Post.objects.filter(id=post.id).update(views=100, like_count=7)
+
+        with self.assertNumQueries(1):
+            rendered = json.loads(self.render(render_posts_by_ids([post.id])))
+        self.assertEqual((rendered[0]["views"], rendered[0]["likes"]), (100, 7))
+
+    def test_render_posts_by_ids_after_edit(self):
+        """
+        JSON 조각으로 목록을 만드는 render_posts_by_ids service 검증
+        case : 조각이 캐시된 뒤 게시글을 수정했을 경우
+        result : 정상/수정된 제목과 해시태그로 조각을 다시 만듦
+        """
+        user = User.objects.get(username="test_user")
+        post = Post.objects.get(title="test_title")
+        with self.captureOnCommitCallbacks(execute=True):
+            render_posts_by_ids([post.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            edit_post({"title": "edited", "tags": "#new"}, user, post.id)
+
+        rendered = json.loads(self.render(render_posts_by_ids([post.id])))
+        self.assertEqual(rendered[0]["title"], "edited")
+        self.assertEqual(rendered[0]["tags"], ["#new"])
+
+    def test_render_detail_post(self):
+        """
+        JSON 조각으로 상세 조회하는 render_detail_post service 검증
+        case : 같은 게시글을 두번 조회할 경우
+        result : 정상/PostDetailSerializer 와 같은 JSON(hot_score 제외), 두번째는 쿼리 1번에 조회수 +1 반영
+        """
+        post = Post.objects.get(title="test_title")
+        expected = dict(PostDetailSerializer(post).data, views=4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first = self.render(render_detail_post(post.id))
+        self.assertEqual(first, JSONRenderer().render(expected))
+
+        with self.assertNumQueries(1):
+            second = json.loads(self.render(render_detail_post(post.id)))
+        self.assertEqual(second["views"], 5)
+        self.assertNotIn("hot_score", second)
+
+    def test_fail_render_detail_post_not_found(self):
+        """
+        JSON 조각으로 상세 조회하는 render_detail_post service 검증
+        case : 없는 게시글일 경우
+        result : 실패/DoesNotExist 발생
+        """
+        with self.assertRaises(Post.DoesNotExist):
+            render_detail_post(10000)
+
+    def test_renderer_envelope(self):
+        """
+        PostFragmentJSONRenderer 검증
+        case : 목록 응답(count, next 등)에 조각이 섞여 있거나 들여쓰기를 요청할 경우
+        result : 정상/JSONRenderer 로 만든 값과 같음
+        """
+        post_ids = list(Post.objects.order_by("id").values_list("id", flat=True))
+        data = {"count": 3, "next": None, "results": render_posts_by_ids(post_ids)}
+        expected = {"count": 3, "next": None, "results": read_posts_by_ids(post_ids)}
+
+        self.assertEqual(self.render(data), JSONRenderer().render(expected))
+        self.assertEqual(
+            PostFragmentJSONRenderer().render(data, "application/json; indent=2"),
+            JSONRenderer().render(expected, "application/json; indent=2"),
+        )
+
+    def test_fail_build_fragment_without_adjacent_likes(self):
+        """
+        PostFragmentJSONRenderer.build_fragment 검증
+        case : views 바로 뒤에 좋아요 수가 없을 경우
+        result : 실패/ValueError 발생
+        """
+        with self.assertRaises(ValueError):
+            PostFragmentJSONRenderer().build_fragment(
+                {"id": 1, "views": 0, "title": "t", "likes": 0}, "likes"
+            )
@@ -0,0 +1,129 @@
+import datetime
+import io
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from posts.models import Post
+from posts.services.cache_services import get_list_cache
+from posts.services.hot_services import hot_score, rescore_posts
+from posts.services.post_services import recompute_hot_scores, toggle_like
+from posts.services.view_services import view_count_buffer
+from users.models import User
+
+HOT_SCORE = {
+    "HALF_LIFE_HOURS": 24,
+    "POST_WEIGHT": 1.0,
+    "LIKE_WEIGHT": 1.0,
+    "VIEW_WEIGHT": 0.1,
+}
+
+
+@override_settings(POSTS_HOT_SCORE=HOT_SCORE)
+class TestHotService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        Post.objects.create(writer=cls.user, title="test_title", content="test_content")
+        Post.objects.create(
+            writer=cls.user, title="test_title2", content="test_content2"
+        )
+        Post.objects.create(
+            writer=cls.user, title="test_title3", content="test_content3"
+        )
+
+    def tearDown(self):
+        get_list_cache().clear()
+        view_count_buffer.flush()
+
+    def assert_hot_score_matches_counts(self, post_id):
+        post = Post.objects.get(id=post_id)
+        self.assertAlmostEqual(
+            post.hot_score,
+            hot_score(post.created_date, post.like_count, post.views),
+            places=6,
+        )
+
+    def test_hot_score_half_life(self):
+        """
+        hot 점수 hot_score 검증
+        case : 반감기(24시간)만큼 먼저 작성된 게시글의 참여도가 2배일 경우
+        result : 정상/두 게시글의 점수가 같고, 참여도가 같으면 최근 게시글의 점수가 높음
+        """
+        now = timezone.now()
+        day_ago = now - datetime.timedelta(hours=24)
+        self.assertAlmostEqual(hot_score(day_ago, 1, 0), hot_score(now, 0, 0))
+        self.assertAlmostEqual(hot_score(day_ago, 0, 50), hot_score(now, 1, 10))
+        self.assertLess(hot_score(day_ago, 5, 0), hot_score(now, 5, 0))
+
+    def test_toggle_like_updates_hot_score(self):
+        """
+        좋아요 toggle_like service 의 hot 점수 반영 검증
+        case : 좋아요 후 좋아요 취소를 할 경우
+        result : 정상/같은 UPDATE 에서 바뀐 점수가 좋아요 수로 다시 계산한 점수와 같음
+        """
+        post = Post.objects.get(title="test_title")
+        with self.captureOnCommitCallbacks(execute=True):
+            toggle_like(self.user, post.id)
+        self.assert_hot_score_matches_counts(post.id)
+        self.assertGreater(Post.objects.get(id=post.id).hot_score, post.hot_score)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            toggle_like(self.user, post.id)
+        self.assertAlmostEqual(
+            Post.objects.get(id=post.id).hot_score, post.hot_score, places=6
+        )
+
+    def test_view_flush_updates_hot_score(self):
+        """
+        조회수 버퍼 flush 의 hot 점수 반영 검증
+        case : 게시글마다 조회수 증가분이 다를 경우
+        result : 정상/조회수 UPDATE 와 같은 쿼리에서 점수가 바뀌어 쿼리 수가 늘지 않음
+        """
+        post1, post2, _ = Post.objects.order_by("id")
+        view_count_buffer.flush()
+        view_count_buffer.add(post1.id, 3)
+        view_count_buffer.add(post2.id)
+        with self.assertNumQueries(2):
+            view_count_buffer.flush()
+        self.assert_hot_score_matches_counts(post1.id)
+        self.assert_hot_score_matches_counts(post2.id)
+
+    def test_rescore_posts(self):
+        """
+        hot 점수를 다시 계산하는 rescore_posts service 검증
+        case : 좋아요 수/조회수를 직접 고쳐 점수가 어긋났을 경우
+        result : 정상/어긋난 게시글만 저장하고, 다시 실행하면 바뀐 게시글이 없음
+        """
+        post = Post.objects.get(title="test_title2")
+        Post.objects.filter(id=post.id).update(like_count=4, views=100)
+        self.assertEqual(rescore_posts(Post, chunk_size=2), 1)
+        self.assert_hot_score_matches_counts(post.id)
+        self.assertEqual(rescore_posts(Post, chunk_size=2), 0)
+
+    def test_recompute_hot_scores_after_settings_change(self):
+        """
+        hot 점수를 다시 계산하는 recompute_hot_scores service 검증
+        case : 가중치 설정을 바꾼 뒤 실행할 경우
+        result : 정상/모든 게시글의 점수가 바뀐 설정으로 다시 계산됨
+        """
+        Post.objects.update(views=10)
+        recompute_hot_scores()
+        with override_settings(POSTS_HOT_SCORE={**HOT_SCORE, "VIEW_WEIGHT": 0.5}):
+            self.assertEqual(recompute_hot_scores(), 3)
+            for post_id in Post.objects.values_list("id", flat=True):
+                self.assert_hot_score_matches_counts(post_id)
+
+    def test_recompute_hot_scores_command(self):
+        """
+        recompute_hot_scores management command 검증
+        case : 점수가 어긋난 게시글이 1개 있을 경우
+        result : 정상/보정된 게시글 수를 출력
+        """
+        Post.objects.filter(title="test_title3").update(hot_score=0)
+        stdout = io.StringIO()
+        call_command("recompute_hot_scores", "--chunk-size", "1", stdout=stdout)
+        self.assertIn("1개", stdout.getvalue())
@@ -0,0 +1,121 @@
+import io
+import json
+
+from django.test import TestCase
+
+from posts.models import Post, PostTag, TagName
+from posts.services.ingest_services import ingest_posts, iter_ndjson_lines
+from users.models import User
+
+
+def ndjson(*rows):
+    return io.BytesIO(
+        b"".join(
+            (row if isinstance(row, bytes) else json.dumps(row).encode()) + b"\n"
+            for row in rows
+        )
+    )
+
+
+class TestIngestService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        TagName.objects.create(name="sns")
+
+    def test_iter_ndjson_lines(self):
+        """
+        NDJSON 본문을 줄 단위로 읽는 iter_ndjson_lines service 검증
+        case : 빈 줄과 최대 크기를 넘는 줄이 섞여 있을 경우
+        result : 정상/빈 줄은 건너뛰고 너무 긴 줄은 b"" 로 반환
+        """
+        stream = io.BytesIO(b'{"a": 1}\n\n' + b"x" * 50 + b'\n{"b": 2}')
+
+        lines = list(iter_ndjson_lines(stream, 20))
+
+        self.assertEqual(lines, [(1, b'{"a": 1}\n'), (3, b""), (4, b'{"b": 2}')])
+
+    def test_ingest_posts(self):
+        """
+        게시글을 대량 작성하는 ingest_posts service 검증
+        case : 정상적으로 작동 했을 경우
+        result : 정상/모든 줄의 게시글과 해시태그가 작성됨
+        """
+        user = User.objects.get(username="test_user")
+        stream = ndjson(
+            {"title": "title1", "content": "content1", "tags": "#sns,#bulk"},
+            {"title": "title2", "content": "content2", "tags": "#bulk"},
+            {"title": "title3", "content": "content3"},
+        )
+
+        result = ingest_posts(iter_ndjson_lines(stream, 1024), user, chunk_size=2)
+
+        self.assertEqual(result, {"created": 3, "failed": 0, "errors": []})
+        self.assertEqual(Post.objects.filter(writer=user).count(), 3)
+        self.assertEqual(
+            set(
+                PostTag.objects.filter(posts__title="title1").values_list(
+                    "tags__name", flat=True
+                )
+            ),
+            {"sns", "bulk"},
+        )
+        self.assertEqual(TagName.objects.filter(name="bulk").count(), 1)
+
+    def test_ingest_posts_row_errors(self):
+        """
+        게시글을 대량 작성하는 ingest_posts service 검증
+        case : 잘못된 줄이 섞여 있을 경우
+        result : 정상/잘못된 줄만 줄 번호와 함께 에러로 기록하고 나머지는 작성
+        """
+        user = User.objects.get(username="test_user")
+        stream = ndjson(
+            {"title": "title1", "content": "content1"},
+            b"{not json",
+            {"title": "t" * 51, "content": "content"},
+            {"title": "title4", "content": "content4", "tags": "#" + "x" * 21},
+            [1, 2],
+            {"title": "title6", "content": "content6"},
+        )
+
+        result = ingest_posts(iter_ndjson_lines(stream, 1024), user, chunk_size=4)
+
+        self.assertEqual(result["created"], 2)
+        self.assertEqual(result["failed"], 4)
+        self.assertEqual([error["line"] for error in result["errors"]], [2, 3, 4, 5])
+        self.assertIn("title", result["errors"][1]["errors"])
+
+    def test_ingest_posts_max_errors(self):
+        """
+        게시글을 대량 작성하는 ingest_posts service 검증
+        case : 에러가 max_errors 보다 많을 경우
+        result : 정상/실패 수는 모두 세고 에러는 max_errors 개까지만 반환
+        """
+        user = User.objects.get(username="test_user")
+        stream = ndjson(*[b"{not json"] * 5)
+
+        result = ingest_posts(iter_ndjson_lines(stream, 1024), user, max_errors=2)
+
+        self.assertEqual(result["failed"], 5)
+        self.assertEqual(len(result["errors"]), 2)
+
+    def test_ingest_posts_query_count(self):
+        """
+        게시글을 대량 작성하는 ingest_posts service 검증
+        case : 한 chunk 에 게시글 50개를 작성할 경우
+        result : 정상/게시글 수와 관계없이 bulk_create 로 쿼리수가 일정
+        """
+        user = User.objects.get(username="test_user")
+        stream = ndjson(
+            *[
+                {"title": f"title{i}", "content": "content", "tags": f"#sns,#tag{i}"}
+                for i in range(50)
+            ]
+        )
+
+        with self.assertNumQueries(7):
+            result = ingest_posts(iter_ndjson_lines(stream, 1024), user)
+        self.assertEqual(result["created"], 50)
+        self.assertEqual(PostTag.objects.filter(posts__writer=user).count(), 100)
@@ -0,0 +1,218 @@
+import multiprocessing
+import os
+import tempfile
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from posts.models import Post
+from posts.services.cache_services import get_list_cache
+from posts.services.fragment_services import get_fragment_cache
+from posts.services.metrics_services import (MetricsRecorder, MmapMetricStore,
+                                             collect_metrics, metric_key,
+                                             metrics_recorder,
+                                             read_metric_file,
+                                             record_view_count_stats,
+                                             render_metrics)
+from users.models import User
+
+
+def _record_in_worker(directory, view, count):
+    with override_settings(POSTS_METRICS={"ENABLED": True, "DIRECTORY": directory}):
+        recorder = MetricsRecorder()
+        for _ in range(count):
+            recorder.record_request(view, "GET", 200, 0.02, 3, {"list": [1, 0]})
+
+
+def _record_view_count_in_worker(directory, pending_views):
+    with override_settings(POSTS_METRICS={"ENABLED": True, "DIRECTORY": directory}):
+        recorder = MetricsRecorder()
+        recorder.record_request("PostView", "GET", 200, 0.02, 3)
+        recorder.set_values(
+            {
+                metric_key("goals_view_count_pending_views"): pending_views,
+                metric_key("goals_view_count_flushed_total"): 10,
+            }
+        )
+        recorder.reset()
+
+
+class TestMetricsService(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_mmap_metric_store(self):
+        """
+        worker 별 metric 파일을 쓰는 MmapMetricStore 검증
+        case : 같은 키를 여러번 더하고, 처음 크기보다 많은 키를 쓴 뒤 파일을 다시 열 경우
+        result : 정상/값이 더해지고, 파일이 커져도 다시 열었을 때 같은 값
+        """
+        path = os.path.join(self.directory.name, "metrics_1.db")
+        store = MmapMetricStore(path)
+        store.increment(metric_key("a"), 1)
+        store.increment(metric_key("a"), 2.5)
+        for i in range(3000):
+            store.increment(metric_key("b", (("label", f"값{i}"),)), i)
+        store.close()
+
+        reopened = MmapMetricStore(path)
+        reopened.increment(metric_key("a"), 1)
+        reopened.close()
+        values = dict(read_metric_file(path))
+        self.assertEqual(values[metric_key("a")], 4.5)
+        self.assertEqual(values[metric_key("b", (("label", "값2999"),))], 2999)
+        self.assertEqual(len(values), 3001)
+
+    def test_collect_metrics_from_workers(self):
+        """
+        여러 worker 의 파일을 더하는 collect_metrics, render_metrics 검증
+        case : fork 된 process 3개가 같은 폴더에 요청 metric 을 쓸 경우
+        result : 정상/모든 process 의 값을 더한 요청 수, 누적 histogram bucket, 캐시 hit 비율
+        """
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(
+                target=_record_in_worker, args=(self.directory.name, "PostView", 5)
+            )
+            for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        text = render_metrics(collect_metrics(self.directory.name))
+        labels = 'method="GET",view="PostView"'
+        self.assertIn(
+            f'goals_http_requests_total{{{labels},status="200"}} 15', text.splitlines()
+        )
+        self.assertIn(
+            f'goals_http_request_duration_seconds_bucket{{{labels},le="0.01"}} 0', text
+        )
+        self.assertIn(
+            f'goals_http_request_duration_seconds_bucket{{{labels},le="0.025"}} 15',
+            text,
+        )
+        self.assertIn(
+            f'goals_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 15', text
+        )
+        self.assertIn(f"goals_http_request_duration_seconds_count{{{labels}}} 15", text)
+        self.assertIn(f"goals_db_queries_total{{{labels}}} 45", text)
+        self.assertIn('goals_cache_hit_ratio{cache="list"} 1', text)
+        self.assertIn("# TYPE goals_http_request_duration_seconds histogram", text)
+
+    def test_record_view_count_stats(self):
+        """
+        조회수 버퍼 상태를 쓰는 record_view_count_stats 검증
+        case : 같은 worker 가 버퍼 상태를 2번 쓸 경우
+        result : 정상/값이 더해지지 않고 마지막 상태가 gauge/counter 로 나감
+        """
+        options = {"ENABLED": True, "DIRECTORY": self.directory.name}
+        self.addCleanup(metrics_recorder.reset)
+        with override_settings(POSTS_METRICS=options):
+            stats = {
+                "pending_posts": 3,
+                "pending_views": 7,
+                "flushed_views": 10,
+                "flush_count": 2,
+            }
+            record_view_count_stats(stats)
+            record_view_count_stats({**stats, "pending_posts": 1, "pending_views": 2})
+
+        lines = render_metrics(collect_metrics(self.directory.name)).splitlines()
+        self.assertIn("# TYPE goals_view_count_pending_views gauge", lines)
+        self.assertIn("goals_view_count_pending_posts 1", lines)
+        self.assertIn("goals_view_count_pending_views 2", lines)
+        self.assertIn("goals_view_count_flushed_total 10", lines)
+        self.assertIn("goals_view_count_flushes_total 2", lines)
+
+    def test_collect_metrics_skips_dead_worker_gauges(self):
+        """
+        종료된 worker 파일을 더하는 collect_metrics 검증
+        case : 종료된 process 1개와 현재 process 가 조회수 버퍼 상태를 쓴 경우
+        result : 정상/gauge 는 살아있는 process 의 값만, counter 는 종료된 process 의 값까지 더함
+        """
+        worker = multiprocessing.get_context("fork").Process(
+            target=_record_view_count_in_worker, args=(self.directory.name, 5)
+        )
+        worker.start()
+        worker.join()
+        _record_view_count_in_worker(self.directory.name, 2)
+
+        lines = render_metrics(collect_metrics(self.directory.name)).splitlines()
+        self.assertIn("goals_view_count_pending_views 2", lines)
+        self.assertIn("goals_view_count_flushed_total 20", lines)
+        self.assertIn(
+            'goals_http_requests_total{method="GET",view="PostView",status="200"} 2',
+            lines,
+        )
+
+    def test_record_view_count_stats_disabled(self):
+        """
+        조회수 버퍼 상태를 쓰는 record_view_count_stats 검증
+        case : settings.POSTS_METRICS["ENABLED"] 가 False 일 경우
+        result : 정상/metric 파일을 만들지 않음
+        """
+        with override_settings(
+            POSTS_METRICS={"ENABLED": False, "DIRECTORY": self.directory.name}
+        ):
+            record_view_count_stats(
+                {
+                    "pending_posts": 1,
+                    "pending_views": 1,
+                    "flushed_views": 0,
+                    "flush_count": 0,
+                }
+            )
+
+        self.assertEqual(collect_metrics(self.directory.name), {})
+
+
+class TestMetricsAPI(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        Post.objects.create(writer=user, title="test_title", content="test_content")
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.addCleanup(metrics_recorder.reset)
+
+    def tearDown(self):
+        get_list_cache().clear()
+        get_fragment_cache().clear()
+
+    def test_metrics_view(self):
+        options = {"ENABLED": True, "DIRECTORY": self.directory.name}
+        with override_settings(POSTS_METRICS=options):
+            client = APIClient()
+            with self.captureOnCommitCallbacks(execute=True):
+                client.get("/posts")
+            client.get("/posts")
+            client.get("/posts/detail/1")
+            response = client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        text = response.content.decode()
+        self.assertIn(
+            'goals_http_requests_total{method="GET",view="PostView",status="200"} 2',
+            text,
+        )
+        self.assertIn(
+            'goals_http_requests_total{method="GET",view="PostDetailView",status="401"} 1',
+            text,
+        )
+        self.assertIn('goals_cache_requests_total{cache="list",result="hit"} 1', text)
+        self.assertIn('goals_cache_hit_ratio{cache="list"} 0.5', text)
+        self.assertIn('goals_db_queries_total{method="GET",view="PostView"}', text)
+        self.assertIn("# TYPE goals_view_count_pending_views gauge", text)
+
+    def test_metrics_view_disabled(self):
+        with override_settings(POSTS_METRICS={"ENABLED": False}):
+            response = APIClient().get("/metrics")
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+import unittest
+
+from django.test import TestCase, override_settings
+
+from posts.models import Post
+from posts.services.perf_baseline_services import (check_measurement,
+                                                   load_baseline,
+                                                   perf_recorder,
+                                                   save_baseline)
+from posts.tests.mixins import PerfBaselineMixin
+
+
+class TestPerfBaselineService(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "perf_baseline.json")
+
+    def test_check_measurement(self):
+        """
+        기준과 측정값을 비교하는 check_measurement service 검증
+        case : 쿼리 수/시간이 기준 이하 / 허용 범위를 넘을 경우 / 기준이 없는 테스트인 경우
+        result : 정상/넘은 항목만 설명을 돌려주고, 기준이 없으면 검사하지 않음
+        """
+        save_baseline({"a.Test.test_a": {"queries": 3, "ms": 10.0}}, self.path)
+        options = {
+            "PATH": self.path,
+            "QUERY_TOLERANCE": 1,
+            "TIME_RATIO": 2.0,
+            "TIME_SLACK_MS": 5,
+            "CHECK_TIME": True,
+        }
+        with override_settings(POSTS_PERF_BASELINE=options):
+            self.assertEqual(check_measurement("a.Test.test_a", 4, 25.0), [])
+            problems = check_measurement("a.Test.test_a", 5, 26.0)
+            self.assertEqual(len(problems), 2)
+            self.assertIn("SQL 쿼리 5개 (기준 3개, 허용 4개)", problems[0])
+            self.assertEqual(check_measurement("a.Test.test_unknown", 100, 1000), [])
+
+        with override_settings(POSTS_PERF_BASELINE={**options, "CHECK_TIME": False}):
+            self.assertEqual(len(check_measurement("a.Test.test_a", 5, 1000)), 1)
+
+    def test_perf_baseline_mixin(self):
+        """
+        테스트마다 쿼리 수를 재는 PerfBaselineMixin 검증
+        case : 기준보다 쿼리가 많은 테스트를 실행할 경우 / 기준을 갱신(기록)하는 중일 경우
+        result : 실패/기준을 넘은 테스트가 실패함, 정상/기록 중에는 비교하지 않고 쿼리 수를 기록
+        """
+
+        class SampleTest(PerfBaselineMixin, TestCase):
+            def test_two_queries(self):
+                Post.objects.count()
+                Post.objects.exists()
+
+        test = SampleTest("test_two_queries")
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({test.id(): {"queries": 1, "ms": 1000.0}}, f)
+
+        with override_settings(POSTS_PERF_BASELINE={"PATH": self.path}):
+            result = unittest.TestResult()
+            test.run(result)
+            self.assertEqual(len(result.failures), 1)
+            self.assertIn("SQL 쿼리 2개 (기준 1개, 허용 1개)", result.failures[0][1])
+
+            perf_recorder.start()
+            try:
+                result = unittest.TestResult()
+                SampleTest("test_two_queries").run(result)
+            finally:
+                measurements = perf_recorder.stop()
+            self.assertTrue(result.wasSuccessful())
+            self.assertEqual(measurements[test.id()]["queries"], 2)
+
+        save_baseline(measurements, self.path)
+        self.assertEqual(load_baseline(self.path)[test.id()]["queries"], 2)
@@ -1,12 +1,17 @@
 import json
 
 from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
 
 from posts.models import Like, Post, PostTag, TagName
+from posts.services.cache_services import get_list_cache
+from posts.services.fragment_services import get_fragment_cache
+from posts.services.tag_services import tag_id_cache
+from posts.tests.mixins import PerfBaselineMixin
 from users.models import User
 
 
-class TestAPI(APITestCase):
+class TestAPI(PerfBaselineMixin, APITestCase):
     @classmethod
     def setUpTestData(cls):
         user = User.objects.create(
@@ -21,6 +26,7 @@ class TestAPI(APITestCase):
             content="test_content",
             is_active=True,
             views=60,
+            like_count=1,
             created_date="2022-10-16 08:00:00.000000",
         )
         post_data2 = Post.objects.create(
@@ -37,15 +43,114 @@ class TestAPI(APITestCase):
 
         like_data1 = Like.objects.create(post=post_data1, user=user)
 
+    def tearDown(self):
+        # async view 는 트랜잭션 밖에서 실행된다고 보고 캐시에 바로 저장하므로 테스트마다 비운다
+        get_list_cache().clear()
+        get_fragment_cache().clear()
+        tag_id_cache.clear()
+
     def test_post_view_def_get_ok(self):
         client = APIClient()
 
-        url = "/posts/"
+        url = "/posts"
+        response = client.get(url)
+        result = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(len(result["results"]), 2)
+        self.assertEqual(result["results"][0]["title"], "test_title2")
+
+    def test_post_view_def_get_page_envelope(self):
+        client = APIClient()
+
+        url = "/posts?page_size=1&exact=1"
+        response = client.get(url)
+        result = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(result["num_pages"], 2)
+        self.assertTrue(result["has_next"])
+        self.assertEqual(len(result["results"]), 1)
+
+        response = client.get(url + "&page=2")
+        result = response.json()
+        self.assertFalse(result["has_next"])
+        self.assertEqual(result["results"][0]["title"], "test_title")
+
+    def test_post_view_def_get_bad_request(self):
+        client = APIClient()
+
+        url = "/posts?page_size=0"
         response = client.get(url)
         result = response.json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(result["detail"], "조회 조건을 확인해주세요")
+
+    def test_post_view_def_get_cursor_ok(self):
+        client = APIClient()
+
+        url = "/posts?page_size=1&cursor="
+        response = client.get(url)
+        result = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(result["results"]), 1)
+        self.assertEqual(result["results"][0]["title"], "test_title2")
+        self.assertIsNone(result["prev"])
+
+        response = client.get(url + result["next"])
+        result = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(result["results"][0]["title"], "test_title")
+        self.assertIsNone(result["next"])
+
+    def test_post_view_def_get_cursor_bad_request(self):
+        client = APIClient()
+
+        url = "/posts?cursor=broken"
+        response = client.get(url)
+        result = response.json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(result["detail"], "조회 조건을 확인해주세요")
+
+    def test_post_view_def_get_invalid_order_by(self):
+        client = APIClient()
+
+        for url in ["/posts?order_by=foo", "/posts?cursor=&order_by=foo"]:
+            response = client.get(url)
+            result = response.json()
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(result["detail"], "조회 조건을 확인해주세요")
+
+    def test_post_view_def_get_not_modified(self):
+        client = APIClient()
+
+        url = "/posts?page_size=1"
+        response = client.get(url)
+        etag = response["ETag"]
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Last-Modified", response)
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+        Post.objects.filter(title="test_title2").update(views=21)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_post_view_def_get_if_modified_since(self):
+        client = APIClient()
+
+        url = "/posts?order_by=likes"
+        response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        response = client.get(
+            url, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT"
+        )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0]["title"], "test_title2")
 
     def test_post_view_def_post_ok(self):
         client = APIClient()
@@ -61,7 +166,7 @@ class TestAPI(APITestCase):
             "created_date": "2022-10-16 08:00:00.000000",
         }
 
-        url = "/posts/"
+        url = "/posts"
         response = client.post(
             url, json.dumps(create_data), content_type="application/json"
         )
@@ -83,7 +188,7 @@ class TestAPI(APITestCase):
             "created_date": "2022-10-16 08:00:00.000000",
         }
 
-        url = "/posts/"
+        url = "/posts"
         response = client.post(
             url, json.dumps(create_data), content_type="application/json"
         )
@@ -103,7 +208,7 @@ class TestAPI(APITestCase):
             "created_date": "2022-10-16 08:00:00.000000",
         }
 
-        url = "/posts/"
+        url = "/posts"
         response = client.post(
             url, json.dumps(create_data), content_type="application/json"
         )
@@ -346,6 +451,28 @@ class TestAPI(APITestCase):
         self.assertEqual(response.status_code, 404)
         self.assertEqual(result["detail"], "존재하지 않는 게시글입니다")
 
+    def test_post_detail_view_def_get_not_modified(self):
+        client = APIClient()
+
+        user = User.objects.get(username="test_user")
+        client.force_authenticate(user=user)
+        post = Post.objects.get(title="test_title2", content="test_content2")
+
+        url = "/posts/detail/" + str(post.id)
+        response = client.get(url)
+        etag = response["ETag"]
+        self.assertEqual(response.status_code, 200)
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        client.post("/posts/" + str(post.id) + "/like")
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        result = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(result["like_count"], 1)
+        self.assertEqual(result["views"], 23)
+
     def test_like_view_def_post_ok_case_true(self):
         client = APIClient()
 
@@ -396,3 +523,214 @@ class TestAPI(APITestCase):
         result = response.json()
         self.assertEqual(response.status_code, 404)
         self.assertEqual(result["detail"], "존재하지 않는 게시글입니다")
+
+    def test_like_batch_view_def_post_ok(self):
+        client = APIClient()
+
+        user = User.objects.get(username="test_user")
+        client.force_authenticate(user=user)
+        post = Post.objects.get(title="test_title", content="test_content")
+        post2 = Post.objects.get(title="test_title2", content="test_content2")
+
+        url = "/posts/likes/batch"
+        response = client.post(
+            url,
+            json.dumps({"post_ids": [post.id, post2.id]}),
+            content_type="application/json",
+        )
+        result = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            result["results"],
+            [
+                {"post_id": post.id, "liked": False, "like_count": 0},
+                {"post_id": post2.id, "liked": True, "like_count": 1},
+            ],
+        )
+
+    def test_like_batch_view_def_post_bad_request(self):
+        client = APIClient()
+
+        user = User.objects.get(username="test_user")
+        client.force_authenticate(user=user)
+
+        url = "/posts/likes/batch"
+        for post_ids in ["1,2", [True], [1, False]]:
+            response = client.post(
+                url,
+                json.dumps({"post_ids": post_ids}),
+                content_type="application/json",
+            )
+            result = response.json()
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(result["detail"], "좋아요 목록을 확인해주세요")
+
+    def test_like_batch_view_def_post_not_found(self):
+        client = APIClient()
+
+        user = User.objects.get(username="test_user")
+        client.force_authenticate(user=user)
+
+        url = "/posts/likes/batch"
+        response = client.post(
+            url, json.dumps({"post_ids": [404]}), content_type="application/json"
+        )
+        result = response.json()
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(result["detail"], "존재하지 않는 게시글입니다")
+
+    def test_post_bulk_view_def_post_ok(self):
+        client = APIClient()
+
+        user = User.objects.get(username="test_user")
+        client.force_authenticate(user=user)
+
+        url = "/posts/bulk"
+        body = "\n".join(
+            [
+                json.dumps({"title": "bulk1", "content": "content", "tags": "#sns"}),
+                "{not json",
+                json.dumps({"title": "bulk3", "content": "content", "tags": "#new"}),
+            ]
+        )
+        response = client.post(url, body, content_type="application/x-ndjson")
+        result = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(result["created"], 2)
+        self.assertEqual(result["failed"], 1)
+        self.assertEqual(result["errors"][0]["line"], 2)
+        self.assertTrue(Post.objects.filter(title="bulk3", tags__name="new").exists())
+
+    def test_post_bulk_view_def_post_empty(self):
+        client = APIClient()
+
+        user = User.objects.get(username="test_user")
+        client.force_authenticate(user=user)
+
+        url = "/posts/bulk"
+        response = client.post(url, "", content_type="application/x-ndjson")
+        result = response.json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(result["detail"], "작성할 게시글이 없습니다")
+
+    def test_post_bulk_view_def_post_unauthorized(self):
+        client = APIClient()
+
+        url = "/posts/bulk"
+        response = client.post(url, "{}", content_type="application/x-ndjson")
+        result = response.json()
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(result["detail"], "로그인을 해주세요")
+
+    def test_post_export_view_def_get_ok(self):
+        client = APIClient()
+
+        user = User.objects.get(username="test_user")
+        user.is_admin = True
+        user.save()
+        client.force_authenticate(user=user)
+
+        url = "/posts/export?export_format=csv&since=2022-10-16&is_active=1"
+        response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn("test_title2", lines[2])
+
+    def test_post_export_view_def_get_bad_request(self):
+        client = APIClient()
+
+        user = User.objects.get(username="test_user")
+        user.is_admin = True
+        user.save()
+        client.force_authenticate(user=user)
+
+        url = "/posts/export?is_active=maybe"
+        response = client.get(url)
+        result = response.json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(result["detail"], "내보내기 조건을 확인해주세요")
+
+    def test_post_export_view_def_get_forbidden(self):
+        client = APIClient()
+
+        user = User.objects.get(username="test_user")
+        client.force_authenticate(user=user)
+
+        url = "/posts/export"
+        response = client.get(url)
+        result = response.json()
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(result["detail"], "권한이 없습니다")
+
+    async def test_async_post_view_def_get_ok(self):
+        url = "/posts/async?page_size=1&exact=1"
+        response = await self.async_client.get(url)
+        result = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(result["count"], 2)
+        self.assertTrue(result["has_next"])
+        self.assertEqual(result["results"][0]["title"], "test_title2")
+        self.assertEqual(result["results"][0]["tags"], ["#sns"])
+
+        response = await self.async_client.get(url, IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+        response = await self.async_client.get("/posts/async?page_size=1&cursor=")
+        result = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(result["results"][0]["title"], "test_title2")
+        self.assertIsNotNone(result["next"])
+
+    async def test_async_post_view_def_get_bad_request(self):
+        url = "/posts/async?page_size=0"
+        response = await self.async_client.get(url)
+        result = response.json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(result["detail"], "조회 조건을 확인해주세요")
+
+        for url in ["/posts/async?order_by=foo", "/posts/async?cursor=&order_by=foo"]:
+            response = await self.async_client.get(url)
+            self.assertEqual(response.status_code, 400)
+
+        response = await self.async_client.get("/posts/async?reverse=2")
+        self.assertEqual(response.status_code, 400)
+        sync_response = await self.async_client.get("/posts?reverse=2")
+        self.assertEqual(sync_response.status_code, 400)
+        self.assertEqual(response.json(), sync_response.json())
+
+    async def test_async_post_detail_view_def_get_ok(self):
+        user = await User.objects.aget(username="test_user")
+        post = await Post.objects.aget(title="test_title", content="test_content")
+        token = "Bearer " + str(AccessToken.for_user(user))
+
+        url = "/posts/async/detail/" + str(post.id)
+        response = await self.async_client.get(url, AUTHORIZATION=token)
+        result = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(result["title"], "test_title")
+        self.assertEqual(result["like_count"], 1)
+
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["detail"], "로그인을 해주세요")
+
+        url = "/posts/async/detail/" + str(404)
+        response = await self.async_client.get(url, AUTHORIZATION=token)
+        self.assertEqual(response.status_code, 404)
+
+    async def test_async_like_view_def_post_ok(self):
+        user = await User.objects.aget(username="test_user")
+        post = await Post.objects.aget(title="test_title2", content="test_content2")
+        token = "Bearer " + str(AccessToken.for_user(user))
+
+        url = "/posts/async/" + str(post.id) + "/like"
+        response = await self.async_client.post(url, AUTHORIZATION=token)
+        result = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(result["detail"], "좋아요 했습니다")
+        self.assertEqual(result["like_count"], 1)
+
+        response = await self.async_client.post(url)
+        self.assertEqual(response.status_code, 401)
@@ -1,16 +1,23 @@
-from django.db import connection
-from django.db.models import Count
+from django.db import IntegrityError, connection, transaction
 from django.test import TestCase
 from django.test.utils import CaptureQueriesContext
 from rest_framework import exceptions
+from rest_framework.renderers import JSONRenderer
 
 from posts.models import Like, Post, PostTag, TagName
-from posts.services.post_services import (create_post, edit_post,
+from posts.serializers import PostSerializer
+from posts.services.hot_services import hot_score
+from posts.services.post_services import (count_likes, create_post,
+                                          cursor_pagination_posts, edit_post,
                                           filtering_posts, hard_delete_post,
                                           like_post, pagination_posts,
                                           read_detail_post, read_posts,
-                                          recover_post, search_posts,
-                                          soft_delete_post)
+                                          read_posts_by_ids,
+                                          recompute_hot_scores,
+                                          reconcile_like_count, recover_post,
+                                          search_posts, soft_delete_post,
+                                          toggle_like, toggle_likes)
+from posts.services.search_services import get_search_backend
 from users.models import User
 
 
@@ -37,6 +44,7 @@ class TestService(TestCase):
             content="test_content",
             is_active=True,
             views=60,
+            like_count=1,
             created_date="2022-10-16 08:00:00.000000",
         )
         created_data2 = Post.objects.create(
@@ -45,6 +53,7 @@ class TestService(TestCase):
             content="test_content2",
             is_active=True,
             views=20,
+            like_count=3,
             created_date="2022-10-17 08:00:00.000000",
         )
         created_data3 = Post.objects.create(
@@ -53,6 +62,7 @@ class TestService(TestCase):
             content="test_content3",
             is_active=True,
             views=30,
+            like_count=1,
             created_date="2022-10-18 08:00:00.000000",
         )
 
@@ -67,8 +77,7 @@ class TestService(TestCase):
         like_data2 = Like.objects.create(post=created_data2, user=user2)
         like_data3 = Like.objects.create(post=created_data2, user=user3)
         like_data4 = Like.objects.create(post=created_data2, user=user)
-        like_data5 = Like.objects.create(post=created_data2, user=user2)
-        like_data6 = Like.objects.create(post=created_data3, user=user)
+        like_data5 = Like.objects.create(post=created_data3, user=user)
 
     def test_read_posts_case_created_date_n_reverse(self):
         """
@@ -104,11 +113,7 @@ class TestService(TestCase):
         case : 정상적으로 작동 했을 경우
         result : 정상/게시글 수 확인과 가장 첫번째 게시글을 확인하여 게시글 조회
         """
-        test_posts = (
-            Post.objects.all()
-            .annotate(like_count=Count("like"))
-            .order_by("-like_count")
-        )
+        test_posts = Post.objects.all().order_by("-like_count")
         reverse = 1
         order_by = "likes"
         posts = read_posts(order_by, reverse)
@@ -116,6 +121,22 @@ class TestService(TestCase):
         self.assertEqual(read_posts_count, 3)
         self.assertEqual(test_posts[0].id, posts[0].id)
 
+    def test_read_posts_case_hot_n_reverse(self):
+        """
+        게시글을 정렬(hot+내림차순)하여 조회하는 read_posts service 검증
+        case : hot 점수를 다시 계산한 뒤 조회할 경우
+        result : 정상/게시글 수 확인과 참여도(좋아요/조회수)가 가장 높은 게시글이 첫번째
+        """
+        recompute_hot_scores()
+        test_posts = Post.objects.all().order_by("-hot_score")
+        reverse = 1
+        order_by = "hot"
+        posts = read_posts(order_by, reverse)
+        read_posts_count = posts.count()
+        self.assertEqual(read_posts_count, 3)
+        self.assertEqual(test_posts[0].id, posts[0].id)
+        self.assertEqual(posts[0].title, "test_title")
+
     def test_fail_read_posts_without_arg_order_by(self):
         """
         게시글 정렬 조회하는 read_posts service 검증
@@ -126,6 +147,17 @@ class TestService(TestCase):
         with self.assertRaises(TypeError):
             read_posts(reverse)
 
+    def test_fail_read_posts_invalid_order_by(self):
+        """
+        게시글 정렬 조회하는 read_posts, cursor_pagination_posts service 검증
+        case : 없는 정렬 기준이 들어올 경우
+        result : 실패/OFFSET 페이징과 커서 페이징 모두 ValueError 발생
+        """
+        with self.assertRaises(ValueError):
+            read_posts("foo", 1)
+        with self.assertRaises(ValueError):
+            cursor_pagination_posts(Post.objects.all(), "foo", 1, 1, "")
+
     def test_fail_read_posts_without_arg_reverse(self):
         """
         게시글 정렬 조회하는 read_posts service 검증
@@ -173,6 +205,46 @@ class TestService(TestCase):
         with self.assertRaises(TypeError):
             search_posts(posts)
 
+    def test_search_posts_substring(self):
+        """
+        게시글 검색 조회하는 search_posts service 검증
+        case : 검색어가 제목/내용 단어의 중간 부분이거나 대소문자가 다를 경우
+        result : 정상/검색어가 제목이나 내용에 포함된 게시글만 조회
+        """
+        posts = read_posts("created_date", 1)
+        self.assertEqual(search_posts(posts, "tent2").count(), 1)
+        self.assertEqual(search_posts(posts, "TITLE3").count(), 1)
+        self.assertEqual(search_posts(posts, "3").count(), 1)
+        self.assertEqual(search_posts(posts, "not_found").count(), 0)
+
+    def test_search_posts_follows_create_edit_hard_delete(self):
+        """
+        게시글 검색 조회하는 search_posts service 검증
+        case : 게시글을 작성/수정/완전삭제 했을 경우
+        result : 정상/검색 결과에 작성/수정 내용이 바로 반영되고 삭제된 게시글은 빠짐
+        """
+        user = User.objects.get(username="test_user")
+        create_post({"title": "검색용 게시글", "content": "서울 브런치 카페", "tags": ""}, user)
+        post = Post.objects.get(title="검색용 게시글")
+        self.assertEqual(search_posts(read_posts("views", 1), "브런치 카페").count(), 1)
+
+        edit_post({"title": "검색용 게시글", "content": "부산 맛집", "tags": ""}, user, post.id)
+        self.assertEqual(search_posts(read_posts("views", 1), "브런치 카페").count(), 0)
+        self.assertEqual(search_posts(read_posts("views", 1), "부산 맛집").count(), 1)
+
+        hard_delete_post(user, post.id)
+        self.assertEqual(search_posts(read_posts("views", 1), "부산 맛집").count(), 0)
+
+    def test_rebuild_search_index(self):
+        """
+        검색 색인을 다시 만드는 SearchBackend.rebuild 검증
+        case : 정상적으로 작동 했을 경우
+        result : 정상/다시 색인한 뒤에도 같은 검색 결과가 나옴
+        """
+        get_search_backend().rebuild()
+        posts = read_posts("created_date", 1)
+        self.assertEqual(search_posts(posts, "test_content").count(), 3)
+
     def test_filtering_posts(self):
         """
         게시글 해시태그를 필터링하는 filtering_posts service 검증
@@ -216,6 +288,48 @@ class TestService(TestCase):
         with self.assertRaises(TypeError):
             filtering_posts(posts)
 
+    def test_filtering_posts_case_and(self):
+        """
+        게시글 해시태그를 필터링하는 filtering_posts service 검증
+        case : 해시태그를 여러개 입력했을 경우(기본값 and)
+        result : 정상/입력한 해시태그를 모두 가진 게시글만 조회, 해시태그 일부만 같으면 조회안됨
+        """
+        posts = read_posts("created_date", 1)
+        self.assertEqual(filtering_posts(posts, "sns,apple").count(), 2)
+        self.assertEqual(filtering_posts(posts, "sns,apple,choco").count(), 1)
+        self.assertEqual(filtering_posts(posts, "apple,not_exist").count(), 0)
+        self.assertEqual(filtering_posts(posts, "app").count(), 0)
+
+    def test_filtering_posts_case_or(self):
+        """
+        게시글 해시태그를 필터링하는 filtering_posts service 검증
+        case : mode를 or로 입력했을 경우
+        result : 정상/입력한 해시태그 중 하나라도 가진 게시글 조회
+        """
+        posts = read_posts("created_date", 1)
+        self.assertEqual(filtering_posts(posts, "choco,apple", "or").count(), 2)
+        self.assertEqual(filtering_posts(posts, "choco,not_exist", "or").count(), 1)
+
+    def test_filtering_posts_query_budget(self):
+        """
+        게시글 해시태그를 필터링하는 filtering_posts service 검증
+        case : 해시태그를 여러개 입력했을 경우
+        result : 정상/해시태그 수와 상관없이 태그 id 조회 1번 + 게시글 조회 1번
+        """
+        posts = read_posts("created_date", 1)
+        with self.assertNumQueries(2):
+            list(filtering_posts(posts, "sns,apple,choco").values_list("id"))
+
+    def test_fail_filtering_posts_invalid_mode(self):
+        """
+        게시글 해시태그를 필터링하는 filtering_posts service 검증
+        case : mode가 and/or 가 아닐 경우
+        result : 실패/ValueError 발생
+        """
+        posts = read_posts("created_date", 1)
+        with self.assertRaises(ValueError):
+            filtering_posts(posts, "sns", "xor")
+
     def test_pagination_posts(self):
         """
         게시글 페이징하는 pagination_posts service 검증
@@ -236,6 +350,30 @@ class TestService(TestCase):
         self.assertEqual(len(posts), 2)
         self.assertEqual(test_posts[0].title, posts[0]["title"])
 
+    def test_pagination_posts_query_budget(self):
+        """
+        게시글 페이징하는 pagination_posts service 검증
+        case : 해시태그가 여러개인 게시글을 페이지 크기를 바꿔가며 조회할 경우
+        result : 정상/페이지 크기와 상관없이 쿼리 2번(게시글 + 해시태그)으로 조회
+        """
+        user = User.objects.get(username="test_user")
+        tags = TagName.objects.all()
+        for i in range(12):
+            post = Post.objects.create(writer=user, title=f"n+1_{i}", content="n+1")
+            post.tags.add(*tags)
+
+        for page_size in (3, 10):
+            with self.assertNumQueries(2):
+                posts = read_posts("likes", 1)
+                posts = search_posts(posts, "n+1")
+                posts = filtering_posts(posts, "")
+                posts = pagination_posts(posts, page_size, 1)
+            self.assertEqual(len(posts), page_size)
+            self.assertEqual(len(posts[0]["tags"]), 3)
+
+        with self.assertNumQueries(2):
+            cursor_pagination_posts(read_posts("views", 1), "views", 1, 10, "")
+
     def test_fail_pagination_posts_without_arg_posts(self):
         """
         게시글 페이징하는 pagination_posts service 검증
@@ -281,6 +419,126 @@ class TestService(TestCase):
         with self.assertRaises(TypeError):
             pagination_posts(posts, page_size)
 
+    def test_read_posts_by_ids_matches_post_serializer(self):
+        """
+        .values() projection 으로 목록을 만드는 read_posts_by_ids service 검증
+        case : 해시태그가 없거나, 해시태그 id 순서와 연결 순서가 다르거나, 비활성화된 게시글일 경우
+        result : 정상/PostSerializer 로 만든 JSON 과 byte 단위로 같음
+        """
+        user = User.objects.get(username="test_user")
+        post = Post.objects.create(
+            writer=user, title="projection", content="content", is_active=False
+        )
+        PostTag.objects.create(tags=TagName.objects.get(name="choco"), posts=post)
+        PostTag.objects.create(tags=TagName.objects.get(name="sns"), posts=post)
+        Post.objects.create(writer=user, title="no_tags", content="content")
+        post_ids = list(Post.objects.order_by("-id").values_list("id", flat=True))
+
+        posts = read_posts("created_date", 1).in_bulk(post_ids)
+        expected = PostSerializer([posts[i] for i in post_ids], many=True).data
+
+        renderer = JSONRenderer()
+        self.assertEqual(
+            renderer.render(read_posts_by_ids(post_ids)), renderer.render(expected)
+        )
+        self.assertEqual(
+            renderer.render(pagination_posts(read_posts("created_date", 1), 10, 1)),
+            renderer.render(
+                PostSerializer(read_posts("created_date", 1), many=True).data
+            ),
+        )
+
+    def test_read_posts_by_ids_query_budget(self):
+        """
+        .values() projection 으로 목록을 만드는 read_posts_by_ids service 검증
+        case : 없는 게시글 id 가 섞여 있을 경우
+        result : 정상/쿼리 2번(게시글 + 해시태그), post_ids 순서대로 없는 게시글은 제외
+        """
+        post_ids = list(Post.objects.order_by("id").values_list("id", flat=True))
+
+        with self.assertNumQueries(2):
+            posts = read_posts_by_ids([post_ids[2], 404, post_ids[0]])
+        self.assertEqual([post["id"] for post in posts], [post_ids[2], post_ids[0]])
+        self.assertEqual(posts[0]["tags"], ["#sns", "#apple", "#choco"])
+
+    def test_cursor_pagination_posts(self):
+        """
+        게시글을 커서로 페이징하는 cursor_pagination_posts service 검증
+        case : 정상적으로 작동 했을 경우
+        result : 정상/next 커서로 다음 페이지, prev 커서로 이전 페이지를 조회
+        """
+        test_posts = Post.objects.all().order_by("-created_date")
+        reverse = 1
+        order_by = "created_date"
+        posts = read_posts(order_by, reverse)
+        first_page = cursor_pagination_posts(posts, order_by, reverse, 2, "")
+        self.assertEqual(len(first_page["results"]), 2)
+        self.assertEqual(first_page["results"][0]["id"], test_posts[0].id)
+        self.assertIsNone(first_page["prev"])
+
+        second_page = cursor_pagination_posts(
+            posts, order_by, reverse, 2, first_page["next"]
+        )
+        self.assertEqual(len(second_page["results"]), 1)
+        self.assertEqual(second_page["results"][0]["id"], test_posts[2].id)
+        self.assertIsNone(second_page["next"])
+
+        prev_page = cursor_pagination_posts(
+            posts, order_by, reverse, 2, second_page["prev"]
+        )
+        self.assertEqual(prev_page["results"], first_page["results"])
+        self.assertIsNone(prev_page["prev"])
+
+    def test_cursor_pagination_posts_case_likes(self):
+        """
+        게시글을 커서로 페이징하는 cursor_pagination_posts service 검증
+        case : 좋아요수+내림차순으로 정렬했을 경우
+        result : 정상/페이지를 넘겨도 게시글이 중복되거나 빠지지 않음
+        """
+        reverse = 1
+        order_by = "likes"
+        posts = read_posts(order_by, reverse)
+        seen_ids = []
+        cursor = ""
+        while cursor is not None:
+            page = cursor_pagination_posts(posts, order_by, reverse, 1, cursor)
+            seen_ids += [post["id"] for post in page["results"]]
+            cursor = page["next"]
+        self.assertEqual(seen_ids, [post.id for post in read_posts(order_by, reverse)])
+
+    def test_cursor_pagination_posts_case_hot(self):
+        """
+        게시글을 커서로 페이징하는 cursor_pagination_posts service 검증
+        case : hot+내림차순으로 정렬했을 경우
+        result : 정상/페이지를 넘겨도 게시글이 중복되거나 빠지지 않음
+        """
+        recompute_hot_scores()
+        reverse = 1
+        order_by = "hot"
+        posts = read_posts(order_by, reverse)
+        seen_ids = []
+        cursor = ""
+        while cursor is not None:
+            page = cursor_pagination_posts(posts, order_by, reverse, 1, cursor)
+            seen_ids += [post["id"] for post in page["results"]]
+            cursor = page["next"]
+        self.assertEqual(seen_ids, [post.id for post in read_posts(order_by, reverse)])
+
+    def test_fail_cursor_pagination_posts_invalid_cursor(self):
+        """
+        게시글을 커서로 페이징하는 cursor_pagination_posts service 검증
+        case : 손상되었거나 다른 정렬 기준의 커서가 들어올 경우
+        result : 실패/ValueError 발생
+        """
+        posts = read_posts("created_date", 1)
+        first_page = cursor_pagination_posts(posts, "created_date", 1, 1, "")
+        with self.assertRaises(ValueError):
+            cursor_pagination_posts(posts, "created_date", 1, 1, "not-a-cursor")
+        with self.assertRaises(ValueError):
+            cursor_pagination_posts(
+                read_posts("views", 1), "views", 1, 1, first_page["next"]
+            )
+
     def test_create_post(self):
         """
         게시물을 작성하는 create_post service 검증
@@ -297,7 +555,7 @@ class TestService(TestCase):
         with CaptureQueriesContext(connection) as ctx:
             create_post(create_data, user)
         ctx.captured_queries
-        with self.assertNumQueries(14):
+        with self.assertNumQueries(6):
             create_post(create_data, user)
 
     def test_fail_create_post_without_arg_create_data(self):
@@ -763,3 +1021,90 @@ class TestService(TestCase):
         user = User.objects.get(username="test_user")
         with self.assertRaises(Post.DoesNotExist):
             like_post(user, post_id=10000)
+
+    def test_like_post_updates_like_count(self):
+        """
+        게시글 좋아요/좋아요취소 like_post service 검증
+        case : 좋아요 후 좋아요취소를 했을 경우
+        result : 정상/Post.like_count 가 +1 되었다가 다시 원래대로 돌아옴
+        """
+        user = User.objects.get(username="test_user3")
+        post = Post.objects.get(title="test_title", content="test_content")
+        like_post(user, post.id)
+        self.assertEqual(count_likes(post.id), 2)
+        like_post(user, post.id)
+        self.assertEqual(count_likes(post.id), 1)
+
+    def test_reconcile_like_count(self):
+        """
+        좋아요 수를 Like 테이블과 맞추는 reconcile_like_count service 검증
+        case : Post.like_count 가 실제 좋아요 수와 어긋났을 경우
+        result : 정상/어긋난 게시글만 보정되고 hot 점수도 보정된 좋아요 수로 다시 계산됨
+        """
+        post = Post.objects.get(title="test_title", content="test_content")
+        Post.objects.filter(id=post.id).update(like_count=10)
+        self.assertEqual(reconcile_like_count(), 1)
+        self.assertEqual(count_likes(post.id), 1)
+        post = Post.objects.get(id=post.id)
+        self.assertAlmostEqual(
+            post.hot_score,
+            hot_score(post.created_date, post.like_count, post.views),
+            places=6,
+        )
+        self.assertEqual(reconcile_like_count(), 0)
+
+    def test_toggle_like_returns_like_count(self):
+        """
+        게시글 좋아요/좋아요취소 toggle_like service 검증
+        case : 좋아요 후 좋아요취소를 했을 경우
+        result : 정상/좋아요 여부와 바뀐 좋아요 수를 함께 반환
+        """
+        user = User.objects.get(username="test_user3")
+        post = Post.objects.get(title="test_title", content="test_content")
+        self.assertEqual(toggle_like(user, post.id), (True, 2))
+        self.assertEqual(toggle_like(user, post.id), (False, 1))
+        self.assertEqual(Like.objects.filter(user=user, post=post).count(), 0)
+
+    def test_fail_toggle_like_duplicated_like(self):
+        """
+        Like 모델의 (user, post) unique 제약 검증
+        case : 같은 사용자가 같은 게시글에 좋아요를 두번 저장할 경우
+        result : 실패/IntegrityError 발생
+        """
+        user = User.objects.get(username="test_user")
+        post = Post.objects.get(title="test_title", content="test_content")
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Like.objects.create(user=user, post=post)
+
+    def test_toggle_likes(self):
+        """
+        여러 게시글 좋아요/좋아요취소 toggle_likes service 검증
+        case : 같은 게시글이 여러번 포함된 목록을 처리할 경우
+        result : 정상/순서대로 좋아요/좋아요취소가 반영되어 결과를 반환
+        """
+        user = User.objects.get(username="test_user3")
+        post1 = Post.objects.get(title="test_title")
+        post3 = Post.objects.get(title="test_title3")
+        results = toggle_likes(user, [post1.id, post3.id, post1.id])
+        self.assertEqual(
+            results,
+            [
+                {"post_id": post1.id, "liked": True, "like_count": 2},
+                {"post_id": post3.id, "liked": True, "like_count": 2},
+                {"post_id": post1.id, "liked": False, "like_count": 1},
+            ],
+        )
+
+    def test_fail_toggle_likes_the_post_not_exist(self):
+        """
+        여러 게시글 좋아요/좋아요취소 toggle_likes service 검증
+        case : 없는 게시글이 포함되어 있을 경우
+        result : 실패/DoesNotExist 발생, 앞서 처리된 좋아요도 취소됨
+        """
+        user = User.objects.get(username="test_user3")
+        post = Post.objects.get(title="test_title")
+        with self.assertRaises(Post.DoesNotExist):
+            toggle_likes(user, [post.id, 10000])
+        self.assertEqual(count_likes(post.id), 1)
+        self.assertFalse(Like.objects.filter(user=user, post=post).exists())
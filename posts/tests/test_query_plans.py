@@ -0,0 +1,107 @@
+import itertools
+import re
+from unittest import skipUnless
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APITestCase
+
+from posts.models import Like, Post, PostTag, TagName
+from users.models import User
+
+# 색인 없이 테이블 전체를 읽는 SQLite 실행계획 (SCAN 테이블명 / SCAN 테이블명 AS 별칭)
+FULL_SCAN = re.compile(r"^SCAN (\w+)( AS \w+)?$")
+# 색인 순서로 읽지 못하고 정렬을 따로 하는 실행계획
+SORT_STEP = re.compile(r"^USE TEMP B-TREE FOR (RIGHT PART OF )?ORDER BY$")
+
+ORDER_BY_PARAMS = ["created_date", "views", "likes", "hot"]
+REVERSE_PARAMS = ["1", "0"]
+FILTER_PARAMS = [
+    {},
+    {"search": "title"},
+    {"tags": "sns"},
+    {"tags": "sns,apple"},
+    {"tags": "sns,apple", "tags_mode": "or"},
+    {"search": "title", "tags": "sns"},
+]
+
+
+@skipUnless(connection.vendor == "sqlite", "SQLite 실행계획(EXPLAIN QUERY PLAN) 기준")
+class TestQueryPlan(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        tag_data1 = TagName.objects.create(name="sns")
+        tag_data2 = TagName.objects.create(name="apple")
+
+        for i in range(20):
+            post = Post.objects.create(
+                writer=user,
+                title=f"test_title{i}",
+                content=f"test_content{i}",
+                views=i,
+                like_count=i % 3,
+            )
+            PostTag.objects.create(tags=tag_data1, posts=post)
+            if i % 2:
+                PostTag.objects.create(tags=tag_data2, posts=post)
+            if i % 3:
+                Like.objects.create(post=post, user=user)
+
+    def plan_steps(self, queries, pattern):
+        """
+        실행된 쿼리마다 EXPLAIN QUERY PLAN 을 실행하여 pattern 과 맞는 (쿼리, 계획) 목록을 반환
+        """
+        steps = []
+        with connection.cursor() as cursor:
+            for query in queries:
+                if not query["sql"].startswith("SELECT"):
+                    continue
+                cursor.execute("EXPLAIN QUERY PLAN " + query["sql"])
+                for row in cursor.fetchall():
+                    if pattern.match(row[-1]):
+                        steps.append((query["sql"], row[-1]))
+        return steps
+
+    def assert_no_plan_step(self, url, pattern=FULL_SCAN):
+        client = APIClient()
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.plan_steps(ctx.captured_queries, pattern), [], url)
+
+    def test_post_list_plans(self):
+        for order_by, reverse, filters in itertools.product(
+            ORDER_BY_PARAMS, REVERSE_PARAMS, FILTER_PARAMS
+        ):
+            params = {"order_by": order_by, "reverse": reverse, "exact": "1"}
+            params.update(filters)
+            query_string = "&".join(f"{key}={value}" for key, value in params.items())
+            with self.subTest(params=params):
+                self.assert_no_plan_step("/posts?" + query_string)
+                self.assert_no_plan_step("/posts?page=2&page_size=5&" + query_string)
+
+    def test_post_list_cursor_plans(self):
+        client = APIClient()
+        for order_by, reverse, filters in itertools.product(
+            ORDER_BY_PARAMS, REVERSE_PARAMS, FILTER_PARAMS
+        ):
+            params = {"order_by": order_by, "reverse": reverse, "page_size": "5"}
+            params.update(filters)
+            query_string = "&".join(f"{key}={value}" for key, value in params.items())
+            with self.subTest(params=params):
+                first_page = client.get("/posts?cursor=&" + query_string).json()
+                self.assert_no_plan_step("/posts?cursor=&" + query_string)
+                if first_page["next"]:
+                    self.assert_no_plan_step(
+                        f"/posts?cursor={first_page['next']}&" + query_string
+                    )
+
+    def test_post_list_sort_uses_index(self):
+        for order_by, reverse in itertools.product(ORDER_BY_PARAMS, REVERSE_PARAMS):
+            url = f"/posts?order_by={order_by}&reverse={reverse}&page=2&page_size=5"
+            with self.subTest(url=url):
+                self.assert_no_plan_step(url, SORT_STEP)
+                self.assert_no_plan_step(url.replace("page=2", "cursor="), SORT_STEP)
@@ -0,0 +1,146 @@
+import json
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import AsyncClient, TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from posts.models import Post
+from posts.routers import PIN_COOKIE, begin_request, end_request, use_replicas
+from posts.services.cache_services import get_list_cache
+from posts.services.fragment_services import get_fragment_cache
+from posts.services.tag_services import tag_id_cache
+from posts.services.view_services import view_count_buffer
+from users.models import User
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaTestCase(TestCase):
+    """
+    primary(default) 와 별도의 SQLite 메모리 DB 를 replica 로 붙인다.
+    둘 사이에 복제는 없으므로 replica 에서 읽으면 테스트 데이터가 보이지 않는다.
+    test runner 는 settings.DATABASES 에 없는 alias 를 모르므로 replica 는 setUpClass 에서 붙인다.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        connections.settings["replica"] = connections.configure_settings(
+            {
+                DEFAULT_DB_ALIAS: connections.settings[DEFAULT_DB_ALIAS],
+                "replica": {"ENGINE": "django.db.backends.sqlite3", "NAME": ""},
+            }
+        )["replica"]
+        connections["replica"].creation.create_test_db(verbosity=0, serialize=False)
+        cls.databases = {DEFAULT_DB_ALIAS, "replica"}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections["replica"].creation.destroy_test_db("", verbosity=0)
+        del connections["replica"]
+        del connections.settings["replica"]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        cls.post = Post.objects.create(
+            writer=cls.user, title="test_title", content="test_content"
+        )
+
+    def tearDown(self):
+        get_list_cache().clear()
+        get_fragment_cache().clear()
+        tag_id_cache.clear()
+        view_count_buffer.flush()
+
+
+class TestReplicaRouter(ReplicaTestCase):
+    def test_use_replicas(self):
+        """
+        읽기를 replica 로 보내는 use_replicas 검증
+        case : use_replicas 블록 안/밖에서 게시글을 읽을 경우
+        result : 정상/블록 안은 replica(게시글 없음), 밖은 primary 에서 읽음
+        """
+        with use_replicas() as alias:
+            self.assertEqual(alias, "replica")
+            self.assertEqual(Post.objects.count(), 0)
+        self.assertEqual(Post.objects.count(), 1)
+
+        with override_settings(DATABASE_REPLICAS=[]), use_replicas() as alias:
+            self.assertIsNone(alias)
+            self.assertEqual(Post.objects.count(), 1)
+
+    def test_write_pins_request_to_primary(self):
+        """
+        쓰기 후 읽기를 primary 로 고정하는 PrimaryReplicaRouter 검증
+        case : 요청 중 replica 에서 읽다가 쓰기를 할 경우 / primary 에 고정된 요청일 경우
+        result : 정상/쓰기는 primary 로 가고, 이후 읽기는 primary 에서 함, 고정된 요청은 replica 를 쓰지 않음
+        """
+        token = begin_request()
+        with use_replicas():
+            self.assertEqual(Post.objects.count(), 0)
+            Post.objects.filter(id=self.post.id).update(like_count=1)
+            self.assertEqual(Post.objects.get().like_count, 1)
+        self.assertEqual(end_request(token), {"pinned": True, "wrote": True})
+
+        token = begin_request(pinned=True)
+        with use_replicas() as alias:
+            self.assertIsNone(alias)
+        end_request(token)
+
+
+class TestReplicaAPI(ReplicaTestCase):
+    def test_post_list_and_detail_read_replica(self):
+        """
+        게시글 목록/상세 조회 API 의 replica 읽기 검증
+        case : 쓰기 전 조회 / 좋아요(쓰기) 후 다른 client 가 먼저 조회하고 같은 client 로 조회
+        result : 정상/쓰기 전과 다른 client 는 replica(게시글 없음), replica 결과는 캐시되지 않아
+                 쓰기 후에는 pin cookie 로 primary 에서 읽음
+        """
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        other_client = APIClient()
+        other_client.force_authenticate(user=self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(client.get("/posts").data["count"], 0)
+        self.assertEqual(client.get(f"/posts/detail/{self.post.id}").status_code, 404)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.post(f"/posts/{self.post.id}/like")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(other_client.get("/posts").data["count"], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(client.get("/posts").data["count"], 1)
+        response = client.get(f"/posts/detail/{self.post.id}")
+        self.assertEqual(json.loads(response.content)["like_count"], 1)
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+        response = other_client.get(f"/posts/detail/{self.post.id}")
+        self.assertEqual(response.status_code, 404)
+
+    async def test_async_post_list_and_detail_read_replica(self):
+        """
+        게시글 목록/상세 조회 async API 의 replica 읽기 검증
+        case : pin cookie 없이 조회 / pin cookie 를 가지고 조회할 경우
+        result : 정상/cookie 가 없으면 replica(게시글 없음), 있으면 primary 에서 읽음
+        """
+        client = AsyncClient()
+        headers = {"AUTHORIZATION": f"Bearer {AccessToken.for_user(self.user)}"}
+
+        response = await client.get("/posts/async")
+        self.assertEqual(response.json()["count"], 0)
+        response = await client.get(f"/posts/async/detail/{self.post.id}", **headers)
+        self.assertEqual(response.status_code, 404)
+
+        client.cookies[PIN_COOKIE] = "1"
+        response = await client.get("/posts/async")
+        self.assertEqual(response.json()["count"], 1)
+        response = await client.get(f"/posts/async/detail/{self.post.id}", **headers)
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,122 @@
+from django.test import TestCase
+
+from posts.models import Post, PostTag, TagName
+from posts.services.post_services import create_post, edit_post
+from posts.services.tag_services import (get_tag_ids, parse_tags,
+                                         resolve_tag_ids, sync_post_tags,
+                                         tag_id_cache)
+from users.models import User
+
+
+class TestTagService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        tag_data1 = TagName.objects.create(name="sns")
+        tag_data2 = TagName.objects.create(name="apple")
+
+        created_data = Post.objects.create(
+            writer=user, title="test_title", content="test_content"
+        )
+        PostTag.objects.create(tags=tag_data1, posts=created_data)
+        PostTag.objects.create(tags=tag_data2, posts=created_data)
+
+    def tearDown(self):
+        tag_id_cache.clear()
+
+    def post_tag_names(self, post):
+        return set(
+            PostTag.objects.filter(posts=post).values_list("tags__name", flat=True)
+        )
+
+    def test_parse_tags(self):
+        """
+        해시태그 문자열을 나누는 parse_tags service 검증
+        case : 중복되거나 빈 해시태그가 섞여 있을 경우
+        result : 정상/중복과 빈 값을 제거하고 입력 순서대로 반환
+        """
+        self.assertEqual(parse_tags("#맛집,#서울,#,#맛집"), ["맛집", "서울"])
+        self.assertEqual(parse_tags(""), [])
+
+    def test_resolve_tag_ids(self):
+        """
+        해시태그 id를 찾고 없으면 만드는 resolve_tag_ids service 검증
+        case : 있는 해시태그와 없는 해시태그가 섞여 있을 경우
+        result : 정상/없는 해시태그만 생성하고 모든 이름의 id를 반환
+        """
+        tag_ids = resolve_tag_ids(["sns", "new_tag"])
+
+        self.assertEqual(TagName.objects.filter(name="new_tag").count(), 1)
+        self.assertEqual(tag_ids["sns"], TagName.objects.get(name="sns").id)
+        self.assertEqual(tag_ids["new_tag"], TagName.objects.get(name="new_tag").id)
+
+    def test_get_tag_ids_cache_hit(self):
+        """
+        해시태그 id를 찾는 get_tag_ids service 검증
+        case : 커밋 이후 같은 해시태그를 다시 찾을 경우
+        result : 정상/캐시된 id를 사용하여 쿼리 없이 반환
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            tag_ids = get_tag_ids(["sns", "apple"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_tag_ids(["sns", "apple"]), tag_ids)
+
+    def test_create_post_query_count_independent_of_tags(self):
+        """
+        게시물을 작성하는 create_post service 검증
+        case : 새 해시태그가 1개일 때와 12개일 때
+        result : 정상/해시태그 수와 관계없이 쿼리수가 같음
+        """
+        user = User.objects.get(username="test_user")
+        one_tag = {"title": "one", "content": "content", "tags": "#one"}
+        many_tags = {
+            "title": "many",
+            "content": "content",
+            "tags": ",".join(f"#many{i}" for i in range(12)),
+        }
+
+        with self.assertNumQueries(8):
+            create_post(one_tag, user)
+        with self.assertNumQueries(8):
+            create_post(many_tags, user)
+        self.assertEqual(len(self.post_tag_names(Post.objects.get(title="many"))), 12)
+
+    def test_edit_post_removes_stale_tags(self):
+        """
+        게시물을 수정하는 edit_post service 검증
+        case : 기존 해시태그 일부를 빼고 새 해시태그를 넣었을 경우
+        result : 정상/빠진 해시태그는 삭제되고 새 해시태그만 추가
+        """
+        user = User.objects.get(username="test_user")
+        post = Post.objects.get(title="test_title")
+
+        edit_post({"tags": "#sns,#brunch"}, user, post.id)
+
+        self.assertEqual(self.post_tag_names(post), {"sns", "brunch"})
+
+    def test_edit_post_without_tags(self):
+        """
+        게시물을 수정하는 edit_post service 검증
+        case : tags 없이 제목만 수정할 경우
+        result : 정상/기존 해시태그를 그대로 유지
+        """
+        user = User.objects.get(username="test_user")
+        post = Post.objects.get(title="test_title")
+
+        edit_post({"title": "edited"}, user, post.id)
+
+        self.assertEqual(self.post_tag_names(post), {"sns", "apple"})
+
+    def test_sync_post_tags_unchanged(self):
+        """
+        게시글 해시태그를 맞추는 sync_post_tags service 검증
+        case : 해시태그가 바뀌지 않았을 경우
+        result : 정상/조회 1번만 하고 바뀐 해시태그 없음
+        """
+        post = Post.objects.get(title="test_title")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(sync_post_tags(post.id, ["apple", "sns"]), [])
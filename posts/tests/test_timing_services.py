@@ -0,0 +1,143 @@
+import json
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from posts.models import Post
+from posts.services.cache_services import get_list_cache
+from posts.services.fragment_services import get_fragment_cache
+from posts.services.timing_services import (begin_timings, end_timings,
+                                            install_query_timer, percentile,
+                                            record_query, timed)
+from posts.services.view_services import view_count_buffer
+from users.models import User
+
+SERVER_TIMING_ON = {"ENABLED": True, "LOG": True}
+
+
+class TestTimingService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        for i in range(3):
+            Post.objects.create(
+                writer=user, title=f"test_title{i}", content=f"test_content{i}"
+            )
+
+    def tearDown(self):
+        get_list_cache().clear()
+        get_fragment_cache().clear()
+        view_count_buffer.flush()
+
+    def test_timed(self):
+        """
+        단계 시간을 재는 timed service 검증
+        case : 측정 중인 요청이 없을 때 / 있을 때 같은 단계를 2번 잴 경우 / decorator 로 사용할 경우
+        result : 정상/요청이 없으면 아무것도 모으지 않고, 있으면 같은 단계는 시간을 더함
+        """
+        with timed("read"):
+            pass
+
+        timings, token = begin_timings()
+        try:
+            for _ in range(2):
+                with timed("read"):
+                    pass
+            timed("service")(lambda: None)()
+        finally:
+            end_timings(token)
+
+        self.assertEqual(list(timings.stages), ["read", "service"])
+        header = timings.as_header(1.5)
+        self.assertTrue(header.startswith('sql;dur=0.00;desc="0 queries", read;dur='))
+        self.assertTrue(header.endswith("total;dur=1.50"))
+
+    def test_record_query(self):
+        """
+        SQL 쿼리 수/시간을 모으는 record_query service 검증
+        case : Server-Timing/metric 이 꺼져 있을 때 / 켜져 있을 때 연결에 넣고 쿼리를 실행할 경우
+        result : 정상/꺼져 있으면 연결에 넣지 않고, 켜져 있으면 1번만 넣고 쿼리 수를 셈
+        """
+        if record_query in connection.execute_wrappers:
+            connection.execute_wrappers.remove(record_query)
+        with override_settings(POSTS_METRICS={"ENABLED": False}):
+            install_query_timer(None, connection)
+        self.assertNotIn(record_query, connection.execute_wrappers)
+
+        with override_settings(POSTS_SERVER_TIMING=SERVER_TIMING_ON):
+            install_query_timer(None, connection)
+            install_query_timer(None, connection)
+        self.assertEqual(connection.execute_wrappers.count(record_query), 1)
+
+        timings, token = begin_timings()
+        try:
+            list(Post.objects.all())
+            Post.objects.count()
+        finally:
+            end_timings(token)
+        self.assertEqual(timings.sql_count, 2)
+        self.assertGreater(timings.sql_time, 0)
+
+    def test_percentile(self):
+        """
+        벤치마크 백분위 percentile 검증
+        case : 측정값 100개 / 측정값이 없을 경우
+        result : 정상/nearest-rank 백분위, 측정값이 없으면 0
+        """
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 99), 0.0)
+
+    @override_settings(POSTS_SERVER_TIMING=SERVER_TIMING_ON)
+    def test_server_timing_middleware(self):
+        """
+        Server-Timing 헤더와 JSON 로그를 남기는 server_timing_middleware 검증
+        case : 게시글 목록/상세를 조회할 경우
+        result : 정상/SQL, 목록 단계(read, search, filter, paginate), serialize, render, total 시간과 같은 값의 로그
+        """
+        client = APIClient()
+        with self.assertLogs("posts.middleware", "INFO") as logs:
+            response = client.get("/posts?search=title")
+
+        metrics = [
+            metric.split(";")[0] for metric in response["Server-Timing"].split(", ")
+        ]
+        for name in [
+            "sql",
+            "read",
+            "search",
+            "filter",
+            "paginate",
+            "count",
+            "versions",
+            "fragments",
+            "serialize",
+            "service",
+            "render",
+            "total",
+        ]:
+            self.assertIn(name, metrics)
+        line = json.loads(logs.records[0].getMessage())
+        self.assertEqual(line["path"], "/posts")
+        self.assertEqual(line["status"], 200)
+        self.assertGreater(line["sql_count"], 0)
+
+        client.force_authenticate(user=User.objects.get())
+        with self.assertLogs("posts.middleware", "INFO"):
+            response = client.get(f"/posts/detail/{Post.objects.first().id}")
+        self.assertIn("render;dur=", response["Server-Timing"])
+
+    def test_server_timing_middleware_disabled(self):
+        """
+        Server-Timing 이 꺼져 있을 때 server_timing_middleware 검증
+        case : 게시글 목록을 조회할 경우
+        result : 정상/Server-Timing 헤더 없음
+        """
+        response = APIClient().get("/posts")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Server-Timing", response)
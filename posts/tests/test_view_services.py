@@ -0,0 +1,71 @@
+from django.test import TestCase
+
+from posts.models import Post
+from posts.services.post_services import read_detail_post
+from posts.services.view_services import ViewCountBuffer, view_count_buffer
+from users.models import User
+
+
+class TestViewService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            username="test_user", email="test_email@naver.com", password="test_pw"
+        )
+        Post.objects.create(writer=user, title="test_title", content="test_content")
+        Post.objects.create(writer=user, title="test_title2", content="test_content2")
+        Post.objects.create(writer=user, title="test_title3", content="test_content3")
+
+    def tearDown(self):
+        view_count_buffer.flush()
+
+    def test_flush_groups_posts_by_increment(self):
+        """
+        조회수 버퍼 ViewCountBuffer.flush 검증
+        case : 게시글마다 쌓인 조회수가 다를 경우
+        result : 정상/증가분이 같은 게시글끼리 묶어 UPDATE 하고 버퍼가 비워짐
+        """
+        post1, post2, post3 = Post.objects.order_by("id")
+        buffer = ViewCountBuffer(flush_interval=60, batch_size=100)
+        buffer.add(post1.id)
+        buffer.add(post2.id)
+        buffer.add(post3.id, 3)
+        self.assertEqual(buffer.stats()["pending_views"], 5)
+
+        with self.assertNumQueries(2):
+            self.assertEqual(buffer.flush(), 5)
+        self.assertEqual(Post.objects.get(id=post1.id).views, 1)
+        self.assertEqual(Post.objects.get(id=post3.id).views, 3)
+        self.assertEqual(buffer.stats()["pending_posts"], 0)
+        self.assertEqual(buffer.stats()["flushed_views"], 5)
+
+    def test_flush_if_due(self):
+        """
+        조회수 버퍼 ViewCountBuffer.flush_if_due 검증
+        case : 쌓인 게시글 수가 batch_size 에 도달했을 경우
+        result : 정상/도달하기 전에는 반영하지 않고, 도달하면 반영
+        """
+        post1, post2 = Post.objects.order_by("id")[:2]
+        buffer = ViewCountBuffer(flush_interval=60, batch_size=2)
+        buffer.add(post1.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(buffer.flush_if_due(), 0)
+        buffer.add(post2.id)
+        self.assertEqual(buffer.flush_if_due(), 2)
+
+    def test_read_detail_post_buffers_views(self):
+        """
+        게시글 상세 조회 read_detail_post service 검증
+        case : 상세 조회를 여러번 했을 경우
+        result : 정상/응답의 조회수는 바로 늘어나고, 수정시간은 바뀌지 않으며 flush 후 DB에 반영
+        """
+        post = Post.objects.get(title="test_title")
+        view_count_buffer.flush()
+        first_views = read_detail_post(post.id)["views"]
+        second_views = read_detail_post(post.id)["views"]
+        self.assertEqual(first_views + 1, second_views)
+
+        view_count_buffer.flush()
+        flushed_post = Post.objects.get(id=post.id)
+        self.assertEqual(flushed_post.views, second_views)
+        self.assertEqual(flushed_post.updated_date, post.updated_date)
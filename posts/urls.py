@@ -4,6 +4,12 @@ from posts import views
 
 urlpatterns = [
     path("", views.PostView.as_view()),
+    path("/bulk", views.PostBulkView.as_view()),
+    path("/export", views.PostExportView.as_view()),
+    path("/likes/batch", views.LikeBatchView.as_view()),
+    path("/async", views.AsyncPostView.as_view()),
+    path("/async/detail/<post_id>", views.AsyncPostDetailView.as_view()),
+    path("/async/<post_id>/like", views.AsyncLikeView.as_view()),
     path("/<post_id>", views.PostView.as_view()),
     path("/<post_id>/existence", views.ExistencePostView.as_view()),
     path("/detail/<post_id>", views.PostDetailView.as_view()),
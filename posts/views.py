@@ -1,14 +1,54 @@
+import math
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import exceptions, status
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from posts.models import Like, Post
-from posts.services.post_services import (create_post, edit_post,
-                                          filtering_posts, hard_delete_post,
-                                          like_post, pagination_posts,
-                                          read_detail_post, read_posts,
-                                          recover_post, search_posts,
-                                          soft_delete_post)
+from posts.models import Post
+from posts.renderers import PostFragmentJSONRenderer
+from posts.routers import replica_reads, use_replicas
+from posts.services.cache_services import (aget_or_set_post_count,
+                                           aget_or_set_post_list,
+                                           get_or_set_post_count,
+                                           get_or_set_post_list)
+from posts.services.conditional_services import (get_not_modified_response,
+                                                 post_detail_validators,
+                                                 post_list_validators,
+                                                 set_validator_headers)
+from posts.services.export_services import (EXPORT_FORMATS, export_posts,
+                                            parse_is_active, parse_since)
+from posts.services.ingest_services import (get_ingest_options, ingest_posts,
+                                            iter_ndjson_lines)
+from posts.services.metrics_services import (collect_metrics,
+                                             get_metrics_options,
+                                             render_metrics)
+from posts.services.post_services import (acount_post_view,
+                                          acursor_pagination_posts,
+                                          afiltering_posts,
+                                          apagination_post_ids,
+                                          aread_detail_post,
+                                          aread_detail_version,
+                                          aread_post_versions,
+                                          arender_posts_by_ids, asearch_posts,
+                                          atoggle_like, count_post_view,
+                                          create_post, cursor_pagination_posts,
+                                          edit_post, filtering_posts,
+                                          hard_delete_post,
+                                          pagination_post_ids,
+                                          read_detail_version,
+                                          read_post_versions, read_posts,
+                                          recover_post, render_detail_post,
+                                          render_posts_by_ids, search_posts,
+                                          soft_delete_post, toggle_like,
+                                          toggle_likes)
+from posts.services.timing_services import timed
 
 
 class PostView(APIView):
@@ -19,24 +59,88 @@ class PostView(APIView):
     delete : 게시글 비활성화(soft_delete)
     """
 
+    renderer_classes = [PostFragmentJSONRenderer, BrowsableAPIRenderer]
+
+    @replica_reads
+    @timed("service")
     def get(self, request):
         order_by = self.request.query_params.get("order_by", "created_date")
-        reverse = int(self.request.query_params.get("reverse", 1))
         search = self.request.query_params.get("search", "")
         tags = self.request.query_params.get("tags", "")
-        page_size = int(self.request.query_params.get("page_size", 10))
-        page = int(self.request.query_params.get("page", 1))
+        tags_mode = self.request.query_params.get("tags_mode", "and")
+        cursor = self.request.query_params.get("cursor")
+        exact = self.request.query_params.get("exact") == "1"
+
+        def load_posts():
+            with timed("read"):
+                posts = read_posts(order_by, reverse)
+            with timed("search"):
+                posts = search_posts(posts, search)
+            with timed("filter"):
+                posts = filtering_posts(posts, tags, tags_mode)
+            return posts
 
         try:
-            posts = read_posts(order_by, reverse)
-            posts = search_posts(posts, search)
-            posts = filtering_posts(posts, tags)
-            posts = pagination_posts(posts, page_size, page)
-            return Response(posts, status=status.HTTP_200_OK)
+            reverse = int(self.request.query_params.get("reverse", 1))
+            page_size = int(self.request.query_params.get("page_size", 10))
+            page = int(self.request.query_params.get("page", 1))
+            if page_size < 1 or page < 1:
+                raise ValueError("page_size and page must be positive")
+            if cursor is not None:
+                posts = load_posts()
+                with timed("paginate"):
+                    posts = cursor_pagination_posts(
+                        posts, order_by, reverse, page_size, cursor
+                    )
+                return Response(posts, status=status.HTTP_200_OK)
+            params = {
+                "order_by": order_by,
+                "reverse": reverse,
+                "search": search,
+                "tags": tags,
+                "tags_mode": tags_mode,
+                "page_size": page_size,
+                "page": page,
+            }
+            with timed("paginate"):
+                post_page = get_or_set_post_list(
+                    params, lambda: pagination_post_ids(load_posts(), page_size, page)
+                )
+            with timed("count"):
+                count = get_or_set_post_count(
+                    params, lambda: load_posts().count(), exact=exact
+                )
+            with timed("versions"):
+                versions = read_post_versions(post_page["post_ids"])
+            etag = post_list_validators(
+                params,
+                count,
+                post_page["has_next"],
+                post_page["post_ids"],
+                versions,
+                request.accepted_media_type,
+            )
+            not_modified = get_not_modified_response(request, etag, None)
+            if not_modified is not None:
+                return not_modified
+            with timed("fragments"):
+                results = render_posts_by_ids(post_page["post_ids"], versions)
+            posts = {
+                "count": count,
+                "num_pages": math.ceil(count / page_size),
+                "has_next": post_page["has_next"],
+                "results": results,
+            }
+            response = Response(posts, status=status.HTTP_200_OK)
+            return set_validator_headers(response, etag, None)
         except TypeError:
             return Response(
                 {"detail": "로그인상태나 작성내용을 확인해주세요"}, status=status.HTTP_400_BAD_REQUEST
             )
+        except ValueError:
+            return Response(
+                {"detail": "조회 조건을 확인해주세요"}, status=status.HTTP_400_BAD_REQUEST
+            )
 
     def post(self, request):
         if request.user.is_anonymous:
@@ -94,6 +198,65 @@ class PostView(APIView):
             )
 
 
+class PostBulkView(APIView):
+    """
+    post : NDJSON(한 줄에 게시글 1개) 본문을 스트리밍으로 읽어 게시글 대량 작성
+    """
+
+    def post(self, request):
+        if request.user.is_anonymous:
+            return Response(
+                {"detail": "로그인을 해주세요"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+        options = get_ingest_options()
+        stream = request.stream
+        if stream is None:
+            return Response(
+                {"detail": "작성할 게시글이 없습니다"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        result = ingest_posts(
+            iter_ndjson_lines(stream, options["MAX_LINE_SIZE"]),
+            request.user,
+            chunk_size=options["CHUNK_SIZE"],
+            max_errors=options["MAX_ERRORS"],
+        )
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class PostExportView(APIView):
+    """
+    get : 게시글 전체를 NDJSON/CSV 로 스트리밍 내보내기 (관리자)
+    """
+
+    def get(self, request):
+        if request.user.is_anonymous:
+            return Response(
+                {"detail": "로그인을 해주세요"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+        if not request.user.is_staff:
+            return Response({"detail": "권한이 없습니다"}, status=status.HTTP_403_FORBIDDEN)
+        export_format = self.request.query_params.get("export_format", "ndjson")
+        since = self.request.query_params.get("since")
+        is_active = self.request.query_params.get("is_active")
+        try:
+            lines = export_posts(
+                export_format,
+                since=parse_since(since) if since else None,
+                is_active=parse_is_active(is_active) if is_active else None,
+            )
+        except ValueError:
+            return Response(
+                {"detail": "내보내기 조건을 확인해주세요"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        response = StreamingHttpResponse(
+            lines, content_type=EXPORT_FORMATS[export_format][0]
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="posts.{export_format}"'
+        return response
+
+
 class ExistencePostView(APIView):
     """
     post : 비활성화된 게시글 복구
@@ -140,14 +303,27 @@ class PostDetailView(APIView):
     get : 게시글 상세 조회
     """
 
+    renderer_classes = [PostFragmentJSONRenderer, BrowsableAPIRenderer]
+
+    @replica_reads
+    @timed("service")
     def get(self, request, post_id):
         if request.user.is_anonymous:
             return Response(
                 {"detail": "로그인을 해주세요"}, status=status.HTTP_401_UNAUTHORIZED
             )
         try:
-            post = read_detail_post(post_id)
-            return Response(post, status=status.HTTP_200_OK)
+            version = read_detail_version(post_id)
+            etag, last_modified = post_detail_validators(
+                version, request.accepted_media_type
+            )
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                count_post_view(version[0])
+                return not_modified
+            post = render_detail_post(post_id, version)
+            response = Response(post, status=status.HTTP_200_OK)
+            return set_validator_headers(response, etag, last_modified)
         except TypeError:
             return Response(
                 {"detail": "로그인상태나 게시글을 확인해주세요"}, status=status.HTTP_400_BAD_REQUEST
@@ -169,13 +345,12 @@ class LikeView(APIView):
                 {"detail": "로그인을 해주세요"}, status=status.HTTP_401_UNAUTHORIZED
             )
         try:
-            if like_post(request.user, post_id):
-                like_count = Like.objects.filter(post=post_id).count()
+            liked, like_count = toggle_like(request.user, post_id)
+            if liked:
                 return Response(
                     {"detail": "좋아요 했습니다", "like_count": like_count},
                     status=status.HTTP_200_OK,
                 )
-            like_count = Like.objects.filter(post=post_id).count()
             return Response(
                 {"detail": "좋아요를 취소했습니다", "like_count": like_count},
                 status=status.HTTP_200_OK,
@@ -188,3 +363,199 @@ class LikeView(APIView):
             return Response(
                 {"detail": "존재하지 않는 게시글입니다"}, status=status.HTTP_404_NOT_FOUND
             )
+
+
+class LikeBatchView(APIView):
+    """
+    post : 여러 게시글 좋아요/좋아요취소를 한 트랜잭션으로 처리 + 게시글별 좋아요 수
+    """
+
+    max_batch_size = 100
+
+    def post(self, request):
+        if request.user.is_anonymous:
+            return Response(
+                {"detail": "로그인을 해주세요"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+        post_ids = request.data.get("post_ids")
+        if (
+            not isinstance(post_ids, list)
+            or not 0 < len(post_ids) <= self.max_batch_size
+            # JSON 의 true/false 는 bool(int 의 subclass) 이므로 게시글 id 로 받지 않는다
+            or not all(type(post_id) is int for post_id in post_ids)
+        ):
+            return Response(
+                {"detail": "좋아요 목록을 확인해주세요"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            results = toggle_likes(request.user, post_ids)
+            return Response({"results": results}, status=status.HTTP_200_OK)
+        except Post.DoesNotExist:
+            return Response(
+                {"detail": "존재하지 않는 게시글입니다"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+
+def _json_response(data, status_code: int) -> HttpResponse:
+    return HttpResponse(
+        PostFragmentJSONRenderer().render(data),
+        status=status_code,
+        content_type="application/json",
+    )
+
+
+async def _aauthenticate(request):
+    # JWT 검증 후 사용자 조회는 sync ORM 이므로 thread 에서 실행한다
+    try:
+        user_auth = await sync_to_async(JWTAuthentication().authenticate)(request)
+    except exceptions.AuthenticationFailed:
+        return None
+    return user_auth[0] if user_auth else None
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncPostView(View):
+    """
+    get : 게시글 목록 조회 (ASGI 용 async view, 응답은 PostView 와 같음)
+    """
+
+    @replica_reads
+    async def get(self, request):
+        order_by = request.GET.get("order_by", "created_date")
+        search = request.GET.get("search", "")
+        tags = request.GET.get("tags", "")
+        tags_mode = request.GET.get("tags_mode", "and")
+        cursor = request.GET.get("cursor")
+        exact = request.GET.get("exact") == "1"
+
+        async def load_posts():
+            posts = read_posts(order_by, reverse)
+            posts = await asearch_posts(posts, search)
+            posts = await afiltering_posts(posts, tags, tags_mode)
+            return posts
+
+        try:
+            reverse = int(request.GET.get("reverse", 1))
+            page_size = int(request.GET.get("page_size", 10))
+            page = int(request.GET.get("page", 1))
+            if page_size < 1 or page < 1:
+                raise ValueError("page_size and page must be positive")
+            if cursor is not None:
+                posts = await acursor_pagination_posts(
+                    await load_posts(), order_by, reverse, page_size, cursor
+                )
+                return _json_response(posts, status.HTTP_200_OK)
+            params = {
+                "order_by": order_by,
+                "reverse": reverse,
+                "search": search,
+                "tags": tags,
+                "tags_mode": tags_mode,
+                "page_size": page_size,
+                "page": page,
+            }
+
+            async def load_page():
+                return await apagination_post_ids(await load_posts(), page_size, page)
+
+            post_page = await aget_or_set_post_list(params, load_page)
+            count = await aget_or_set_post_count(params, load_posts, exact)
+            versions = await aread_post_versions(post_page["post_ids"])
+            etag = post_list_validators(
+                params,
+                count,
+                post_page["has_next"],
+                post_page["post_ids"],
+                versions,
+                "application/json",
+            )
+            not_modified = get_not_modified_response(request, etag, None)
+            if not_modified is not None:
+                return not_modified
+            posts = {
+                "count": count,
+                "num_pages": math.ceil(count / page_size),
+                "has_next": post_page["has_next"],
+                "results": await arender_posts_by_ids(post_page["post_ids"], versions),
+            }
+            response = _json_response(posts, status.HTTP_200_OK)
+            return set_validator_headers(response, etag, None)
+        except TypeError:
+            return _json_response(
+                {"detail": "로그인상태나 작성내용을 확인해주세요"}, status.HTTP_400_BAD_REQUEST
+            )
+        except ValueError:
+            return _json_response(
+                {"detail": "조회 조건을 확인해주세요"}, status.HTTP_400_BAD_REQUEST
+            )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncPostDetailView(View):
+    """
+    get : 게시글 상세 조회 (ASGI 용 async view, 응답은 PostDetailView 와 같음)
+    """
+
+    async def get(self, request, post_id):
+        user = await _aauthenticate(request)
+        if user is None:
+            return _json_response({"detail": "로그인을 해주세요"}, status.HTTP_401_UNAUTHORIZED)
+        # 인증(사용자 조회)은 PostDetailView 처럼 primary 에서 하고 게시글만 replica 에서 읽는다
+        with use_replicas():
+            try:
+                version = await aread_detail_version(post_id)
+                etag, last_modified = post_detail_validators(
+                    version, "application/json"
+                )
+                not_modified = get_not_modified_response(request, etag, last_modified)
+                if not_modified is not None:
+                    await acount_post_view(version[0])
+                    return not_modified
+                post = await aread_detail_post(post_id, version)
+                response = _json_response(post, status.HTTP_200_OK)
+                return set_validator_headers(response, etag, last_modified)
+            except Post.DoesNotExist:
+                return _json_response(
+                    {"detail": "존재하지 않는 게시글입니다"}, status.HTTP_404_NOT_FOUND
+                )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncLikeView(View):
+    """
+    post : 게시글 좋아요/좋아요취소 + 좋아요 수 카운트 (ASGI 용 async view, 응답은 LikeView 와 같음)
+    """
+
+    async def post(self, request, post_id):
+        user = await _aauthenticate(request)
+        if user is None:
+            return _json_response({"detail": "로그인을 해주세요"}, status.HTTP_401_UNAUTHORIZED)
+        try:
+            liked, like_count = await atoggle_like(user, post_id)
+            if liked:
+                return _json_response(
+                    {"detail": "좋아요 했습니다", "like_count": like_count},
+                    status.HTTP_200_OK,
+                )
+            return _json_response(
+                {"detail": "좋아요를 취소했습니다", "like_count": like_count},
+                status.HTTP_200_OK,
+            )
+        except Post.DoesNotExist:
+            return _json_response(
+                {"detail": "존재하지 않는 게시글입니다"}, status.HTTP_404_NOT_FOUND
+            )
+
+
+class MetricsView(View):
+    """
+    get : 모든 worker 의 metric 파일을 더한 Prometheus text format (nginx 에서 내부망만 허용)
+    """
+
+    def get(self, request):
+        if not get_metrics_options()["ENABLED"]:
+            raise Http404
+        return HttpResponse(
+            render_metrics(collect_metrics()),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
@@ -2,10 +2,11 @@ import json
 
 from rest_framework.test import APIClient, APITestCase
 
+from posts.tests.mixins import PerfBaselineMixin
 from users.models import User
 
 
-class TestUserViewAPI(APITestCase):
+class TestUserViewAPI(PerfBaselineMixin, APITestCase):
     @classmethod
     def setUpTestData(cls):
         existed_user_data1 = User.objects.create(